@@ -1,27 +1,28 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify
+from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, Response, stream_with_context
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
-from flask import send_from_directory
+from flask import send_from_directory, send_file
 import os
 import hashlib
 import sqlite3
+import tempfile
 from datetime import datetime
 from werkzeug.utils import secure_filename
+from markupsafe import Markup, escape
 import json
 from resume_parser import ResumeParser
 from criteria_evaluator import CriteriaEvaluator
-from models import init_db, User, get_user_by_username, create_user
+from models import init_db, User, get_user_by_username, create_user, get_job, count_candidates, get_candidates, iter_candidates, search_candidates, get_duplicate_groups, get_upload_file
+from job_queue import JobQueue
+from results_export import EXPORT_COLUMNS, export_row
+import archives
+import upload_store
+import model_registry
+import metrics
 import config
 
 app = Flask(__name__)
 app.config.from_object(config.Config)
 
-# Ensure required directories exist
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-os.makedirs('database', exist_ok=True)
-
-# Initialize database
-init_db()
-
 # Initialize Flask-Login
 login_manager = LoginManager()
 login_manager.init_app(app)
@@ -29,9 +30,20 @@ login_manager.login_view = 'login'
 login_manager.login_message = 'Please log in to access this page.'
 login_manager.login_message_category = 'info'
 
-# Initialize parsers
-resume_parser = ResumeParser()
-criteria_evaluator = CriteriaEvaluator()
+# Under `python app.py`, spawned extraction workers re-import this script as
+# __mp_main__ (see extraction_pool); they need none of the app's state
+if __name__ != '__mp_main__':
+    # Ensure required directories exist
+    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+    os.makedirs('database', exist_ok=True)
+
+    # Initialize database
+    init_db()
+
+    # Initialize parsers (the BERT model itself is loaded lazily by model_registry)
+    resume_parser = ResumeParser()
+    criteria_evaluator = CriteriaEvaluator()
+    job_queue = JobQueue(resume_parser, criteria_evaluator)
 
 @login_manager.user_loader
 def load_user(user_id):
@@ -89,177 +101,413 @@ def upload_files():
 
         if not uploaded_files or len(uploaded_files) == 0:
             flash('No files selected. Please choose at least one resume file.', 'error')
-            print("DEBUG: No files selected in upload form.")  # Log to console
+            if app.config['LOG_LEVEL'] == 'DEBUG':
+                print("DEBUG: No files selected in upload form.")  # Log to console
             return redirect(request.url)
 
-        if len(uploaded_files) > 10:
-            flash('Maximum 10 files allowed per batch. Please reduce the number of files.', 'error')
-            print(f"DEBUG: Too many files selected ({len(uploaded_files)}).")  # Log to console
+        max_files = app.config['MAX_FILES_PER_BATCH']
+        if len(uploaded_files) > max_files:
+            flash(f'Maximum {max_files} files allowed per batch. Please reduce the number of files.', 'error')
+            if app.config['LOG_LEVEL'] == 'DEBUG':
+                print(f"DEBUG: Too many files selected ({len(uploaded_files)}).")  # Log to console
             return redirect(request.url)
 
-        results = []
-        processed_files = 0
-        error_files = []
+        saved_files = []
+        rejected_files = []
+        archive_files = []
+        # Archive members must not be extracted over the batch's other files
+        taken_names = {secure_filename(file.filename) for file in uploaded_files if file and file.filename}
 
         for file in uploaded_files:
             if file and file.filename:
                 filename = secure_filename(file.filename)
-                if filename.lower().endswith(('.pdf', '.docx')):
+                if archives.is_archive(filename):
+                    archive_path, members, rejected = save_archive(file, filename, taken_names)
+                    if archive_path:
+                        archive_files.append((archive_path, members))
+                        taken_names.update(member_name for _, member_name in members)
+                    rejected_files.extend(rejected)
+                elif filename.lower().endswith(('.pdf', '.docx')):
                     try:
-                        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                        file.save(file_path)
-
-                        # Parse resume
-                        parsed_resume = resume_parser.parse_resume(file_path)
-                        print(f"DEBUG: Parsed resume for {filename}: {parsed_resume}")  # Log parsed result
-
-                        if 'error' not in parsed_resume:
-                            # Evaluate criteria
-                            classification = criteria_evaluator.classify_candidate(
-                                parsed_resume, course_type, internship_type
-                            )
-                            classification['bert_confidence'] = parsed_resume.get('bert_confidence')  # Add BERT confidence
-                            classification['upload_time'] = datetime.now().isoformat()
-                            results.append(classification)
-                            processed_files += 1
-                        else:
-                            error_files.append(f"{filename}: {parsed_resume['error']}")
-                            print(f"ERROR: Resume parsing error for {filename}: {parsed_resume['error']}")  # Log error
-
-                        # Clean up uploaded file
-                        # if os.path.exists(file_path):
-                        #     os.remove(file_path)
-                        # Keep uploaded files for viewing later
-                            print(f"File saved for viewing: {file_path}")
-
+                        # Parsed from memory; the job keeps the original for viewing (see upload_store)
+                        saved_files.append((filename, file.read()))
+                        if app.config['LOG_LEVEL'] == 'DEBUG':
+                            print(f"File received: {filename}")
                     except Exception as e:
-                        error_files.append(f"{filename}: Processing error - {str(e)}")
-                        print(f"ERROR: Exception processing {filename}: {str(e)}")  # Log exception
+                        rejected_files.append((filename, f"Processing error - {str(e)}"))
+                        print(f"ERROR: Exception reading {filename}: {str(e)}")  # Log exception
                 else:
-                    error_files.append(f"{filename}: Unsupported file format (only PDF and DOCX allowed)")
+                    rejected_files.append((filename, "Unsupported file format (only PDF, DOCX, ZIP and TAR.GZ allowed)"))
                     print(f"ERROR: Unsupported file format for {filename}")  # Log error
 
-        # Store results in session for display
-        session['results'] = results
-        session['processing_summary'] = {
-            'total_files': len(uploaded_files),
-            'processed_files': processed_files,
-            'error_files': error_files,
-            'course_type': course_type,
-            'internship_type': internship_type,
-            'processed_time': datetime.now().isoformat()
-        }
-
-        if processed_files > 0:
-            flash(f'Successfully processed {processed_files} resume(s).', 'success')
-        if error_files:
-            flash(f'Errors encountered with {len(error_files)} file(s). Check results for details.', 'warning')
-            print(f"ERROR: Files with errors: {error_files}")  # Log all errors
+        # Parsing and classification run in the background; the session only keeps the job id
+        job_id = job_queue.submit(current_user.id, saved_files, rejected_files, course_type, internship_type,
+                                  archive_files)
+        session['job_id'] = job_id
+
+        total_resumes = len(saved_files) + sum(len(members) for _, members in archive_files)
+        flash(f'Processing {total_resumes} resume(s) in the background.', 'info')
+        if rejected_files:
+            flash(f'{len(rejected_files)} file(s) could not be accepted. Check results for details.', 'warning')
+
+        return redirect(url_for('job_progress', job_id=job_id))
+
+    return render_template('upload.html', max_files=app.config['MAX_FILES_PER_BATCH'])
+
+def save_archive(file, filename, taken):
+    """Save an uploaded archive for its job and choose the members to process
+
+    Returns (archive_path, members, rejected) as for archives.accept_members;
+    archive_path is None, and the archive itself rejected, if it can't be read
+    or is over the limits. The archive is saved outside the upload folder;
+    the job extracts and deletes it.
+    """
+    handle, archive_path = tempfile.mkstemp(prefix='ats-upload-', suffix=archives.archive_extension(filename))
+    try:
+        with os.fdopen(handle, 'wb') as f:
+            # Copied from the request's spooled temporary file in blocks, never read whole into memory
+            file.save(f)
+        members, rejected = archives.accept_members(archive_path, taken)
+        print(f"📦 Archive {filename}: {len(members)} resume(s) queued, {len(rejected)} rejected")
+        return archive_path, members, rejected
+    except Exception as e:
+        os.remove(archive_path)
+        print(f"ERROR: Exception reading archive {filename}: {str(e)}")  # Log exception
+        return None, [], [(filename, f"Archive could not be processed - {str(e)}")]
+
+def get_user_job(job_id):
+    """Load a job if it belongs to the current user"""
+    job = get_job(job_id) if job_id else None
+    if job and str(job['user_id']) != str(current_user.id):
+        return None
+    return job
+
+@app.route('/jobs/<job_id>')
+@login_required
+def job_status(job_id):
+    """JSON progress for a background job"""
+    job = get_user_job(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+
+    return jsonify({
+        'id': job['id'],
+        'status': job['status'],
+        'total_files': job['total_files'],
+        'processed_files': job['processed_files'],
+        'failed_files': job['failed_files'],
+        'files': job['files'],
+        'error': job['error'],
+        'results_url': url_for('show_results', job_id=job['id']) if job['status'] == 'done' else None
+    })
+
+@app.route('/jobs/<job_id>/progress')
+@login_required
+def job_progress(job_id):
+    job = get_user_job(job_id)
+    if not job:
+        flash('Processing job not found.', 'error')
+        return redirect(url_for('upload_files'))
+    if job['status'] == 'done':
+        return redirect(url_for('show_results', job_id=job_id))
+    return render_template('processing.html', job=job)
+
+def read_rescore_criteria(params, course_type, internship_type, cgpa_minimum):
+    """Criteria from a re-score request, omitted ones taking the given defaults
+
+    Returns ((course_type, internship_type, cgpa_minimum), None) or (None,
+    error message); defaults may be None to leave a criterion unchanged.
+    """
+    course_type = params.get('course_type') or course_type
+    internship_type = params.get('internship_type') or internship_type
+    if params.get('cgpa_minimum') not in (None, ''):
+        cgpa_minimum = params.get('cgpa_minimum')
+    if cgpa_minimum is not None:
+        try:
+            cgpa_minimum = float(cgpa_minimum)
+        except (TypeError, ValueError):
+            return None, 'CGPA minimum must be a number.'
+        if not 0 <= cgpa_minimum <= 10:
+            return None, 'CGPA minimum must be between 0 and 10.'
+    if course_type not in ('5year', '3year', None) or internship_type not in ('long_term', 'short_term', None):
+        return None, 'Unknown course type or internship type.'
+    return (course_type, internship_type, cgpa_minimum), None
+
+@app.route('/rescore', methods=['POST'])
+@login_required
+def rescore_pool():
+    """Re-rank the user's whole candidate pool under a new CGPA minimum, course type or internship type
+
+    Every finished batch is re-classified from its stored parser output; no
+    file is parsed again. Accepts JSON or form fields (cgpa_minimum,
+    course_type, internship_type); omitted ones keep each batch's own values.
+    JSON requests get JSON back; form posts are redirected to the results page.
+    """
+    params = request.get_json(silent=True) if request.is_json else request.form
+    criteria, error = read_rescore_criteria(params or {}, None, None, None)
+    if error:
+        if request.is_json:
+            return jsonify({'error': error}), 400
+        flash(error, 'error')
+        return redirect(url_for('show_results'))
+    course_type, internship_type, cgpa_minimum = criteria
+
+    started = datetime.now()
+    rescored, changed, skipped = job_queue.rescore_all(current_user.id, course_type, internship_type, cgpa_minimum)
+    elapsed_ms = round((datetime.now() - started).total_seconds() * 1000, 1)
 
+    if not request.is_json:
+        message = f'Re-scored {rescored} candidate(s) across all batches; {changed} changed.'
+        if skipped:
+            message += f' {skipped} batch(es) processed before parsed resumes were stored were left as they were.'
+        flash(message, 'success')
         return redirect(url_for('show_results'))
 
-    return render_template('upload.html')
+    return jsonify({
+        'rescored': rescored,
+        'changed': changed,
+        'skipped_batches': skipped,
+        'course_type': course_type,
+        'internship_type': internship_type,
+        'cgpa_minimum': cgpa_minimum,
+        'elapsed_ms': elapsed_ms
+    })
+
+@app.route('/jobs/<job_id>/rescore', methods=['POST'])
+@login_required
+def rescore_job(job_id):
+    """Re-rank one finished batch under a new CGPA minimum, course type or internship type
+
+    The single-batch variant of /rescore. Accepts JSON or form fields
+    (cgpa_minimum, course_type, internship_type; omitted ones keep the batch's
+    current values). JSON requests get JSON back; form posts are redirected to
+    the results page.
+    """
+    job = get_user_job(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+
+    params = request.get_json(silent=True) if request.is_json else request.form
+    params = params or {}
+
+    def fail(message, status):
+        if request.is_json:
+            return jsonify({'error': message}), status
+        flash(message, 'error')
+        return redirect(url_for('show_results', job_id=job_id))
+
+    if job['status'] != 'done':
+        return fail('Only finished batches can be re-scored.', 409)
+
+    criteria, error = read_rescore_criteria(params, job['course_type'], job['internship_type'],
+                                            job['summary'].get('cgpa_minimum', app.config['CGPA_MINIMUM']))
+    if error:
+        return fail(error, 400)
+    course_type, internship_type, cgpa_minimum = criteria
+
+    started = datetime.now()
+    result = job_queue.rescore(job, course_type, internship_type, cgpa_minimum)
+    if result is None:
+        return fail('This batch was processed before parsed resumes were stored; upload it again to re-score it.', 409)
+    elapsed_ms = round((datetime.now() - started).total_seconds() * 1000, 1)
+    rescored, changed = result
+
+    if not request.is_json:
+        flash(f'Re-scored {rescored} candidate(s) with CGPA minimum {cgpa_minimum:g}; {changed} changed.', 'success')
+        return redirect(url_for('show_results', job_id=job_id))
+
+    return jsonify({
+        'id': job_id,
+        'rescored': rescored,
+        'changed': changed,
+        'course_type': course_type,
+        'internship_type': internship_type,
+        'cgpa_minimum': cgpa_minimum,
+        'counts': count_candidates(job_id),
+        'elapsed_ms': elapsed_ms,
+        'results_url': url_for('show_results', job_id=job_id)
+    })
 
 @app.route('/results')
 @login_required
 def show_results():
-    results = session.get('results', [])
-    summary = session.get('processing_summary', {})
+    job_id = request.args.get('job_id') or session.get('job_id')
+    job = get_user_job(job_id)
 
-    if not results:
-        flash('No results to display. Please upload and process resume files first.', 'info')
-        return redirect(url_for('upload_files'))
+    if job and job['status'] != 'done':
+        return redirect(url_for('job_progress', job_id=job_id))
 
-    # Segregate results
-    ma_team_matches = [r for r in results if r['final_category'] == 'ma_team_match']
-    shortlisted = [r for r in results if r['final_category'] == 'shortlisted']
-    others = [r for r in results if r['final_category'] == 'others']
+    counts = count_candidates(job_id) if job else {}
+    summary = job['summary'] if job else {}
+    total_candidates = sum(counts.values())
 
-    # Sort by preference score (highest first)
-    ma_team_matches.sort(key=lambda x: x.get('preference_score', 0), reverse=True)
-    shortlisted.sort(key=lambda x: x.get('preference_score', 0), reverse=True)
+    if not total_candidates:
+        flash('No results to display. Please upload and process resume files first.', 'info')
+        return redirect(url_for('upload_files'))
 
+    # Only the batch id lives in the session; candidates are read a page at a time
+    session['job_id'] = job_id
+
+    page_size = app.config['RESULTS_PAGE_SIZE']
+    pages = {}
+    candidates = {}
+    for category in ('ma_team_match', 'shortlisted', 'others'):
+        page_count = max(1, -(-counts.get(category, 0) // page_size))
+        page = min(max(request.args.get(f'{category}_page', 1, type=int), 1), page_count)
+        pages[category] = {'page': page, 'pages': page_count}
+        # Matches and shortlisted candidates are ranked by preference score; others keep upload order
+        candidates[category] = get_candidates(
+            job_id, category, page_size, (page - 1) * page_size, order_by_score=category != 'others'
+        )
+
+    ma_team_count = counts.get('ma_team_match', 0)
+    shortlisted_count = counts.get('shortlisted', 0)
     statistics = {
-        'total_candidates': len(results),
-        'ma_team_count': len(ma_team_matches),
-        'shortlisted_count': len(shortlisted),
-        'others_count': len(others),
-        'ma_team_percentage': round((len(ma_team_matches) / len(results)) * 100, 1) if results else 0,
-        'shortlisted_percentage': round((len(shortlisted) / len(results)) * 100, 1) if results else 0
+        'total_candidates': total_candidates,
+        'ma_team_count': ma_team_count,
+        'shortlisted_count': shortlisted_count,
+        'others_count': counts.get('others', 0),
+        'ma_team_percentage': round((ma_team_count / total_candidates) * 100, 1),
+        'shortlisted_percentage': round((shortlisted_count / total_candidates) * 100, 1)
     }
 
     return render_template('results.html', 
-                         ma_team_matches=ma_team_matches,
-                         shortlisted=shortlisted,
-                         others=others,
+                         job_id=job_id,
+                         ma_team_matches=candidates['ma_team_match'],
+                         shortlisted=candidates['shortlisted'],
+                         others=candidates['others'],
+                         pages=pages,
                          statistics=statistics,
+                         duplicate_groups=get_duplicate_groups(job_id),
                          summary=summary)
 
+# Experience flags /search can filter on (keys of a candidate's experience summary)
+SEARCH_EXPERIENCE_FLAGS = ('moot_court', 'tier_firm_internship', 'ma_moot_experience', 'publications',
+                           'faculty_recommendation', 'legalogic_previous', 'legal_research')
+
+@app.route('/search')
+@login_required
+def search():
+    """Search every candidate the user has processed
+
+    q is matched against the resumes' full text ("quoted phrases", OR, NOT
+    and prefix* work); cgpa_min, cgpa_max, year, category, experience and
+    job_id filter on the stored classification (year, category and experience
+    may repeat). Returns a page of results as HTML, or JSON with format=json.
+    """
+    query = request.args.get('q', '').strip()
+    filters = {
+        'cgpa_min': request.args.get('cgpa_min', type=float),
+        'cgpa_max': request.args.get('cgpa_max', type=float),
+        'academic_years': request.args.getlist('year', type=int),
+        'categories': [c for c in request.args.getlist('category') if c in criteria_evaluator.profile.categories],
+        'experience': [f for f in request.args.getlist('experience') if f in SEARCH_EXPERIENCE_FLAGS],
+        'job_id': request.args.get('job_id') or None,
+    }
+    page_size = app.config['SEARCH_PAGE_SIZE']
+    page = max(request.args.get('page', 1, type=int), 1)
+    wants_json = request.args.get('format') == 'json'
+
+    searched = bool(query) or any(filters.values()) or wants_json
+    total, results, order, elapsed_ms = 0, [], None, None
+    if searched:
+        started = datetime.now()
+        with metrics.timer('search'):
+            total, results, order = search_candidates(current_user.id, query, limit=page_size,
+                                                      offset=(page - 1) * page_size, **filters)
+        elapsed_ms = round((datetime.now() - started).total_seconds() * 1000, 1)
+    pages = max(1, -(-total // page_size))
+
+    if wants_json:
+        for result in results:
+            if result['snippet'] is not None:
+                result['snippet'] = result['snippet'].replace('\x02', '').replace('\x03', '')
+        return jsonify({
+            'query': query,
+            'filters': filters,
+            'total': total,
+            'page': page,
+            'pages': pages,
+            'page_size': page_size,
+            'order': order,
+            'elapsed_ms': elapsed_ms,
+            'results': results
+        })
+
+    for result in results:
+        if result['snippet'] is not None:
+            # Escape the resume text, then mark the matched terms
+            result['snippet'] = escape(result['snippet']).replace('\x02', Markup('<mark>')).replace('\x03', Markup('</mark>'))
+    return render_template('search.html',
+                         query=query,
+                         filters=filters,
+                         searched=searched,
+                         total=total,
+                         results=results,
+                         page=page,
+                         pages=pages,
+                         order=order,
+                         elapsed_ms=elapsed_ms,
+                         categories=criteria_evaluator.profile.categories,
+                         experience_flags=SEARCH_EXPERIENCE_FLAGS)
+
 @app.route('/export_results')
 @login_required
 def export_results():
-    results = session.get('results', [])
-    if not results:
+    job = get_user_job(session.get('job_id'))
+    if not job or not count_candidates(job['id']):
         flash('No results to export.', 'error')
         return redirect(url_for('dashboard'))
 
     # Create CSV export
     import csv
     import io
-    from flask import make_response
 
-    output = io.StringIO()
-    writer = csv.writer(output)
+    def generate_csv():
+        """Stream the CSV a chunk of candidates at a time instead of building it in memory"""
+        output = io.StringIO()
+        writer = csv.writer(output)
 
-    # Write header
-    writer.writerow([
-        'Filename', 'Category', 'CGPA', 'Academic Year', 'Company Law', 
-        'Contract Law', 'Legal Research', 'Moot Court', 'Preference Score',
-        'Long-term Eligible', 'Short-term Eligible'
-    ])
+        writer.writerow(EXPORT_COLUMNS)
+        for result in iter_candidates(job['id']):
+            writer.writerow(export_row(result))
+            if output.tell() >= 64 * 1024:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
 
-    # Write data
-    for result in results:
-        long_term_eval = result.get('long_term_evaluation', {})
-        short_term_eval = result.get('short_term_evaluation', {})
-        criteria_met = long_term_eval.get('criteria_met', {})
-
-        writer.writerow([
-            result.get('filename', ''),
-            result.get('final_category', ''),
-            result.get('cgpa', 'N/A'),
-            result.get('academic_year', 'N/A'),
-            'Yes' if criteria_met.get('company_law', False) else 'No',
-            'Yes' if criteria_met.get('contract_law', False) else 'No',
-            'Yes' if criteria_met.get('legal_research', False) else 'No',
-            'Yes' if result.get('moot_court_experience', False) else 'No',
-            result.get('preference_score', 0),
-            'Yes' if long_term_eval.get('eligible', False) else 'No',
-            'Yes' if short_term_eval.get('eligible', False) else 'No'
-        ])
-
-    output.seek(0)
-    response = make_response(output.getvalue())
+        yield output.getvalue()
+
+    response = Response(stream_with_context(generate_csv()), mimetype='text/csv')
     response.headers['Content-Disposition'] = f'attachment; filename=ats_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-    response.headers['Content-type'] = 'text/csv'
 
     return response
 
 @app.route('/clear_results')
 @login_required
 def clear_results():
-    session.pop('results', None)
-    session.pop('processing_summary', None)
+    session.pop('job_id', None)
     flash('Results cleared successfully.', 'info')
     return redirect(url_for('dashboard'))
 ############################################
 @app.route('/view_pdf/<filename>')
 @login_required
 def view_pdf(filename):
-    """Serve PDF files for viewing"""
+    """Serve PDF files for viewing
+
+    Files are found through the batch's stored uploads (job_id, else the
+    user's latest upload of that name), with the content hash as ETag so
+    viewers can revalidate and fetch byte ranges. Files uploaded before
+    uploads were stored by content are served from the upload folder.
+    """
     try:
         # Secure the filename to prevent directory traversal
         secure_name = secure_filename(filename)
+        stored = get_upload_file(current_user.id, secure_name, request.args.get('job_id'))
+        if stored and os.path.exists(upload_store.blob_path(stored['sha256'])):
+            return send_file(os.path.abspath(upload_store.blob_path(stored['sha256'])), download_name=secure_name,
+                             conditional=True, etag=stored['sha256'])
+
         file_path = os.path.join(app.config['UPLOAD_FOLDER'], secure_name)
         
         # Check if file exists
@@ -272,6 +520,13 @@ def view_pdf(filename):
         flash(f'Error accessing file: {str(e)}', 'error')
         return redirect(url_for('show_results'))
 ############################################
+@app.route('/metrics')
+def prometheus_metrics():
+    """Per-stage timing histograms in the Prometheus text format (for scraping)"""
+    if not app.config['METRICS_ENABLED']:
+        return jsonify({'error': 'Metrics are disabled'}), 404
+    return metrics.render_prometheus(), 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+
 @app.errorhandler(404)
 def not_found_error(error):
     return render_template('error.html', error_code=404, error_message='Page not found'), 404
@@ -286,5 +541,7 @@ def internal_error(error):
 
 
 if __name__ == '__main__':
+    if app.config['NER_WARM_UP_ON_START']:
+        model_registry.warm_up_in_background()
     port = int(os.environ.get('PORT', 5001))
     app.run(host='0.0.0.0', port=port, debug=False)
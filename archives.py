@@ -0,0 +1,122 @@
+"""
+Resume archives
+Reads .zip, .tar, .tar.gz/.tgz and .tar.bz2 archives one member at a time, so
+an archive of thousands of CVs is never unpacked in full. tar archives are
+read as a stream, in archive order.
+"""
+
+import os
+import tarfile
+import zipfile
+from werkzeug.utils import secure_filename
+from config import Config
+
+ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2')
+
+
+def is_archive(filename):
+    return filename.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+def is_resume(filename):
+    return os.path.splitext(filename)[1][1:].lower() in Config.ALLOWED_EXTENSIONS
+
+
+def archive_extension(filename):
+    """The archive extension of filename (e.g. '.tar.gz'), or None"""
+    return next((extension for extension in ARCHIVE_EXTENSIONS if filename.lower().endswith(extension)), None)
+
+
+def _is_resume_member(name):
+    # macOS archives carry '._name.pdf' resource forks (often under __MACOSX/) next to the real files
+    return is_resume(name) and not member_filename(name).startswith('._') \
+        and '__MACOSX' not in name.replace('\\', '/').split('/')
+
+
+def iter_members(path):
+    """Yield (member name, readable file object) for each resume in the archive
+
+    Directories, links and other file types are skipped; each file object is
+    only valid until the next member is requested.
+    """
+    if path.lower().endswith('.zip'):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and _is_resume_member(info.filename):
+                    with archive.open(info) as member:
+                        yield info.filename, member
+        return
+
+    with tarfile.open(path, mode='r|*') as archive:  # Stream: no seeking back through the archive
+        for info in archive:
+            if info.isfile() and _is_resume_member(info.name):
+                yield info.name, archive.extractfile(info)
+
+
+def list_members(path):
+    """(member name, uncompressed size) of each resume, in the order iter_members yields them
+
+    Only headers are read, but a compressed tar still has to be decompressed
+    end to end to reach them.
+    """
+    if path.lower().endswith('.zip'):
+        with zipfile.ZipFile(path) as archive:
+            # Declared sizes are enforced when a member is read, so they bound what it can expand to
+            return [(info.filename, info.file_size) for info in archive.infolist()
+                    if not info.is_dir() and _is_resume_member(info.filename)]
+
+    with tarfile.open(path, mode='r|*') as archive:
+        return [(info.name, info.size) for info in archive if info.isfile() and _is_resume_member(info.name)]
+
+
+def count_members(path):
+    """Number of resumes in the archive, or None when that needs a full pass (compressed tar)"""
+    if path.lower().endswith(('.zip', '.tar')):
+        return len(list_members(path))
+    return None
+
+
+def accept_members(path, taken=()):
+    """Choose the resumes of an uploaded archive to process, within the archive limits
+
+    Returns (members, rejected): members is a list of (member index, filename)
+    with the index counting iter_members' output and a secure filename not
+    in taken or used by another member; rejected is a list of (filename,
+    error). Raises ValueError when the archive as a whole is over the limits.
+    """
+    listed = list_members(path)
+    if len(listed) > Config.ARCHIVE_MAX_MEMBERS:
+        raise ValueError(f"{len(listed)} resumes in the archive (maximum {Config.ARCHIVE_MAX_MEMBERS})")
+    total_size = sum(size for _, size in listed if size <= Config.ARCHIVE_MAX_MEMBER_SIZE)
+    if total_size > Config.ARCHIVE_MAX_TOTAL_SIZE:
+        raise ValueError(f"{total_size / 2 ** 20:.0f}MB of resumes once unpacked "
+                         f"(maximum {Config.ARCHIVE_MAX_TOTAL_SIZE / 2 ** 20:.0f}MB)")
+
+    members = []
+    rejected = []
+    taken = set(taken)
+    for index, (name, size) in enumerate(listed):
+        filename = secure_filename(member_filename(name))
+        if not is_resume(filename):
+            rejected.append((name, "Unsupported file format (only PDF and DOCX allowed)"))
+            continue
+        if size > Config.ARCHIVE_MAX_MEMBER_SIZE:
+            rejected.append((name, f"File too large ({size / 2 ** 20:.1f}MB, maximum "
+                                   f"{Config.ARCHIVE_MAX_MEMBER_SIZE / 2 ** 20:.0f}MB)"))
+            continue
+        if filename in taken:
+            # Same file name in different folders of the archive: keep the folders in the name
+            filename = secure_filename(name.replace('\\', '/'))
+            stem, extension = os.path.splitext(filename)
+            copy = 2
+            while filename in taken:
+                filename = f"{stem}_{copy}{extension}"
+                copy += 1
+        taken.add(filename)
+        members.append((index, filename))
+    return members, rejected
+
+
+def member_filename(name):
+    """The base name of a member path, as written by Windows or POSIX tools"""
+    return os.path.basename(name.replace('\\', '/'))
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Result Write Benchmark for ATS Resume Checker
+Stores synthetic classifications (candidates + processing_logs rows) in a
+scratch database four ways and reports rows/sec at each size:
+
+  connect_per_row  one sqlite3.connect + commit per row (the original shape)
+  pooled_per_row   pooled connection, still one commit per row
+  bulk             models.save_results: one executemany transaction
+  writer           ResultWriter fed 10-row chunks from 4 threads at once
+
+Per-row strategies are capped at --per-row-limit rows (they are timed on the
+first N rows and reported as rows/sec).
+
+Usage: python benchmarks/bench_db_writes.py [--sizes 10 1000 100000]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+import db_pool
+import models
+from result_writer import ResultWriter
+
+WRITER_THREADS = 4
+WRITER_CHUNK = 10  # Config.JOB_CHUNK_SIZE-sized chunks, as the job queue writes them
+
+
+def make_candidates(count):
+    candidates = []
+    for position in range(count):
+        classification = {
+            'filename': f"resume_{position:06d}.pdf",
+            'cgpa': round(6 + (position % 40) / 10, 1),
+            'academic_year': 1 + position % 5,
+            'long_term_evaluation': {'eligible': position % 3 == 0, 'criteria_met': {'cgpa': True}},
+            'short_term_evaluation': {'eligible': position % 2 == 0, 'criteria_met': {'cgpa': True}},
+            'preference_score': position % 100,
+            'preference_details': {'moot_court': 10, 'legal_research': 0},
+            'experience_summary': {'moot_court': True},
+            'final_category': ('ma_team_match', 'shortlisted', 'others')[position % 3],
+            'bert_confidence': 80.5,
+        }
+        candidates.append((position, classification, None))  # No parser output stored
+    return candidates
+
+
+def write_connect_per_row(job_id, candidates):
+    """One connection and commit per row, as log_processing_result used to do"""
+    for position, classification, parsed_info in candidates:
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.execute('''
+            INSERT INTO candidates
+            (job_id, user_id, position, filename, final_category, cgpa, academic_year, preference_score, details)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', models._candidate_rows(job_id, 1, [(position, classification, parsed_info)])[0])
+        conn.commit()
+        conn.close()
+
+        # The original log_processing_result: its own connection and commit too
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.execute('''
+            INSERT INTO processing_logs
+            (user_id, filename, result_category, cgpa, academic_year, preference_score)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', models._processing_log_rows(1, [(position, classification, parsed_info)])[0])
+        conn.commit()
+        conn.close()
+
+
+def write_pooled_per_row(job_id, candidates):
+    for candidate in candidates:
+        models.save_results([(job_id, 1, [candidate])])
+
+
+def write_bulk(job_id, candidates):
+    models.save_results([(job_id, 1, candidates)])
+
+
+def write_with_writer(job_id, candidates):
+    writer = ResultWriter()
+    chunks = [candidates[start:start + WRITER_CHUNK] for start in range(0, len(candidates), WRITER_CHUNK)]
+
+    def submit(thread_index):
+        futures = [writer.write(job_id, 1, chunk) for chunk in chunks[thread_index::WRITER_THREADS]]
+        for future in futures:
+            future.result()
+
+    threads = [threading.Thread(target=submit, args=(index,)) for index in range(WRITER_THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.close()
+
+
+STRATEGIES = {
+    'connect_per_row': (write_connect_per_row, True),
+    'pooled_per_row': (write_pooled_per_row, True),
+    'bulk': (write_bulk, False),
+    'writer': (write_with_writer, False),
+}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--sizes', type=int, nargs='+', default=[10, 1000, 100000])
+    arg_parser.add_argument('--per-row-limit', type=int, default=2000)
+    arg_parser.add_argument('--output', help='Optional path for a JSON report')
+    args = arg_parser.parse_args()
+
+    print("⏱️  Result Write Benchmark")
+    print("=" * 50)
+
+    scratch = tempfile.mkdtemp(prefix='ats-bench-db-')
+    Config.DATABASE_PATH = os.path.join(scratch, 'bench.db')
+    report = {}
+    try:
+        models.init_db()
+        for size in args.sizes:
+            candidates = make_candidates(size)
+            report[size] = {}
+            for name, (write, per_row) in STRATEGIES.items():
+                rows = candidates[:args.per_row_limit] if per_row else candidates
+                job_id = f"{name}-{size}"
+                started = time.perf_counter()
+                write(job_id, rows)
+                elapsed = time.perf_counter() - started
+
+                stored = db_pool.get_connection().execute(
+                    'SELECT COUNT(*) FROM candidates WHERE job_id = ?', (job_id,)
+                ).fetchone()[0]
+                assert stored == len(rows), f"{name}: stored {stored} of {len(rows)} rows"
+                report[size][name] = {'rows': len(rows), 'seconds': round(elapsed, 4),
+                                      'rows_per_sec': round(len(rows) / elapsed, 1)}
+
+        print(f"\n📊 rows/sec (each row = one candidates + one processing_logs insert)")
+        print(f"   {'rows':>8}" + ''.join(f"{name:>17}" for name in STRATEGIES))
+        for size, results in report.items():
+            print(f"   {size:>8}" + ''.join(f"{results[name]['rows_per_sec']:>17,.0f}" for name in STRATEGIES))
+        print(f"\n   per-row strategies timed on at most {args.per_row_limit} rows")
+    finally:
+        db_pool.close_connections()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Report written to {args.output}")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Extractor Micro-benchmark for ATS Resume Checker
+Compares ResumeParser.extract_cgpa / extract_academic_year (precompiled regex
+bank) with the previous per-call implementation on the sample resumes, and
+checks that both return identical results.
+
+Usage: python benchmarks/bench_extractors.py [--folder uploads] [--repeat 50]
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from resume_parser import ResumeParser
+
+
+# --- Reference implementation (before regex_bank), kept verbatim for comparison ---
+
+def legacy_extract_cgpa(text):
+    """Extract CGPA/GPA from resume text with IMPROVED pattern matching"""
+    # Clean text for better pattern matching
+    text = re.sub(r'\s+', ' ', text)
+
+    # Enhanced patterns to catch ALL CGPA/GPA/Percentage formats
+    patterns = [
+        # Standard formats: CGPA: 8.5, GPA: 3.8, G.P.A: 7.5
+        r'(?:CGPA|GPA|G\.P\.A|C\.G\.P\.A|Cumulative GPA)\s*[:-–]?\s*(?:\(Avg\.\)\s*[-–]\s*)?([0-9]+(?:\.[0-9]+)?)(?:\s*/\s*([0-9]+))?',
+        # Reverse formats: 8.5 CGPA, 3.8 GPA  
+        r'([0-9]+(?:\.[0-9]+)?)\s*(?:CGPA|GPA|G\.P\.A|C\.G\.P\.A)(?:\s*/\s*([0-9]+))?',
+        # Fraction formats: 8.5/10, 3.8/4.0
+        r'(?:CGPA|GPA|G\.P\.A)\s*[:-–]?\s*([0-9]+(?:\.[0-9]+)?)\s*/\s*([0-9]+(?:\.[0-9]+)?)',
+        # Academic performance indicators
+        r'(?:Academic Performance|Overall Grade|Cumulative Grade)\s*[:-–]?\s*([0-9]+(?:\.[0-9]+)?)(?:\s*/\s*([0-9]+))?',
+        # Percentage formats: 66% (1st Class), 95.4%
+        r'\b([0-9]+(?:\.[0-9]+)?)\s*%\s*(?:\([^)]*\))?',
+        # B.A. LL.B. (Hons.) – School Name – 66% format
+        r'[–-]\s*([0-9]+(?:\.[0-9]+)?)\s*%\s*(?:\([^)]*\))?'
+    ]
+
+    for i, pattern in enumerate(patterns):
+        matches = re.finditer(pattern, text, re.IGNORECASE)
+        for match in matches:
+            try:
+                if i >= 4:  # Percentage patterns (last two)
+                    percentage = float(match.group(1))
+                    # Convert percentage to CGPA estimate
+                    if percentage >= 90:
+                        cgpa = 9.0 + (percentage - 90) / 10
+                    elif percentage >= 80:
+                        cgpa = 8.0 + (percentage - 80) / 10
+                    elif percentage >= 70:
+                        cgpa = 7.0 + (percentage - 70) / 10
+                    elif percentage >= 60:
+                        cgpa = 6.0 + (percentage - 60) / 10
+                    else:
+                        cgpa = percentage / 10  # Basic conversion
+                    return min(cgpa, 10.0)
+                else:
+                    cgpa = float(match.group(1))
+                    max_cgpa = float(match.group(2)) if len(match.groups()) > 1 and match.group(2) else None
+
+                    # Normalize to 10 scale if necessary
+                    if max_cgpa:
+                        if max_cgpa == 4.0:
+                            cgpa = (cgpa / 4.0) * 10.0
+                        elif max_cgpa == 5.0:
+                            cgpa = (cgpa / 5.0) * 10.0
+
+                    # Validate CGPA range
+                    if 0 <= cgpa <= 10:
+                        return cgpa
+            except ValueError:
+                continue
+
+    return None
+
+
+def legacy_extract_academic_year(text):
+    """Extract current academic year from resume with COMPLETE implementation"""
+    current_year = datetime.now().year
+
+    # Enhanced patterns to identify academic year
+    year_patterns = [
+        # Direct year mentions: "3rd year", "fourth year"
+        r'\b([1-5])(?:st|nd|rd|th)\s+year\b',
+        r'\b(?:first|second|third|fourth|fifth|1st|2nd|3rd|4th|5th)\s+year\b',
+
+        # Semester patterns: "6th semester", "semester 8"
+        r'\b([1-9]|10)(?:st|nd|rd|th)?\s+semester\b',
+        r'\bsemester\s+([1-9]|10)\b',
+
+        # Year level: "Year 3", "Level 4"
+        r'\b(?:year|level)\s+([1-5])\b',
+
+        # Academic year ranges: "2021-2026", "2024-25", "(2021-26)"
+        r'\(?\s*(20[2-9][0-9])\s*[-–]\s*(?:20)?([2-9][0-9])\s*\)?',
+
+        # Expected graduation: "graduating in 2025", "class of 2024"
+        r'\b(?:graduating|graduation|class of)\s+(?:in\s+)?(20[2-9][0-9])\b',
+
+        # Current enrollment: "currently in 3rd year"
+        r'\bcurrently\s+(?:in\s+)?(?:([1-5])(?:st|nd|rd|th)|([1-9])(?:st|nd|rd|th)?)\s+(?:year|semester)\b',
+
+        # Final-year patterns: "Final-year B.A. LL.B."
+        r'\bfinal[-\s]?year\b'
+    ]
+
+    year_words_to_numbers = {
+        'first': 1, 'second': 2, 'third': 3, 'fourth': 4, 'fifth': 5,
+        '1st': 1, '2nd': 2, '3rd': 3, '4th': 4, '5th': 5
+    }
+
+    for pattern_index, pattern in enumerate(year_patterns):
+        matches = re.finditer(pattern, text, re.IGNORECASE)
+        for match in matches:
+            try:
+                # Handle final-year pattern
+                if pattern_index == 8:  # final-year pattern
+                    return 5
+
+                # Handle semester patterns
+                elif pattern_index in [2, 3]:  # semester patterns
+                    if match.group(1) and match.group(1).isdigit():
+                        semester_number = int(match.group(1))
+                        year_number = (semester_number + 1) // 2
+                        if 1 <= year_number <= 5:
+                            return year_number
+
+                # Handle academic year ranges like "2021-26" or "(2021–2026)"
+                elif pattern_index == 5:  # Academic year ranges
+                    start_year = int(match.group(1))
+                    end_year_str = match.group(2)
+
+                    # Handle 2-digit or 4-digit end year
+                    if len(end_year_str) == 2:
+                        if int(end_year_str) < 50:
+                            end_year = 2000 + int(end_year_str)
+                        else:
+                            end_year = 1900 + int(end_year_str)
+                    else:
+                        end_year = int(end_year_str)
+
+                    # Calculate current year in the program
+                    years_in_college = current_year - start_year + 1
+
+                    # Validate range (1-5 years for law programs)
+                    if 1 <= years_in_college <= 6:  # Allow up to 6 for flexibility
+                        return min(years_in_college, 5)
+
+                # Handle graduation year patterns
+                elif pattern_index == 6:  # graduation patterns
+                    grad_year = int(match.group(1))
+                    years_remaining = grad_year - current_year
+                    if years_remaining == 1:
+                        return 5
+                    elif years_remaining == 2:
+                        return 4
+                    elif years_remaining == 3:
+                        return 3
+
+                # Handle direct year mentions
+                else:
+                    year_text = match.group(1) if match.group(1) else match.group(0).split()[0]
+                    if year_text in year_words_to_numbers:
+                        year_number = year_words_to_numbers[year_text]
+                    elif year_text.isdigit():
+                        year_number = int(year_text)
+                    else:
+                        continue
+
+                    if 1 <= year_number <= 5:
+                        return year_number
+
+            except (ValueError, IndexError, AttributeError):
+                continue
+
+    return None
+
+
+# --------------------------------------------------------------------------------
+
+
+def time_per_call(function, texts, repeat):
+    """Mean milliseconds per text for function over texts"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            function(text)
+    return (time.perf_counter() - started) * 1000 / (repeat * len(texts))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--folder', default=Config.UPLOAD_FOLDER)
+    arg_parser.add_argument('--repeat', type=int, default=50)
+    args = arg_parser.parse_args()
+
+    print("⏱️  Extractor Micro-benchmark")
+    print("=" * 50)
+
+    parser = ResumeParser()
+    names, texts = [], []
+    for file_path in sorted(glob.glob(os.path.join(args.folder, '*'))):
+        text, error = parser.extract_text(file_path)
+        if not error:
+            names.append(os.path.basename(file_path))
+            texts.append(text)
+
+    if not texts:
+        print("❌ No sample resumes found")
+        return False
+
+    extractors = [
+        ('extract_cgpa', legacy_extract_cgpa, parser.extract_cgpa),
+        ('extract_academic_year', legacy_extract_academic_year, parser.extract_academic_year),
+    ]
+
+    identical = True
+    for extractor_name, legacy, current in extractors:
+        print(f"\n🔬 {extractor_name}")
+        for name, text in zip(names, texts):
+            expected, actual = legacy(text), current(text)
+            if expected != actual:
+                identical = False
+                print(f"   ❌ {name}: {expected} (before) != {actual} (now)")
+
+        legacy_ms = time_per_call(legacy, texts, args.repeat)
+        current_ms = time_per_call(current, texts, args.repeat)
+        print(f"   before: {legacy_ms:.3f} ms/resume")
+        print(f"   now:    {current_ms:.3f} ms/resume ({legacy_ms / current_ms:.2f}x)")
+
+    print("\n" + "=" * 50)
+    if identical:
+        print(f"✅ Identical outputs on all {len(texts)} resumes")
+    else:
+        print("❌ Outputs differ - see above")
+    return identical
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Benchmark for ATS Resume Checker
+Fills a scratch near-duplicate index with synthetic resumes (~400 words each)
+and then looks up edited copies of indexed resumes (a few words changed, a
+line added or dropped) and unrelated new resumes. Reports milliseconds per
+lookup at each pool size, which should stay roughly flat as the pool grows,
+how many edited copies were found (recall), how many unrelated resumes were
+wrongly matched, and the cost of computing one signature.
+
+Usage: python benchmarks/bench_near_duplicates.py [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db_pool
+from near_duplicates import NearDuplicateIndex
+
+VOCABULARY = [f"word{index}" for index in range(20000)]
+
+
+def make_text(rng):
+    return ' '.join(rng.choice(VOCABULARY) for _ in range(400))
+
+
+def edit_text(text, rng):
+    """A revised version: a few words replaced, one line dropped, one added"""
+    words = text.split()
+    for _ in range(4):
+        words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+    start = rng.randrange(len(words) - 12)
+    del words[start:start + 12]
+    words[rng.randrange(len(words)):0] = [rng.choice(VOCABULARY) for _ in range(12)]
+    return ' '.join(words)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    arg_parser.add_argument('--queries', type=int, default=200)
+    arg_parser.add_argument('--output', help='Optional path for a JSON report')
+    args = arg_parser.parse_args()
+
+    print("⏱️  Near-Duplicate Benchmark")
+    print("=" * 50)
+
+    scratch = tempfile.mkdtemp(prefix='ats-bench-near-duplicates-')
+    index = NearDuplicateIndex(db_path=os.path.join(scratch, 'near_duplicates.db'))
+    rng = random.Random(0)
+    texts = []
+    report = {}
+    try:
+        for size in sorted(args.sizes):
+            while len(texts) < size:
+                texts.append(make_text(rng))
+                index.add(index.signature(texts[-1]), f"resume_{len(texts):06d}.pdf")
+
+            edited = [edit_text(rng.choice(texts), rng) for _ in range(args.queries)]
+            unrelated = [make_text(rng) for _ in range(args.queries)]
+
+            started = time.perf_counter()
+            signatures = [index.signature(text) for text in edited + unrelated]
+            signature_ms = (time.perf_counter() - started) * 1000 / len(signatures)
+
+            timings = []
+            found = false_matches = 0
+            for position, signature in enumerate(signatures):
+                started = time.perf_counter()
+                match = index.find(signature)
+                timings.append((time.perf_counter() - started) * 1000)
+                if position < len(edited):
+                    found += match is not None
+                else:
+                    false_matches += match is not None
+
+            report[size] = {
+                'lookup_ms_median': round(statistics.median(timings), 3),
+                'lookup_ms_p95': round(sorted(timings)[int(len(timings) * 0.95)], 3),
+                'signature_ms': round(signature_ms, 3),
+                'recall': round(found / len(edited), 3),
+                'false_matches': false_matches,
+            }
+
+        print(f"\n📊 {args.queries} edited + {args.queries} unrelated lookups per pool size "
+              f"(threshold {index.threshold}, {index.bands} bands x {index.rows} rows)")
+        print(f"   {'pool':>8}{'p50 ms':>10}{'p95 ms':>10}{'sig ms':>10}{'recall':>10}{'false':>8}")
+        for size, result in report.items():
+            print(f"   {size:>8}{result['lookup_ms_median']:>10.3f}{result['lookup_ms_p95']:>10.3f}"
+                  f"{result['signature_ms']:>10.3f}{result['recall']:>10.1%}{result['false_matches']:>8}")
+    finally:
+        db_pool.close_connections()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Report written to {args.output}")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+PDF Engine Benchmark for ATS Resume Checker
+Times every installed PDF engine (see pdf_engines) on the sample PDFs and
+reports how much text each one gets, which results fail the quality check
+(empty or garbled), and whether the CGPA, academic year and keyword checks
+agree with PyPDF2. Use it to choose the PDF_ENGINES order.
+
+Usage: python benchmarks/bench_pdf_engines.py [--folder uploads] [--repeat 3]
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+import pdf_engines
+from resume_parser import ResumeParser
+
+
+def rule_based_fields(parser, text):
+    keyword_hits = parser.match_keywords(text)
+    return {
+        'cgpa': parser.extract_cgpa(text),
+        'academic_year': parser.extract_academic_year(text),
+        'keywords': {category: parser.keyword_matcher.found_keywords(keyword_hits, category)
+                     for category in keyword_hits},
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--folder', default=Config.UPLOAD_FOLDER)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--output', help='Optional path for a JSON report')
+    args = arg_parser.parse_args()
+
+    print("⏱️  PDF Engine Benchmark")
+    print("=" * 50)
+
+    file_paths = sorted(glob.glob(os.path.join(args.folder, '*.pdf')))
+    if not file_paths:
+        print("❌ No sample PDFs found")
+        return False
+
+    engines = []
+    for name, engine_class in pdf_engines.ENGINES.items():
+        try:
+            engines.append(engine_class())
+        except ImportError:
+            print(f"   ⚠️  {name} not installed - skipped")
+
+    # PyPDF2 runs first: the others are compared against it
+    engines.sort(key=lambda engine: engine.name != pdf_engines.PyPDF2Engine.name)
+
+    parser = ResumeParser()
+    reference = {}
+    report = {}
+
+    for engine in engines:
+        timings = []
+        characters = 0
+        problems = {}
+        disagreements = []
+        for file_path in file_paths:
+            name = os.path.basename(file_path)
+            try:
+                started = time.perf_counter()
+                for _ in range(args.repeat):
+                    text = "".join(engine.iter_pages(file_path))
+                timings.append((time.perf_counter() - started) * 1000 / args.repeat)
+            except Exception as e:
+                problems[name] = f"error ({e})"
+                continue
+
+            characters += len(text)
+            problem = pdf_engines.text_problem(text)
+            if problem:
+                problems[name] = problem
+
+            fields = rule_based_fields(parser, text)
+            if engine.name == pdf_engines.PyPDF2Engine.name:
+                reference[name] = fields
+            elif name in reference and fields != reference[name]:
+                disagreements.append(name)
+
+        total_ms = sum(timings)
+        report[engine.name] = {
+            'files': len(timings),
+            'total_ms': round(total_ms, 1),
+            'mean_ms': round(total_ms / len(timings), 1) if timings else None,
+            'characters': characters,
+            'problems': problems,
+            'differs_from_pypdf2': disagreements,
+        }
+
+    print(f"\n📊 {len(file_paths)} PDFs, mean of {args.repeat} runs each")
+    print(f"   {'engine':<12}{'total ms':>10}{'ms/file':>10}{'chars':>10}{'problems':>10}{'differs':>9}")
+    for name, result in sorted(report.items(), key=lambda item: item[1]['total_ms']):
+        print(f"   {name:<12}{result['total_ms']:>10.1f}{result['mean_ms'] or 0:>10.1f}{result['characters']:>10}"
+              f"{len(result['problems']):>10}{len(result['differs_from_pypdf2']):>9}")
+        for file_name, problem in sorted(result['problems'].items()):
+            print(f"      ⚠️  {file_name}: {problem}")
+        for file_name in result['differs_from_pypdf2']:
+            print(f"      ≠  {file_name}: CGPA/year/keywords differ from pypdf2")
+
+    fastest_first = ','.join(name for name, _ in sorted(report.items(), key=lambda item: item[1]['total_ms']))
+    print(f"\n💡 Fastest first: PDF_ENGINES={fastest_first}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Report written to {args.output}")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
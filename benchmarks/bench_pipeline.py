@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+End-to-end Pipeline Benchmark for ATS Resume Checker
+Runs the resume pipeline over the sample resumes in uploads/ and over
+synthetic resumes, reporting p50/p95 latency per stage (extract, ner, regex,
+keywords, scoring), batch throughput in resumes/sec and peak RSS. Results are
+written as JSON so runs can be diffed between commits.
+
+Usage: python benchmarks/bench_pipeline.py [--synthetic 1000] [--output benchmarks/results/pipeline.json]
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import math
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import docx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from criteria_evaluator import CriteriaEvaluator
+from resume_parser import ResumeParser
+
+STAGES = ['extract', 'ner', 'regex', 'keywords', 'scoring']
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results', 'pipeline.json')
+
+# Building blocks for synthetic resumes, shaped like the sample law-student CVs
+SYNTHETIC_NAMES = ['Aditi Sharma', 'Rahul Verma', 'Sneha Kulkarni', 'Arjun Mehta', 'Priya Nair', 'Karan Singh']
+SYNTHETIC_SCHOOLS = ['National Law School of India University', 'Symbiosis Law School, Pune',
+                     'ILS Law College', 'Gujarat National Law University', 'Jindal Global Law School']
+SYNTHETIC_YEARS = ['3rd year', 'Fourth Year', '5th semester', 'semester 8', 'Final-year', '2021-2026', 'Class of 2025']
+SYNTHETIC_SCORES = ['CGPA: {:.2f}/10', 'GPA {:.1f}', '{:.2f} CGPA', 'Percentage: {:.0f}%']
+SYNTHETIC_EXPERIENCE = [
+    'Intern, Cyril Amarchand Mangaldas - assisted with due diligence for mergers and acquisitions',
+    'Intern, Khaitan & Co - contract drafting and review of commercial contracts',
+    'Research assistant - legal research on corporate governance using Manupatra and Westlaw',
+    'Participated in the National Moot Court Competition; drafted the memorial and oral arguments',
+    'Quarter-finalist, M&A Moot organised by a tier-1 law firm',
+    'Intern, District Court - prepared case briefs and legal memoranda',
+    'Published a research paper on breach of contract and specific performance',
+    'Volunteer, legal aid clinic - drafted terms and conditions for local businesses',
+]
+SYNTHETIC_FILLER = ('Responsible for coordinating with the team, reviewing files, attending hearings and '
+                    'preparing notes for the supervising advocate. ')
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of values (0 for an empty list)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def summarize(samples_ms):
+    return {
+        'count': len(samples_ms),
+        'p50_ms': round(percentile(samples_ms, 50), 3),
+        'p95_ms': round(percentile(samples_ms, 95), 3),
+        'mean_ms': round(sum(samples_ms) / len(samples_ms), 3) if samples_ms else 0.0,
+    }
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return round(peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024, 1)
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        return None
+
+
+def write_synthetic_resumes(folder, count, seed):
+    """Write count synthetic .docx resumes into folder and return their paths"""
+    rng = random.Random(seed)
+    paths = []
+    for index in range(count):
+        document = docx.Document()
+        document.add_heading(rng.choice(SYNTHETIC_NAMES), level=1)
+        document.add_paragraph(f"B.A. LL.B. (Hons.), {rng.choice(SYNTHETIC_SCHOOLS)} - {rng.choice(SYNTHETIC_YEARS)}")
+
+        score_format = rng.choice(SYNTHETIC_SCORES)
+        score = rng.uniform(55, 95) if '%' in score_format else rng.uniform(5.5, 9.8)
+        document.add_paragraph(score_format.format(score))
+
+        document.add_heading('Experience', level=2)
+        for line in rng.sample(SYNTHETIC_EXPERIENCE, rng.randint(2, 6)):
+            document.add_paragraph(line + '. ' + SYNTHETIC_FILLER * rng.randint(1, 8))
+
+        path = os.path.join(folder, f"synthetic_{index:05d}.docx")
+        document.save(path)
+        paths.append(path)
+    return paths
+
+
+def time_stages(parser, evaluator, file_path, use_ner):
+    """Run each pipeline stage for one resume, returning {stage: ms} (None if extraction failed)"""
+    timings = {}
+
+    started = time.perf_counter()
+    text, error = parser.extract_text(file_path)
+    timings['extract'] = (time.perf_counter() - started) * 1000
+    if error:
+        return None
+
+    started = time.perf_counter()
+    entities, bert_confidence = parser.process_texts_with_bert([text])[0] if use_ner else ([], 0.0)
+    timings['ner'] = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    cgpa = parser.extract_cgpa(text)
+    academic_year = parser.extract_academic_year(text)
+    timings['regex'] = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    keyword_hits = parser.match_keywords(text)
+    experience = parser.extract_experience(text, keyword_hits)
+    timings['keywords'] = (time.perf_counter() - started) * 1000
+
+    parsed_info = {
+        'filename': os.path.basename(file_path),
+        'cgpa': cgpa,
+        'academic_year': academic_year,
+        'company_law': len(keyword_hits['company_law']) > 0,
+        'contract_law': len(keyword_hits['contract_law']) > 0,
+        'experience': experience,
+        'text_length': len(text),
+        'bert_confidence': bert_confidence,
+        'bert_entities_count': len(entities)
+    }
+    started = time.perf_counter()
+    evaluator.classify_candidate(parsed_info, '5year', 'long_term')
+    timings['scoring'] = (time.perf_counter() - started) * 1000
+
+    return timings
+
+
+def run_stage_timings(parser, evaluator, file_paths, use_ner):
+    samples = {stage: [] for stage in STAGES + ['total']}
+    failed = 0
+    for file_path in file_paths:
+        timings = time_stages(parser, evaluator, file_path, use_ner)
+        if timings is None:
+            failed += 1
+            continue
+        for stage, elapsed in timings.items():
+            samples[stage].append(elapsed)
+        samples['total'].append(sum(timings.values()))
+    return {stage: summarize(values) for stage, values in samples.items()}, failed
+
+
+def run_throughput(parser, evaluator, file_paths, batch_size):
+    """Time parse_resumes + classify_candidate in upload-sized batches, as the job queue runs them"""
+    started = time.perf_counter()
+    processed = 0
+    for start in range(0, len(file_paths), batch_size):
+        # parse_resumes prints per-resume debug output; keep it out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            parsed_resumes = parser.parse_resumes(file_paths[start:start + batch_size])
+        for parsed_resume in parsed_resumes:
+            if 'error' not in parsed_resume:
+                evaluator.classify_candidate(parsed_resume, '5year', 'long_term')
+                processed += 1
+    elapsed = time.perf_counter() - started
+    return {
+        'resumes': processed,
+        'seconds': round(elapsed, 3),
+        'resumes_per_sec': round(processed / elapsed, 2) if elapsed else 0.0,
+        'batch_size': batch_size,
+    }
+
+
+def print_report(name, report):
+    print(f"\n📊 {name}: {report['files']} files ({report['failed']} failed)")
+    print(f"   {'stage':<10}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}")
+    for stage, summary in report['stages'].items():
+        print(f"   {stage:<10}{summary['p50_ms']:>10.2f}{summary['p95_ms']:>10.2f}{summary['mean_ms']:>10.2f}")
+    throughput = report['throughput']
+    print(f"   throughput: {throughput['resumes_per_sec']} resumes/sec "
+          f"({throughput['resumes']} in {throughput['seconds']}s, batches of {throughput['batch_size']})")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--folder', default=Config.UPLOAD_FOLDER, help='Folder of sample resumes')
+    arg_parser.add_argument('--synthetic', type=int, default=1000, help='Number of synthetic resumes (0 to skip)')
+    arg_parser.add_argument('--seed', type=int, default=42)
+    arg_parser.add_argument('--batch-size', type=int, default=Config.JOB_CHUNK_SIZE,
+                            help='Files per parse_resumes call in the throughput run')
+    arg_parser.add_argument('--no-ner', action='store_true', help='Skip BERT (time the rule-based stages only)')
+    arg_parser.add_argument('--output', default=DEFAULT_OUTPUT, help='Where to write the JSON report')
+    args = arg_parser.parse_args()
+
+    print("⏱️  Resume Pipeline Benchmark")
+    print("=" * 50)
+
+    # Every run must do the full work, so bypass the parse cache, and keep the
+    # benchmark's resumes out of the live near-duplicate index
+    Config.PARSE_CACHE_ENABLED = False
+    scratch = tempfile.mkdtemp(prefix='ats-bench-')
+    Config.NEAR_DUPLICATE_INDEX_PATH = os.path.join(scratch, 'near_duplicates.db')
+    parser = ResumeParser()
+    evaluator = CriteriaEvaluator()
+
+    use_ner = not args.no_ner
+    if use_ner:
+        started = time.perf_counter()
+        parser.process_text_with_bert("Warm-up sentence for the benchmark.")
+        print(f"🤖 NER model ready in {time.perf_counter() - started:.1f}s "
+              f"({Config.NER_MODEL_NAME}, backend={Config.NER_BACKEND})")
+    else:
+        # Throughput runs go through parse_resumes, which always calls BERT
+        parser.process_texts_with_bert = lambda texts: [([], 0.0) for _ in texts]
+
+    corpora = {'corpus': sorted(path for path in glob.glob(os.path.join(args.folder, '*'))
+                                if path.lower().endswith(('.pdf', '.docx')))}
+    if args.synthetic > 0:
+        synthetic_folder = os.path.join(scratch, 'synthetic')
+        os.makedirs(synthetic_folder)
+        print(f"📝 Writing {args.synthetic} synthetic resumes...")
+        corpora['synthetic'] = write_synthetic_resumes(synthetic_folder, args.synthetic, args.seed)
+
+    report = {
+        'benchmark': 'pipeline',
+        'timestamp': datetime.now().isoformat(),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'config': {
+            'ner': use_ner,
+            'ner_model': Config.NER_MODEL_NAME,
+            'ner_backend': Config.NER_BACKEND,
+            'ner_batch_size': Config.NER_BATCH_SIZE,
+            'extraction_workers': Config.EXTRACTION_WORKERS,
+            'synthetic': args.synthetic,
+            'seed': args.seed,
+        },
+        'corpora': {}
+    }
+
+    try:
+        for name, file_paths in corpora.items():
+            if not file_paths:
+                print(f"⚠️  No files for {name}, skipping")
+                continue
+            stages, failed = run_stage_timings(parser, evaluator, file_paths, use_ner)
+            report['corpora'][name] = {
+                'files': len(file_paths),
+                'failed': failed,
+                'stages': stages,
+                'throughput': run_throughput(parser, evaluator, file_paths, args.batch_size),
+            }
+            print_report(name, report['corpora'][name])
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    report['peak_rss_mb'] = peak_rss_mb()
+    print(f"\n💾 Peak RSS: {report['peak_rss_mb']} MB")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Report written to {args.output}")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Scoring Benchmark for ATS Resume Checker
+Classifies synthetic parsed resumes (random CGPA, year and experience flags,
+including missing values) with CriteriaEvaluator.classify_candidate one at a
+time and with the vectorized classify_candidates, checks that both produce
+identical classifications for every course/internship type, and reports
+resumes/sec for each. The "arrays" column times the vectorized core alone
+(to_columns + classify_batch): most of the batch path's time goes into
+building the per-candidate result dicts.
+
+It then scores the same resumes against every bundled criteria profile
+(criteria/*.json) in one pass and with one evaluator per profile.
+
+Usage: python benchmarks/bench_scoring.py [--sizes 10 1000 100000]
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from criteria_evaluator import CriteriaEvaluator
+import rule_engine
+
+COMBINATIONS = [(course_type, internship_type)
+                for course_type in ('5year', '3year') for internship_type in ('long_term', 'short_term')]
+
+
+def make_parsed_resumes(count, seed=0):
+    rng = random.Random(seed)
+    parsed_resumes = []
+    for index in range(count):
+        parsed_resumes.append({
+            'filename': f"resume_{index:06d}.pdf",
+            'cgpa': rng.choice([None, 7.5, round(rng.uniform(5, 10), 2)]),
+            'academic_year': rng.choice([None, 1, 2, 3, 4, 5]),
+            'company_law': rng.random() < 0.5,
+            'contract_law': rng.random() < 0.5,
+            'experience': {
+                'moot_court': rng.random() < 0.4,
+                'tier_firm_internship': rng.random() < 0.3,
+                'ma_moot_experience': rng.random() < 0.2,
+                'publications': ['Journal of Law'] if rng.random() < 0.3 else [],
+                'faculty_recommendation': rng.random() < 0.2,
+                'legalogic_previous': rng.random() < 0.1,
+                'legal_research': rng.random() < 0.5,
+            },
+        })
+    return parsed_resumes
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--sizes', type=int, nargs='+', default=[10, 1000, 100000])
+    arg_parser.add_argument('--output', help='Optional path for a JSON report')
+    args = arg_parser.parse_args()
+
+    print("⏱️  Scoring Benchmark")
+    print("=" * 50)
+
+    evaluator = CriteriaEvaluator()
+    report = {}
+    for size in args.sizes:
+        parsed_resumes = make_parsed_resumes(size, seed=size)
+        report[size] = {}
+        for course_type, internship_type in COMBINATIONS:
+            started = time.perf_counter()
+            expected = [evaluator.classify_candidate(parsed_resume, course_type, internship_type)
+                        for parsed_resume in parsed_resumes]
+            per_resume_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            evaluator.classify_batch(evaluator.to_columns(parsed_resumes), course_type, internship_type)
+            arrays_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            actual = evaluator.classify_candidates(parsed_resumes, course_type, internship_type)
+            batch_seconds = time.perf_counter() - started
+
+            mismatches = sum(1 for left, right in zip(expected, actual)
+                             if json.dumps(left) != json.dumps(right))
+            if mismatches:
+                print(f"❌ {size} resumes, {course_type}/{internship_type}: {mismatches} classifications differ")
+                return False
+            report[size][f"{course_type}/{internship_type}"] = {
+                'per_resume_per_sec': round(size / per_resume_seconds, 1),
+                'batch_per_sec': round(size / batch_seconds, 1),
+                'arrays_per_sec': round(size / arrays_seconds, 1),
+            }
+
+    # The configured primary profile first, then every other bundled one
+    profiles = [Config.CRITERIA_PROFILES[0]]
+    profiles += sorted(name for name in (os.path.splitext(os.path.basename(path))[0]
+                                         for path in glob.glob(os.path.join(rule_engine.CRITERIA_DIR, '*.json')))
+                       if name not in profiles)
+    profile_report = {}
+    for size in args.sizes:
+        parsed_resumes = make_parsed_resumes(size, seed=size)
+        started = time.perf_counter()
+        together = CriteriaEvaluator(profiles).classify_candidates(parsed_resumes)
+        one_pass_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        separate = {name: CriteriaEvaluator([name]).classify_candidates(parsed_resumes) for name in profiles}
+        separate_seconds = time.perf_counter() - started
+
+        for row, classification in enumerate(together):
+            summaries = classification.pop('profiles')
+            if classification != separate[profiles[0]][row] or any(
+                    summary['final_category'] != separate[name][row]['final_category']
+                    for name, summary in summaries.items()):
+                print(f"❌ {size} resumes: one-pass profile results differ from separate runs")
+                return False
+        profile_report[size] = {'one_pass_per_sec': round(size / one_pass_seconds, 1),
+                                'separate_per_sec': round(size / separate_seconds, 1)}
+    report['profiles'] = {'names': profiles, 'results': profile_report}
+
+    print(f"\n📊 resumes/sec (outputs identical for every combination)")
+    print(f"   {'resumes':>8}  {'combination':<22}{'per-resume':>14}{'batch':>14}{'arrays':>14}")
+    for size in args.sizes:
+        for combination, result in report[size].items():
+            print(f"   {size:>8}  {combination:<22}{result['per_resume_per_sec']:>14,.0f}"
+                  f"{result['batch_per_sec']:>14,.0f}{result['arrays_per_sec']:>14,.0f}")
+
+    print(f"\n📊 all profiles ({', '.join(profiles)}), resumes/sec")
+    print(f"   {'resumes':>8}{'one pass':>14}{'separate':>14}")
+    for size, result in profile_report.items():
+        print(f"   {size:>8}{result['one_pass_per_sec']:>14,.0f}{result['separate_per_sec']:>14,.0f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Report written to {args.output}")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
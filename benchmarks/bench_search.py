@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Search Benchmark for ATS Resume Checker
+Stores synthetic candidates (random CGPA, year, category, experience flags and
+~400 words of resume-like text mentioning e.g. Jessup or Khaitan in a
+fraction of them) in a scratch database through models.save_results, then
+times models.search_candidates for text queries, structured filters and
+both combined, reporting the median milliseconds per page (count included),
+the number of matches and the order used (relevance, or preference score
+past Config.SEARCH_RANK_LIMIT matches).
+
+Usage: python benchmarks/bench_search.py [--candidates 100000]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+import db_pool
+import models
+
+WORDS = ('law', 'university', 'student', 'research', 'contract', 'company', 'corporate', 'litigation',
+         'arbitration', 'intern', 'associate', 'drafting', 'memorandum', 'court', 'tribunal', 'securities',
+         'merger', 'acquisition', 'diligence', 'compliance', 'committee', 'society', 'journal', 'seminar',
+         'national', 'school', 'college', 'semester', 'cgpa', 'award', 'competition', 'debate', 'client')
+# Common legal words plus a long tail of rarer ones, drawn with Zipf-like frequencies
+VOCABULARY = WORDS + tuple(f"term{index}" for index in range(20000))
+CUMULATIVE_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(VOCABULARY))))
+# (term, share of resumes mentioning it)
+MENTIONS = (('Jessup', 0.03), ('Khaitan & Co', 0.08), ('Cyril Amarchand Mangaldas', 0.08),
+            ('AZB & Partners', 0.06), ('Vis Moot', 0.04), ('share purchase agreement', 0.1))
+FLAGS = ('moot_court', 'tier_firm_internship', 'ma_moot_experience', 'legal_research')
+CATEGORIES = ('ma_team_match', 'shortlisted', 'others')
+
+QUERIES = {
+    'text: Jessup Khaitan': {'text': 'Jessup Khaitan'},
+    'text: "share purchase agreement"': {'text': '"share purchase agreement"'},
+    'text: law (every resume)': {'text': 'law'},
+    'text: arbitra*': {'text': 'arbitra*'},
+    'cgpa>=8 + tier firm': {'cgpa_min': 8, 'experience': ['tier_firm_internship']},
+    'cgpa>=8, year 3-5, shortlisted': {'cgpa_min': 8, 'academic_years': [3, 4, 5], 'categories': ['shortlisted']},
+    'Khaitan + cgpa>=8 + year 4': {'text': 'Khaitan', 'cgpa_min': 8, 'academic_years': [4]},
+    'no filters, page 500': {'offset': 499 * Config.SEARCH_PAGE_SIZE},
+}
+
+
+def make_candidates(start, count, rng):
+    candidates = []
+    for position in range(start, start + count):
+        words = rng.choices(VOCABULARY, cum_weights=CUMULATIVE_WEIGHTS, k=400)
+        for term, share in MENTIONS:
+            if rng.random() < share:
+                words.insert(rng.randrange(len(words)), term)
+        experience = {flag: rng.random() < 0.3 for flag in FLAGS}
+        classification = {
+            'filename': f"resume_{position:06d}.pdf",
+            'cgpa': rng.choice([None, round(rng.uniform(5, 10), 2)]),
+            'academic_year': rng.choice([None, 1, 2, 3, 4, 5]),
+            'preference_score': rng.randrange(0, 200, 5),
+            'experience_summary': experience,
+            'final_category': rng.choice(CATEGORIES),
+        }
+        candidates.append((position, classification, {'text': ' '.join(words)}))
+    return candidates
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--candidates', type=int, default=100000)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    arg_parser.add_argument('--output', help='Optional path for a JSON report')
+    args = arg_parser.parse_args()
+
+    print("⏱️  Search Benchmark")
+    print("=" * 50)
+
+    scratch = tempfile.mkdtemp(prefix='ats-bench-search-')
+    Config.DATABASE_PATH = os.path.join(scratch, 'bench.db')
+    report = {'candidates': args.candidates, 'queries': {}}
+    try:
+        models.init_db()
+        rng = random.Random(0)
+        started = time.perf_counter()
+        for start in range(0, args.candidates, 5000):
+            chunk = make_candidates(start, min(5000, args.candidates - start), rng)
+            models.save_results([(f"job-{start // 1000}", 1, chunk)])
+        report['index_seconds'] = round(time.perf_counter() - started, 2)
+        print(f"📥 Indexed {args.candidates} candidates in {report['index_seconds']}s")
+
+        for name, query in QUERIES.items():
+            query = dict(query)
+            offset = query.pop('offset', 0)
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                total, results, order = models.search_candidates(1, limit=Config.SEARCH_PAGE_SIZE, offset=offset, **query)
+                timings.append((time.perf_counter() - started) * 1000)
+            report['queries'][name] = {'matches': total, 'returned': len(results), 'order': order,
+                                       'median_ms': round(statistics.median(timings), 2)}
+
+        print(f"\n📊 median ms per page of {Config.SEARCH_PAGE_SIZE} (with total count)")
+        print(f"   {'query':<36}{'matches':>10}{'ms':>10}  order")
+        for name, result in report['queries'].items():
+            print(f"   {name:<36}{result['matches']:>10}{result['median_ms']:>10.2f}  {result['order']}")
+    finally:
+        db_pool.close_connections()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Report written to {args.output}")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
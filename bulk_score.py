@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Bulk Resume Scoring for ATS Resume Checker
+Scores every PDF/DOCX resume in a directory (recursively) or an archive
+(.zip, .tar, .tar.gz) without going through the web app. Text extraction
+runs in a process pool across the machine's cores and BERT runs batched over
+each chunk of files; the next chunk is extracted while the current one is in
+BERT. Results stream to CSV or JSONL in the /export_results columns, with
+progress and throughput printed after every chunk.
+
+Progress is checkpointed after every chunk (OUTPUT.checkpoint). After a crash
+or Ctrl-C, run the same command with --resume to carry on where it stopped.
+
+Usage: python bulk_score.py INPUT -o results.csv [--format jsonl] [--resume]
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.utils import secure_filename
+from config import Config
+import archives
+from results_export import EXPORT_COLUMNS, export_row
+
+# Chunks parsed at once: one in BERT while the next is being extracted
+PIPELINE_DEPTH = 2
+
+
+class Checkpoint:
+    """Append-only progress log next to the output file
+
+    The first line records the run's settings; every later line records the
+    files finished by one chunk and the output size after writing them, so
+    a resumed run truncates any rows written after the last complete chunk.
+    """
+
+    def __init__(self, output_path, settings):
+        self.path = output_path + '.checkpoint'
+        self.settings = settings
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def load(self):
+        """(output size, names of finished files) from the last complete line"""
+        with open(self.path, encoding='utf-8') as f:
+            lines = f.read().split('\n')
+        settings = json.loads(lines[0])
+        if settings != self.settings:
+            changed = sorted(key for key in set(settings) | set(self.settings)
+                             if settings.get(key) != self.settings.get(key))
+            raise ValueError(f"Checkpoint was written with different settings ({', '.join(changed)})")
+
+        offset, done = 0, set()
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break  # A line cut short by a crash, and anything after it
+            offset = entry['offset']
+            done.update(entry['files'])
+        return offset, done
+
+    def start(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(self.settings) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def record(self, offset, names):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'offset': offset, 'files': names}) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def remove(self):
+        os.remove(self.path)
+
+
+def count_inputs(path):
+    """Number of resumes to score, or None when the input can't be counted cheaply"""
+    if os.path.isdir(path):
+        return sum(1 for _, _, files in os.walk(path) for filename in files if archives.is_resume(filename))
+    return archives.count_members(path)
+
+
+def iter_inputs(path, scratch, skip):
+    """Yield (name, file path) for each resume not in skip, in a stable order
+
+    Names are paths relative to the input directory, or member names inside
+    an archive. Archive members are copied into scratch one at a time; the
+    caller removes them once scored.
+    """
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for filename in sorted(files):
+                file_path = os.path.join(root, filename)
+                name = os.path.relpath(file_path, path)
+                if archives.is_resume(filename) and name not in skip:
+                    yield name, file_path
+        return
+
+    for index, (name, member) in enumerate(archives.iter_members(path)):
+        if name in skip:
+            continue
+        # Prefixed: members in different folders may share a file name
+        file_path = os.path.join(scratch, f"{index:06d}_{secure_filename(archives.member_filename(name))}")
+        with open(file_path, 'wb') as f:
+            shutil.copyfileobj(member, f)
+        yield name, file_path
+
+
+def format_seconds(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{seconds:02d}s" if hours else f"{minutes}m{seconds:02d}s"
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('input', help='Directory or archive (.zip, .tar, .tar.gz) of PDF/DOCX resumes')
+    arg_parser.add_argument('-o', '--output', required=True, help='Results file (.csv or .jsonl)')
+    arg_parser.add_argument('--format', choices=['csv', 'jsonl'],
+                            help='Output format (default: from the output file extension, else csv)')
+    arg_parser.add_argument('--course-type', choices=['5year', '3year'], default='5year')
+    arg_parser.add_argument('--internship-type', choices=['long_term', 'short_term'], default='long_term')
+    arg_parser.add_argument('--cgpa-minimum', type=float, default=Config.CGPA_MINIMUM)
+    arg_parser.add_argument('--batch-size', type=int, default=32, help='Files per chunk (one batched BERT pass each)')
+    arg_parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 1) - 1),
+                            help='Text extraction processes (default: all cores but one, which runs BERT)')
+    arg_parser.add_argument('--resume', action='store_true', help='Continue an interrupted run from its checkpoint')
+    args = arg_parser.parse_args()
+
+    if not os.path.isdir(args.input) and not (os.path.isfile(args.input) and archives.is_archive(args.input)):
+        print(f"ERROR: {args.input} is not a directory or a supported archive ({', '.join(archives.ARCHIVE_EXTENSIONS)})")
+        return False
+    output_format = args.format or ('jsonl' if args.output.lower().endswith(('.jsonl', '.json')) else 'csv')
+
+    checkpoint = Checkpoint(args.output, {
+        'input': os.path.abspath(args.input), 'format': output_format, 'course_type': args.course_type,
+        'internship_type': args.internship_type, 'cgpa_minimum': args.cgpa_minimum
+    })
+    offset, done = 0, set()
+    if args.resume and checkpoint.exists():
+        try:
+            offset, done = checkpoint.load()
+        except ValueError as e:
+            print(f"ERROR: {e}; rerun with the original options or without --resume")
+            return False
+    elif checkpoint.exists():
+        print(f"ERROR: {checkpoint.path} exists from an unfinished run; pass --resume to continue it, "
+              f"or delete it to start over")
+        return False
+
+    # Set before the parser (and its extraction pool) is created
+    Config.EXTRACTION_WORKERS = args.workers
+    from resume_parser import ResumeParser
+    import extraction_pool
+
+    print("📦 Bulk Resume Scoring")
+    print("=" * 50)
+    total = count_inputs(args.input)
+    print(f"📂 {args.input}: {total if total is not None else 'unknown number of'} resumes"
+          f"{f', {len(done)} already scored' if done else ''}")
+    print(f"⚙️  {args.workers} extraction workers, {args.batch_size} files per BERT batch, "
+          f"{args.course_type}/{args.internship_type}, CGPA minimum {args.cgpa_minimum:g}")
+
+    parser = ResumeParser()
+    evaluator = parser.criteria_evaluator
+
+    if done:
+        with open(args.output, 'r+b') as f:
+            f.truncate(offset)  # Drop rows from a chunk that never reached the checkpoint
+        output = open(args.output, 'a', encoding='utf-8', newline='')
+    else:
+        output = open(args.output, 'w', encoding='utf-8', newline='')
+        checkpoint.start()
+        if output_format == 'csv':
+            csv.writer(output).writerow(EXPORT_COLUMNS)
+    writer = csv.writer(output) if output_format == 'csv' else None
+
+    scratch = tempfile.mkdtemp(prefix='ats-bulk-')
+    started = time.perf_counter()
+    scored = errors = 0
+    categories = Counter()
+
+    def finish_chunk(chunk, parsed_resumes):
+        nonlocal scored, errors
+        scorable = []
+        for (name, file_path), parsed_resume in zip(chunk, parsed_resumes):
+            if 'error' in parsed_resume:
+                errors += 1
+                print(f"ERROR: {name}: {parsed_resume['error']}")
+            else:
+                parsed_resume['filename'] = name
+                scorable.append(parsed_resume)
+            if file_path.startswith(scratch):
+                os.remove(file_path)
+
+        if scorable:
+            for classification in evaluator.classify_candidates(
+                    scorable, args.course_type, args.internship_type, args.cgpa_minimum):
+                row = export_row(classification)
+                if writer:
+                    writer.writerow(row)
+                else:
+                    output.write(json.dumps(dict(zip(EXPORT_COLUMNS, row))) + '\n')
+                categories[classification['final_category']] += 1
+        output.flush()
+        os.fsync(output.fileno())
+        checkpoint.record(os.fstat(output.fileno()).st_size, [name for name, _ in chunk])
+        scored += len(scorable)
+
+        processed = scored + errors
+        elapsed = time.perf_counter() - started
+        rate = processed / elapsed if elapsed else 0.0
+        progress = f"{len(done) + processed:,}/{total:,}" if total is not None else f"{len(done) + processed:,}"
+        remaining = total - len(done) - processed if total is not None else None
+        eta = f"  ETA {format_seconds(remaining / rate)}" if remaining and rate else ''
+        print(f"📈 {progress} files  {rate:,.1f} files/s{eta}  ({errors} errors)", flush=True)
+
+    try:
+        inputs = iter_inputs(args.input, scratch, done)
+        with ThreadPoolExecutor(max_workers=PIPELINE_DEPTH) as executor:
+            in_flight = deque()
+            while True:
+                chunk = list(itertools.islice(inputs, args.batch_size))
+                if chunk:
+                    in_flight.append((chunk, executor.submit(parser.parse_resumes, [path for _, path in chunk])))
+                if in_flight and (len(in_flight) >= PIPELINE_DEPTH or not chunk):
+                    chunk_done, future = in_flight.popleft()
+                    finish_chunk(chunk_done, future.result())
+                if not chunk and not in_flight:
+                    break
+    except KeyboardInterrupt:
+        print(f"\n⏸️  Interrupted; run again with --resume to continue from the last checkpoint")
+        return False
+    finally:
+        output.close()
+        extraction_pool.shutdown()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    checkpoint.remove()
+    elapsed = time.perf_counter() - started
+    processed = scored + errors
+    print("=" * 50)
+    print(f"✅ Scored {scored:,} resumes ({errors} errors) in {format_seconds(elapsed)}: "
+          f"{processed / elapsed if elapsed else 0:,.1f} files/s")
+    for category, count in categories.most_common():
+        print(f"   {category}: {count:,}")
+    print(f"📄 Results written to {args.output}")
+    return True
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
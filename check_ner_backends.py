@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+NER Backend Parity Check for ATS Resume Checker
+Runs the sample resumes through the fp32 torch backend and a faster backend
+and compares extracted entities, confidence scores and inference time.
+
+Usage: python check_ner_backends.py [backend ...] [--folder uploads]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from collections import Counter
+from config import Config
+from model_registry import load_ner_model
+from resume_parser import ResumeParser
+
+# A backend passes when its entities agree this closely with fp32...
+MIN_ENTITY_F1 = 0.98
+# ...and its confidence score stays within this many percentage points
+MAX_CONFIDENCE_DELTA = 1.0
+
+
+def entity_f1(reference, candidate):
+    """F1 agreement between two entity lists, treating them as multisets of (token, label)"""
+    reference_counts = Counter(reference)
+    candidate_counts = Counter(candidate)
+    if not reference_counts and not candidate_counts:
+        return 1.0
+    overlap = sum((reference_counts & candidate_counts).values())
+    return 2 * overlap / (sum(reference_counts.values()) + sum(candidate_counts.values()))
+
+
+def run_backend(parser, texts):
+    """Run batched NER over texts and return (results, seconds)"""
+    started = time.perf_counter()
+    results = parser.process_texts_with_bert(texts)
+    return results, time.perf_counter() - started
+
+
+def load_texts(folder):
+    """Extract text from every PDF/DOCX sample in folder"""
+    parser = ResumeParser()
+    names, texts = [], []
+    for file_path in sorted(glob.glob(os.path.join(folder, '*'))):
+        if not file_path.lower().endswith(('.pdf', '.docx')):
+            continue
+        text, error = parser.extract_text(file_path)
+        if error:
+            print(f"   ⚠️  Skipping {os.path.basename(file_path)}: {error}")
+            continue
+        names.append(os.path.basename(file_path))
+        texts.append(text)
+    return names, texts
+
+
+def check_backend(backend_name, names, texts, reference, reference_seconds):
+    """Compare one backend against the fp32 reference results"""
+    parser = ResumeParser(load_ner_model(Config.NER_MODEL_NAME, backend_name))
+    if parser.ner_backend.name != backend_name:
+        print(f"❌ Backend '{backend_name}' could not be loaded")
+        return False
+
+    run_backend(parser, texts[:1])  # Warm-up
+    results, seconds = run_backend(parser, texts)
+
+    print(f"\n🔬 {backend_name} vs torch (fp32)")
+    worst_f1 = 1.0
+    worst_delta = 0.0
+    for name, (ref_entities, ref_confidence), (entities, confidence) in zip(names, reference, results):
+        f1 = entity_f1(ref_entities, entities)
+        delta = abs(confidence - ref_confidence)
+        worst_f1 = min(worst_f1, f1)
+        worst_delta = max(worst_delta, delta)
+        print(f"   📄 {name}: entity F1 {f1:.4f}, confidence {ref_confidence:.2f}% -> {confidence:.2f}% (Δ {delta:.2f})")
+
+    print(f"   ⏱️  {seconds:.2f}s vs {reference_seconds:.2f}s fp32 ({reference_seconds / seconds:.2f}x)")
+
+    passed = worst_f1 >= MIN_ENTITY_F1 and worst_delta <= MAX_CONFIDENCE_DELTA
+    if passed:
+        print(f"   ✅ Parity OK (worst F1 {worst_f1:.4f}, worst Δ {worst_delta:.2f})")
+    else:
+        print(f"   ❌ Parity FAILED (worst F1 {worst_f1:.4f} < {MIN_ENTITY_F1} "
+              f"or worst Δ {worst_delta:.2f} > {MAX_CONFIDENCE_DELTA})")
+    return passed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('backends', nargs='*', default=['torch_int8', 'onnx'])
+    arg_parser.add_argument('--folder', default=Config.UPLOAD_FOLDER)
+    args = arg_parser.parse_args()
+
+    print("🏁 NER Backend Parity Check")
+    print("=" * 50)
+
+    names, texts = load_texts(args.folder)
+    if not texts:
+        print("❌ No sample resumes found")
+        return False
+
+    reference_parser = ResumeParser(load_ner_model(Config.NER_MODEL_NAME, 'torch'))
+    run_backend(reference_parser, texts[:1])  # Warm-up
+    reference, reference_seconds = run_backend(reference_parser, texts)
+
+    all_passed = True
+    for backend_name in args.backends:
+        all_passed = check_backend(backend_name, names, texts, reference, reference_seconds) and all_passed
+
+    print("\n" + "=" * 50)
+    return all_passed
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
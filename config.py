@@ -9,11 +9,26 @@ class Config:
 
     # Database
     DATABASE_PATH = os.path.join('database', 'ats_system.db')
+    # Pooled SQLite connections (see db_pool): one per thread, WAL journal
+    SQLITE_BUSY_TIMEOUT = 10  # Seconds to wait for another writer's lock
+    SQLITE_CACHE_SIZE_KB = 16 * 1024  # Page cache per connection
+    SQLITE_CACHED_STATEMENTS = 256  # Prepared statements kept per connection
+    USER_CACHE_TTL = 60  # Seconds a loaded user is reused by Flask-Login (0 disables)
+    USER_CACHE_MAX_ENTRIES = 1000
 
     # File Upload
     UPLOAD_FOLDER = 'uploads'
     MAX_CONTENT_LENGTH = 100 * 1024 * 1024  # 100MB max file size
     ALLOWED_EXTENSIONS = {'pdf', 'docx'}
+    # .zip/.tar.gz uploads: members are extracted one at a time as the job reaches them (see archives)
+    ARCHIVE_MAX_MEMBERS = 5000  # Resumes per archive
+    ARCHIVE_MAX_MEMBER_SIZE = 20 * 1024 * 1024  # Larger members are rejected
+    ARCHIVE_MAX_TOTAL_SIZE = 1024 * 1024 * 1024  # Unpacked size of all resumes, against archive bombs
+    # Originals are kept once per content under uploads/blobs (see upload_store)
+    UPLOAD_RETENTION_DAYS = int(os.environ.get('UPLOAD_RETENTION_DAYS', 90))  # 0 keeps them forever
+    UPLOAD_MAX_STORAGE_MB = int(os.environ.get('UPLOAD_MAX_STORAGE_MB', 10 * 1024))  # Oldest batches go first; 0 for no cap
+    UPLOAD_GC_INTERVAL = 3600  # Seconds between storage clean-ups run by jobs
+    UPLOAD_GC_GRACE = 3600  # Seconds a new blob is kept even before anything refers to it
 
     # Session
     PERMANENT_SESSION_LIFETIME = timedelta(hours=2)
@@ -22,10 +37,68 @@ class Config:
     DEBUG = True
     HOST = '0.0.0.0'
     PORT = 5000
+    # Set LOG_LEVEL=DEBUG to print per-resume parsing details (text preview, entities, scores)
+    LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '1') == '1'  # Prometheus text format at /metrics
 
     # Resume Processing
-    MAX_FILES_PER_BATCH = 10
+    MAX_FILES_PER_BATCH = 200  # Batches are processed by background jobs (see job_queue)
+    JOB_WORKERS = 2  # Batches processed concurrently per web process
+    JOB_CHUNK_SIZE = 10  # Files parsed (and progress reported) per step
+    RESULT_WRITER_ENABLED = True  # One thread stores results for all jobs, sharing commits
+    RESULT_WRITER_MAX_ROWS = 5000  # Most results coalesced into one transaction
+    RESULT_WRITER_TIMEOUT = 300  # Seconds a job waits for its results to be stored before it fails
     TEXT_PREVIEW_LENGTH = 500
+    RESULTS_PAGE_SIZE = 50  # Candidates per category per results page
+    SEARCH_PAGE_SIZE = 20  # Candidates per /search page
+    SEARCH_RANK_LIMIT = 5000  # Text searches with more matches are ordered by preference score instead of relevance
+    CGPA_MINIMUM = 7.5  # Default for new batches; stored batches can be re-scored with another
+    # Criteria profiles (criteria/<name>.json, see rule_engine), all scored in one pass.
+    # The first decides the category; the others are summarised per candidate.
+    CRITERIA_PROFILES = os.environ.get('CRITERIA_PROFILES', 'ma_team').split(',')
+
+    # Text extraction: files per batch are extracted in a process pool
+    # 0 extracts in-process; the default leaves one core for the web process and BERT
+    EXTRACTION_WORKERS = int(os.environ.get('EXTRACTION_WORKERS', min(4, (os.cpu_count() or 1) - 1)))
+    EXTRACTION_TIMEOUT = 30  # Seconds allowed per file
+    # Stop reading PDF pages once the text would fill one NER window (about
+    # NER_WINDOW_SIZE * PDF_CHARS_PER_TOKEN characters). Off by default: CGPA,
+    # year and keyword checks then only see the start of long CVs.
+    PDF_EARLY_STOP = os.environ.get('PDF_EARLY_STOP', '0') == '1'
+    PDF_CHARS_PER_TOKEN = 6  # Generous upper bound for English WordPiece text
+    # PDF engines, fastest first; the next is tried when a result is empty or
+    # garbled. Engines that are not installed are skipped (see pdf_engines).
+    PDF_ENGINES = os.environ.get('PDF_ENGINES', 'pypdfium2,pypdf2,pdfminer,pdfplumber').split(',')
+
+    # Parse-result cache (keyed on file content hash + parser version)
+    PARSE_CACHE_ENABLED = True
+    PARSE_CACHE_PATH = os.path.join('database', 'parse_cache.db')
+    PARSE_CACHE_MAX_ENTRIES = 5000
+
+    # Near-duplicate detection (MinHash signatures in an LSH index, see near_duplicates)
+    NEAR_DUPLICATE_ENABLED = os.environ.get('NEAR_DUPLICATE_ENABLED', '1') == '1'
+    NEAR_DUPLICATE_INDEX_PATH = os.path.join('database', 'near_duplicates.db')
+    NEAR_DUPLICATE_THRESHOLD = 0.8  # Estimated Jaccard similarity of word shingles
+    NEAR_DUPLICATE_SHINGLE_WORDS = 3
+    NEAR_DUPLICATE_PERMUTATIONS = 128
+    NEAR_DUPLICATE_BANDS = 16  # 8 rows per band: pairs at 0.8 similarity share a band 95% of the time
+    NEAR_DUPLICATE_MAX_CANDIDATES = 50  # Per band, most recent first
+    # BERT output only feeds the confidence shown with results, never the
+    # classification, so a near-duplicate's can be reused instead of running NER
+    NEAR_DUPLICATE_SKIP_NER = True
+
+    # BERT NER
+    NER_MODEL_NAME = os.environ.get('NER_MODEL_NAME', 'dslim/bert-base-NER')
+    # Load the model at startup (in the background for `python app.py`, in the
+    # gunicorn master before forking) instead of on the first upload
+    NER_WARM_UP_ON_START = os.environ.get('NER_WARM_UP_ON_START', '1') == '1'
+    # Inference backend: 'torch' (fp32), 'torch_int8' (dynamic quantization) or 'onnx'
+    NER_BACKEND = os.environ.get('NER_BACKEND', 'torch')
+    NER_ONNX_PATH = os.path.join('models', os.path.basename(NER_MODEL_NAME.rstrip('/')) + '.onnx')  # Exported on first use
+    NER_BATCH_SIZE = 16  # Max token windows packed into one forward pass
+    NER_SLIDING_WINDOW = True  # Cover the full resume with overlapping windows
+    NER_WINDOW_SIZE = 512  # Tokens per window (model maximum is 512)
+    NER_WINDOW_STRIDE = 128  # Tokens shared between consecutive windows
 
     # Legal Firm Classifications (Tier 1/2 firms for preference scoring)
     TIER_1_FIRMS = [
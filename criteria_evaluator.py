@@ -1,213 +1,126 @@
+import numpy as np
+import rule_engine
+
+
 class CriteriaEvaluator:
-    def __init__(self):
-        self.long_term_criteria = [
-            'academic_year_valid',
-            'cgpa_sufficient', 
-            'company_law_taken',
-            'contract_law_taken',
-            'legal_research_experience'
-        ]
-
-        self.short_term_criteria = [
-            'academic_year_valid',
-            'cgpa_sufficient'
-        ]
-
-        self.preference_criteria = [
-            'moot_court_experience',
-            'tier_firm_internship',
-            'ma_moot_experience', 
-            'publications',
-            'faculty_recommendation',
-            'legalogic_previous'
-        ]
-
-    def evaluate_academic_year(self, academic_year, course_type="5year"):
-        """Evaluate if academic year meets requirements"""
-        if academic_year is None:
-            return False
-
-        if course_type == "5year":
-            return academic_year in [3, 4, 5]  # 3rd, 4th, or 5th year
-        else:  # 3year course
-            return academic_year in [2, 3]     # 2nd or 3rd year
-
-    def evaluate_cgpa(self, cgpa, minimum=7.5):
-        """Evaluate if CGPA meets minimum requirement"""
-        if cgpa is None:
-            return False
-        return cgpa >= minimum
-
-    def evaluate_long_term_eligibility(self, parsed_resume, course_type="5year"):
+    def __init__(self, profiles=None):
+        # Criteria, weights and category rules come from declarative profiles
+        # (criteria/*.json, see rule_engine); the first profile is the primary one
+        self.rules = rule_engine.compile_profiles(profiles)
+        self.profile = self.rules.primary
+
+    def evaluate(self, parsed_resume, evaluation, course_type="5year", cgpa_minimum=None):
+        """One evaluation (e.g. long_term) of the primary profile"""
+        classification = self.profile.classify(
+            parsed_resume, self.rules.features(parsed_resume),
+            self.profile.params(course_type, None, {'cgpa_minimum': cgpa_minimum})
+        )
+        return classification[f"{evaluation}_evaluation"]
+
+    def evaluate_long_term_eligibility(self, parsed_resume, course_type="5year", cgpa_minimum=None):
         """Evaluate eligibility for long-term internship"""
-        score = 0
-        max_score = 400  # 100 points each for 4 criteria
-        criteria_met = {}
+        return self.evaluate(parsed_resume, 'long_term', course_type, cgpa_minimum)
 
-        # Academic Year (100 points)
-        academic_valid = self.evaluate_academic_year(
-            parsed_resume.get('academic_year'), course_type
-        )
-        criteria_met['academic_year'] = academic_valid
-        if academic_valid:
-            score += 100
-
-        # CGPA (100 points)
-        cgpa_valid = self.evaluate_cgpa(parsed_resume.get('cgpa'))
-        criteria_met['cgpa'] = cgpa_valid
-        if cgpa_valid:
-            score += 100
-
-        # Company Law (100 points)
-        company_law = parsed_resume.get('company_law', False)
-        criteria_met['company_law'] = company_law
-        if company_law:
-            score += 100
-
-        # Contract Law (100 points)
-        contract_law = parsed_resume.get('contract_law', False)
-        criteria_met['contract_law'] = contract_law
-        if contract_law:
-            score += 100
-
-        # Legal Research Experience (bonus for scoring)
-        legal_research = parsed_resume.get('experience', {}).get('legal_research', False)
-        criteria_met['legal_research'] = legal_research
-
-        return {
-            'eligible': score == max_score,  # Must meet ALL criteria
-            'score': score,
-            'max_score': max_score,
-            'percentage': (score / max_score) * 100,
-            'criteria_met': criteria_met,
-            'category': 'long_term'
-        }
-
-    def evaluate_short_term_eligibility(self, parsed_resume, course_type="5year"):
+    def evaluate_short_term_eligibility(self, parsed_resume, course_type="5year", cgpa_minimum=None):
         """Evaluate eligibility for short-term internship"""
-        score = 0
-        max_score = 200  # 100 points each for 2 criteria
-        criteria_met = {}
-
-        # Academic Year (100 points) - can be relaxed in exceptional circumstances
-        academic_valid = self.evaluate_academic_year(
-            parsed_resume.get('academic_year'), course_type
-        )
-        criteria_met['academic_year'] = academic_valid
-        if academic_valid:
-            score += 100
-
-        # CGPA (100 points) - can be relaxed in exceptional circumstances  
-        cgpa_valid = self.evaluate_cgpa(parsed_resume.get('cgpa'))
-        criteria_met['cgpa'] = cgpa_valid
-        if cgpa_valid:
-            score += 100
-
-        return {
-            'eligible': score >= 100,  # At least one criteria must be met (first criteria mandatory for shortlisting)
-            'score': score,
-            'max_score': max_score,
-            'percentage': (score / max_score) * 100,
-            'criteria_met': criteria_met,
-            'category': 'short_term'
-        }
+        return self.evaluate(parsed_resume, 'short_term', course_type, cgpa_minimum)
 
     def calculate_preference_score(self, parsed_resume):
         """Calculate additional preference score"""
-        preference_score = 0
-        preference_details = {}
-
-        experience = parsed_resume.get('experience', {})
-
-        # Moot Court Experience (50 points)
-        if experience.get('moot_court', False):
-            preference_score += 50
-            preference_details['moot_court'] = 50
-        else:
-            preference_details['moot_court'] = 0
-
-        # Check internships for tier 1/2 firms (40 points)
-        if experience.get('tier_firm_internship', False):
-            preference_score += 40
-            preference_details['tier_firm'] = 40
-        else:
-            preference_details['tier_firm'] = 0
-
-        # M&A Moot Court Experience (30 points)
-        if experience.get('ma_moot_experience', False):
-            preference_score += 30
-            preference_details['ma_moot'] = 30
-        else:
-            preference_details['ma_moot'] = 0
-
-        # Publications (30 points)
-        if len(experience.get('publications', [])) > 0:
-            preference_score += 30
-            preference_details['publications'] = 30
-        else:
-            preference_details['publications'] = 0
-
-        # Faculty Recommendation (20 points)
-        if experience.get('faculty_recommendation', False):
-            preference_score += 20
-            preference_details['faculty_rec'] = 20
-        else:
-            preference_details['faculty_rec'] = 0
-
-        # Previous LegaLogic Internship (25 points)
-        if experience.get('legalogic_previous', False):
-            preference_score += 25
-            preference_details['legalogic_previous'] = 25
-        else:
-            preference_details['legalogic_previous'] = 0
-
-        return preference_score, preference_details
-
-    def classify_candidate(self, parsed_resume, course_type="5year", internship_type="long_term"):
-        """Main classification function"""
-        # Evaluate for long-term internship
-        long_term_eval = self.evaluate_long_term_eligibility(parsed_resume, course_type)
-
-        # Evaluate for short-term internship
-        short_term_eval = self.evaluate_short_term_eligibility(parsed_resume, course_type)
-
-        # Calculate preference score
-        preference_score, preference_details = self.calculate_preference_score(parsed_resume)
-
-        # Determine final classification
-        classification = {
-            'filename': parsed_resume.get('filename', 'unknown'),
-            'cgpa': parsed_resume.get('cgpa'),
-            'academic_year': parsed_resume.get('academic_year'),
-            'long_term_evaluation': long_term_eval,
-            'short_term_evaluation': short_term_eval,
-            'preference_score': preference_score,
-            'preference_details': preference_details,
-            'experience_summary': parsed_resume.get('experience', {}),
-            'final_category': 'others'  # Default category
-        }
-
-        # Classify based on evaluations and internship type preference
-        if internship_type == "long_term":
-            if long_term_eval['eligible']:
-                classification['final_category'] = 'ma_team_match'
-            elif short_term_eval['eligible']:
-                classification['final_category'] = 'shortlisted'
-        else:  # short_term
-            if short_term_eval['eligible']:
-                classification['final_category'] = 'shortlisted'
-            # Long-term eligible candidates are also good for short-term
-            elif long_term_eval['eligible']:
-                classification['final_category'] = 'ma_team_match'
-
-        # First criteria mandatory for shortlisting (academic year check)
-        if not long_term_eval['criteria_met'].get('academic_year', False) and \
-           not short_term_eval['criteria_met'].get('academic_year', False):
-            # If academic year doesn't meet either criteria, check if other factors compensate
-            if preference_score >= 70:  # High preference score might compensate
-                classification['final_category'] = 'shortlisted'
-                classification['special_consideration'] = 'High preference score despite academic year requirement'
-            else:
-                classification['final_category'] = 'others'
-
+        return self.profile.preference(self.rules.features(parsed_resume))
+
+    def classify_candidate(self, parsed_resume, course_type="5year", internship_type="long_term", cgpa_minimum=None):
+        """Main classification function
+
+        Every configured profile is scored in the same pass; the primary
+        profile's classification is returned, with the others summarised
+        under 'profiles' when there are any.
+        """
+        classifications = self.rules.classify(parsed_resume, course_type, internship_type, cgpa_minimum=cgpa_minimum)
+        return self._merge(classifications)
+
+    def classify_candidates(self, parsed_resumes, course_type="5year", internship_type="long_term", cgpa_minimum=None):
+        """classify_candidate for many resumes at once, returning the same dicts in the same order"""
+        batch = self.classify_batch(self.to_columns(parsed_resumes), course_type, internship_type, cgpa_minimum)
+        classifications = self.profile.classifications(parsed_resumes, batch[self.profile.name])
+
+        # Other profiles only need their category and preference score per candidate
+        others = [(name, profile.label, profile.category_names[batch[name]['category']].tolist(),
+                   batch[name]['preference_score'].tolist())
+                  for name, profile in self.rules.profiles.items() if profile is not self.profile]
+        if others:
+            for row, classification in enumerate(classifications):
+                classification['profiles'] = {
+                    name: {'label': label, 'final_category': categories[row], 'preference_score': preference[row]}
+                    for name, label, categories, preference in others
+                }
+        return classifications
+
+    def to_columns(self, parsed_resumes):
+        """Columnar view of parsed resumes for classify_batch
+
+        One array per field the profiles read: numbers as floats with NaN
+        where missing, flags as booleans.
+        """
+        return self.rules.columns(parsed_resumes)
+
+    def classify_batch(self, columns, course_type="5year", internship_type="long_term", cgpa_minimum=None):
+        """Vectorized classification of a columnar batch (see to_columns)
+
+        Returns {profile name: arrays}; see rule_engine.Profile.classify_columns.
+        """
+        return self.rules.classify_batch(columns, course_type, internship_type, cgpa_minimum=cgpa_minimum)
+
+    def classification_patches(self, batch, rows):
+        """Changed values of stored classifications for the selected rows of a classify_batch result
+
+        Returns (final categories, special considerations or None, [(JSON path,
+        values)]), covering every value in a classify_candidate dict that
+        depends on the criteria parameters.
+        """
+        profile = self.profile
+        result = batch[profile.name]
+        notes = np.where(result['special_consideration'][rows],
+                         profile.exception.get('note', '') if profile.exception else '', None)
+
+        patches = []
+        for evaluation in profile.evaluations:
+            prefix = f"$.{evaluation.key}"
+            score = result['evaluations'][evaluation.name]['score'][rows]
+            patches.append((f"{prefix}.eligible", result['evaluations'][evaluation.name]['eligible'][rows].tolist()))
+            patches.append((f"{prefix}.score", score.tolist()))
+            patches.append((f"{prefix}.percentage", (score / evaluation.max_score * 100).tolist()))
+            for criterion in evaluation.reported:
+                patches.append((f"{prefix}.criteria_met.{criterion}", result['criteria'][criterion][rows].tolist()))
+        for name, other in self.rules.profiles.items():
+            if other is not profile:
+                patches.append((f"$.profiles.{name}.final_category",
+                                other.category_names[batch[name]['category'][rows]].tolist()))
+
+        return profile.category_names[result['category'][rows]].tolist(), notes.tolist(), patches
+
+    def changed_rows(self, batch, previous):
+        """Indexes of rows whose classification differs between two classify_batch results"""
+        changed = None
+        for name, result in batch.items():
+            before = previous[name]
+            # Scores and eligibility follow from the criteria met
+            differs = (result['category'] != before['category']) | \
+                      (result['special_consideration'] != before['special_consideration'])
+            for criterion, met in result['criteria'].items():
+                differs |= met != before['criteria'][criterion]
+            changed = differs if changed is None else changed | differs
+        return np.flatnonzero(changed) if changed is not None else np.array([], dtype=np.int64)
+
+    def _merge(self, classifications):
+        classification = classifications[self.profile.name]
+        if len(classifications) > 1:
+            classification['profiles'] = {
+                name: {
+                    'label': self.rules.profiles[name].label,
+                    'final_category': other['final_category'],
+                    'preference_score': other['preference_score']
+                }
+                for name, other in classifications.items() if name != self.profile.name
+            }
         return classification
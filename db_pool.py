@@ -0,0 +1,49 @@
+"""
+Pooled SQLite connections
+Each thread keeps one open connection per database file instead of calling
+sqlite3.connect for every query. Connections run in WAL mode, so page loads
+keep reading while a background job writes, and they reuse sqlite3's
+per-connection prepared-statement cache. Connections are reopened after a
+fork (e.g. Gunicorn workers forked from a preloaded master), because a
+SQLite handle must not be shared across processes.
+"""
+
+import os
+import sqlite3
+import threading
+from config import Config
+
+_local = threading.local()
+
+
+def _open(db_path):
+    conn = sqlite3.connect(db_path, timeout=Config.SQLITE_BUSY_TIMEOUT,
+                           cached_statements=Config.SQLITE_CACHED_STATEMENTS)
+    conn.execute('PRAGMA journal_mode = WAL')
+    # NORMAL is durable in WAL mode except for the last commits on power loss
+    conn.execute('PRAGMA synchronous = NORMAL')
+    conn.execute(f'PRAGMA cache_size = {-int(Config.SQLITE_CACHE_SIZE_KB)}')  # Negative means KiB
+    conn.execute('PRAGMA temp_store = MEMORY')
+    return conn
+
+
+def get_connection(db_path=None):
+    """This thread's connection to db_path (default: the application database)"""
+    db_path = db_path or Config.DATABASE_PATH
+    if getattr(_local, 'pid', None) != os.getpid():
+        # First use in this thread, or inherited from the parent process across a fork
+        _local.pid = os.getpid()
+        _local.connections = {}
+
+    conn = _local.connections.get(db_path)
+    if conn is None:
+        conn = _local.connections[db_path] = _open(db_path)
+    return conn
+
+
+def close_connections():
+    """Close this thread's connections (they are reopened on next use)"""
+    if getattr(_local, 'pid', None) == os.getpid():
+        for conn in _local.connections.values():
+            conn.close()
+    _local.connections = {}
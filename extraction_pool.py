@@ -0,0 +1,220 @@
+"""
+Parallel text extraction for upload batches
+PDF/DOCX extraction is CPU-bound pure Python, so a batch is fanned out over a
+process pool. Every file gets its own timeout; when a pathological file hangs,
+the pool is recycled and the rest of the batch carries on.
+
+The pool is shared by every caller in the process (concurrent jobs, the bulk
+scorer's pipeline), so files are dispatched against one set of slots, one per
+worker: a file's timeout starts when a worker is free to run it, never while
+it waits behind another caller's files. Files lost when the pool is recycled
+for someone else's hung file are dispatched again rather than failed, and
+files in flight when a worker crashes are retried one by one in a process of
+their own, so only the file that crashes it is reported.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, CancelledError, ProcessPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from config import Config
+import metrics
+
+_pool = None
+_generation = 0  # Bumped whenever the pool is replaced
+_killed_generations = set()  # Pools recycled on purpose; their lost files are dispatched again
+_slots = None  # One per worker, shared by every caller
+_pool_lock = threading.Lock()
+_worker_parser = None
+
+
+def _init_worker():
+    global _worker_parser
+    # Workers only extract text: skip opening the parse cache and loading the near-duplicate index
+    Config.PARSE_CACHE_ENABLED = False
+    Config.NEAR_DUPLICATE_ENABLED = False
+    from resume_parser import ResumeParser
+    _worker_parser = ResumeParser()
+
+
+def _extract_in_worker(file_path):
+    # Timed here and reported back: the worker's own metrics never reach /metrics
+    started = time.perf_counter()
+    result = _worker_parser.extract_resume(file_path)
+    return result, time.perf_counter() - started
+
+
+def _extract_in_process(parser, file_path):
+    with metrics.timer('extract'):
+        return parser.extract_resume(file_path)
+
+
+def _worker_ready():
+    return os.getpid()
+
+
+def _new_pool(workers):
+    # spawn rather than fork: the web process is threaded and may hold torch threads
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker
+    )
+    # Start every worker up front so process start-up never counts against a file's timeout
+    wait([pool.submit(_worker_ready) for _ in range(workers)])
+    return pool
+
+
+def _kill_pool(pool):
+    for process in list((getattr(pool, '_processes', None) or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _extract_isolated(file_path):
+    """Extract one file in a process of its own, returning (text, error, engine, keyword hits)"""
+    pool = _new_pool(1)
+    try:
+        result, seconds = pool.submit(_extract_in_worker, file_path).result(timeout=Config.EXTRACTION_TIMEOUT)
+        metrics.observe_stage('extract', seconds)
+        return result
+    except FutureTimeoutError:
+        return None, f"Text extraction timed out after {Config.EXTRACTION_TIMEOUT}s", None, None
+    except Exception as e:
+        return None, f"Could not extract text from file: {str(e)}", None, None
+    finally:
+        _kill_pool(pool)
+
+
+def _get_slots():
+    global _slots
+    with _pool_lock:
+        if _slots is None:
+            _slots = threading.BoundedSemaphore(Config.EXTRACTION_WORKERS)
+        return _slots
+
+
+def _get_pool():
+    """The shared pool and its generation"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = _new_pool(Config.EXTRACTION_WORKERS)
+        return _pool, _generation
+
+
+def _recycle_pool(generation, killed=True):
+    """Kill the pool (including any hung workers) so later files get fresh processes
+
+    Only if it is still the given generation: another caller may have
+    replaced it already. killed marks a deliberate recycle, whose lost files
+    are simply dispatched again.
+    """
+    global _pool, _generation
+    with _pool_lock:
+        if killed:
+            _killed_generations.add(generation)
+        if _pool is not None and _generation == generation:
+            _kill_pool(_pool)
+            _pool = None
+            _generation += 1
+
+
+def shutdown():
+    global _pool, _generation
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+            _pool = None
+            _generation += 1
+
+
+def extract_texts(parser, file_paths):
+    """Extract text for every file, returning a list of (text, error, engine, keyword hits) in input order
+
+    Files are paths or in-memory (filename, bytes); the bytes are sent to the
+    workers. Keyword hits are found while a PDF's pages are read (see
+    ResumeParser.extract_resume), in the worker.
+    """
+    if Config.EXTRACTION_WORKERS <= 0 or len(file_paths) <= 1:
+        return [_extract_in_process(parser, file_path) for file_path in file_paths]
+
+    timeout = Config.EXTRACTION_TIMEOUT
+    slots = _get_slots()
+    results = [None] * len(file_paths)
+    queued = list(range(len(file_paths)))
+    in_flight = {}  # future -> (index, deadline, pool generation)
+    crashed = []  # Files in flight when a worker died, retried one by one
+
+    def lost(future, cancelled=False):
+        """Put a file back in the queue if it never ran or its pool was recycled on purpose; True if so"""
+        index, _, generation = in_flight.pop(future)
+        slots.release()
+        if cancelled or generation in _killed_generations:
+            queued.insert(0, index)
+            return True
+        return False
+
+    try:
+        while queued or in_flight:
+            # Take a free worker for each file; with nothing in flight, wait until another caller frees one
+            while queued and slots.acquire(timeout=None if not in_flight else 0):
+                index = queued.pop(0)
+                try:
+                    pool, generation = _get_pool()
+                    future = pool.submit(_extract_in_worker, file_paths[index])
+                except Exception:
+                    slots.release()
+                    queued.insert(0, index)
+                    raise
+                in_flight[future] = (index, time.monotonic() + timeout, generation)
+
+            next_deadline = min(deadline for _, deadline, _ in in_flight.values())
+            done, _ = wait(in_flight, timeout=max(0.0, next_deadline - time.monotonic()),
+                           return_when=FIRST_COMPLETED)
+
+            for future in done:
+                index, _, generation = in_flight[future]
+                try:
+                    results[index], seconds = future.result()
+                except CancelledError:
+                    lost(future, cancelled=True)
+                    continue
+                except BrokenProcessPool:
+                    if not lost(future):
+                        # A worker died (e.g. a crashing native library), taking everything in flight with it
+                        crashed.append(index)
+                        _recycle_pool(generation, killed=False)
+                    continue
+                except Exception as e:
+                    results[index] = (None, f"Could not extract text from file: {str(e)}", None, None)
+                else:
+                    metrics.observe_stage('extract', seconds)
+                in_flight.pop(future)
+                slots.release()
+
+            now = time.monotonic()
+            for future in [future for future, (_, deadline, _) in in_flight.items() if deadline <= now]:
+                index, _, generation = in_flight[future]
+                if lost(future):
+                    continue  # Its pool was recycled by another caller
+                results[index] = (None, f"Text extraction timed out after {timeout}s", None, None)
+                file_path = file_paths[index]
+                filename = file_path[0] if isinstance(file_path, tuple) else os.path.basename(file_path)
+                print(f"ERROR: Extraction of {filename} timed out")
+                # A hung worker can't be cancelled; replace the pool. Files still in
+                # flight in it (this caller's or another's) come back and are dispatched again
+                _recycle_pool(generation)
+        for index in crashed:
+            with slots:
+                results[index] = _extract_isolated(file_paths[index])
+            if results[index][1]:
+                print(f"ERROR: Extraction of {file_paths[index][0] if isinstance(file_paths[index], tuple) else os.path.basename(file_paths[index])} failed in a process of its own: {results[index][1]}")
+    finally:
+        for _ in in_flight:
+            slots.release()  # Left in flight by an exception
+
+    return results
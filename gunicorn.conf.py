@@ -0,0 +1,52 @@
+"""
+Gunicorn settings for production deploys
+The app (and, with NER_WARM_UP_ON_START, the BERT NER model's weights) is
+loaded once in the master process and shared copy-on-write with every forked
+worker. Nothing is run through the model in the master: torch starts its
+thread pools on the first inference, and a forked child can deadlock on a
+pool inherited from its parent, so each worker runs its own warm-up.
+"""
+
+import gc
+import os
+from config import Config
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5001)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+preload_app = True
+
+
+# torch's thread count in the master before it was pinned to one for loading
+_torch_threads = None
+
+
+def on_starting(server):
+    global _torch_threads
+    # ONNX Runtime sessions start their own threads, which a fork does not carry over
+    if Config.NER_WARM_UP_ON_START and Config.NER_BACKEND != 'onnx':
+        import torch
+        import model_registry
+        # Quantizing the model runs torch ops; keep them from starting a thread pool here
+        _torch_threads = torch.get_num_threads()
+        torch.set_num_threads(1)
+        model_registry.get_ner_model()  # Weights only; see post_worker_init
+
+
+def post_worker_init(worker):
+    if _torch_threads is not None:
+        import torch
+        torch.set_num_threads(_torch_threads)
+    if Config.NER_WARM_UP_ON_START:
+        import model_registry
+        model_registry.warm_up()  # Loads the model first if the master did not
+
+
+def pre_fork(server, worker):
+    # SQLite handles must not cross a fork; workers open their own (see db_pool)
+    import db_pool
+    db_pool.close_connections()
+
+    # Move everything loaded so far out of the GC's reach so collections in the
+    # workers don't write to (and un-share) the inherited pages
+    gc.freeze()
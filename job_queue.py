@@ -0,0 +1,250 @@
+"""
+Background processing of resume batches
+/upload only reads the files and submits a job; a worker thread parses and
+classifies them in chunks, recording per-file progress in the jobs tables so
+any web worker can answer /jobs/<id> polls. Each chunk's classifications are
+written to the candidates and processing_logs tables as soon as they are
+ready, through a shared ResultWriter that coalesces concurrent jobs' writes.
+The parser's output is stored too, so a finished batch, or a user's whole
+candidate pool, can be re-scored under new criteria (rescore, rescore_all)
+without parsing the files again.
+
+Files are parsed from memory and written to the upload folder (for
+/view_pdf) in the background by upload_store. Uploaded archives are not
+unpacked up front: each member is read when its chunk comes up, so a batch
+never holds more than one chunk of members that have not been parsed yet.
+"""
+
+import itertools
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait, TimeoutError as FutureTimeoutError
+from datetime import datetime
+import numpy as np
+from config import Config
+import metrics
+import archives
+import upload_store
+from models import (create_job, update_job_files, set_job_status, save_results, get_job, count_candidates,
+                    get_candidate_features, update_classifications, get_finished_job_ids)
+from result_writer import ResultWriter
+
+
+class JobQueue:
+    def __init__(self, resume_parser, criteria_evaluator, max_workers=None):
+        self.resume_parser = resume_parser
+        self.criteria_evaluator = criteria_evaluator
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or Config.JOB_WORKERS, thread_name_prefix='resume-job'
+        )
+        self.result_writer = ResultWriter() if Config.RESULT_WRITER_ENABLED else None
+
+    def submit(self, user_id, saved_files, rejected_files, course_type, internship_type, archive_files=()):
+        """Queue a batch and return its job id
+
+        saved_files is a list of (filename, file contents) to process; rejected_files
+        a list of (filename, error) that failed before processing (e.g. bad format).
+        archive_files is a list of (archive_path, members) for uploaded archives,
+        members being the (member index, filename) from archives.accept_members;
+        they are processed after saved_files and the archive is deleted after.
+        """
+        job_id = uuid.uuid4().hex
+        files = [(filename, 'queued', None) for filename, _ in saved_files]
+        files += [(filename, 'queued', None) for _, members in archive_files for _, filename in members]
+        files += [(filename, 'error', error) for filename, error in rejected_files]
+        create_job(job_id, user_id, course_type, internship_type, files)
+
+        self.executor.submit(
+            self.run_job, job_id, user_id, saved_files, rejected_files, course_type, internship_type, archive_files
+        )
+        return job_id
+
+    def iter_files(self, saved_files, archive_files):
+        """Yield (filename, file contents) for each file of a batch, reading archive members as they are reached
+
+        The contents are None for a member that could not be read from its archive.
+        """
+        yield from saved_files
+        for archive_path, members in archive_files:
+            filenames = dict(members)
+            extracted = 0
+            try:
+                for index, (_, member) in enumerate(archives.iter_members(archive_path)):
+                    if index in filenames:
+                        data = member.read()  # At most ARCHIVE_MAX_MEMBER_SIZE, checked on upload
+                        extracted += 1
+                        yield filenames[index], data
+            except Exception as e:
+                print(f"ERROR: Exception reading archive {os.path.basename(archive_path)}: {str(e)}")  # Log exception
+                for _, filename in members[extracted:]:
+                    yield filename, None
+            finally:
+                if os.path.exists(archive_path):
+                    os.remove(archive_path)
+
+    def run_job(self, job_id, user_id, saved_files, rejected_files, course_type, internship_type, archive_files=()):
+        processed_files = 0
+        error_files = [f"{filename}: {error}" for filename, error in rejected_files]
+        files = self.iter_files(saved_files, archive_files)
+        stored = []  # Originals being written for /view_pdf
+
+        try:
+            set_job_status(job_id, 'running')
+            chunk_size = max(1, Config.JOB_CHUNK_SIZE)
+
+            for start in itertools.count(0, chunk_size):
+                chunk = list(itertools.islice(files, chunk_size))
+                if not chunk:
+                    break
+                update_job_files(job_id, [(start + offset, 'processing', None) for offset in range(len(chunk))])
+                stored += [upload_store.save(job_id, filename, data) for filename, data in chunk if data is not None]
+
+                try:
+                    parsed = iter(self.resume_parser.parse_resumes(
+                        [entry for entry in chunk if entry[1] is not None], user_id
+                    ))
+                    parsed_resumes = [next(parsed) if data is not None else {'error': "Could not be read from the archive"}
+                                      for _, data in chunk]
+                except Exception as e:
+                    parsed_resumes = [{'error': f"Processing error - {str(e)}"}] * len(chunk)
+                    print(f"ERROR: Exception parsing batch: {str(e)}")  # Log exception
+
+                updates = []
+                candidates = []
+                for offset, ((filename, _), parsed_resume) in enumerate(zip(chunk, parsed_resumes)):
+                    classification, error = self.classify(filename, parsed_resume, course_type, internship_type)
+                    if error:
+                        error_files.append(f"{filename}: {error}")
+                    else:
+                        candidates.append((start + offset, classification, parsed_resume))
+                    updates.append((start + offset, 'error' if error else 'done', error))
+
+                # Store the chunk's results before reporting its files as done
+                if candidates:
+                    if self.result_writer:
+                        try:
+                            self.result_writer.write(job_id, user_id, candidates).result(
+                                timeout=Config.RESULT_WRITER_TIMEOUT)
+                        except FutureTimeoutError:
+                            raise RuntimeError(f"Results were not stored within {Config.RESULT_WRITER_TIMEOUT}s")
+                    else:
+                        save_results([(job_id, user_id, candidates)])
+                processed_files += len(candidates)
+                update_job_files(job_id, updates)
+
+            # Results link to the originals, so they are stored before the job is done
+            for future in wait(stored).done:
+                if future.exception():
+                    print(f"ERROR: Exception storing upload: {str(future.exception())}")  # Log exception
+            upload_store.maybe_collect_garbage()
+
+            summary = {
+                'total_files': len(saved_files) + sum(len(members) for _, members in archive_files) + len(rejected_files),
+                'processed_files': processed_files,
+                'error_files': error_files,
+                'course_type': course_type,
+                'internship_type': internship_type,
+                'cgpa_minimum': Config.CGPA_MINIMUM,
+                'processed_time': datetime.now().isoformat()
+            }
+            set_job_status(job_id, 'done', summary=summary)
+
+        except Exception as e:
+            print(f"ERROR: Job {job_id} failed: {str(e)}")  # Log exception
+            set_job_status(job_id, 'failed', error=str(e))
+        finally:
+            files.close()
+            for archive_path, _ in archive_files:
+                if os.path.exists(archive_path):  # One the job failed before reaching
+                    os.remove(archive_path)
+
+    def classify(self, filename, parsed_resume, course_type, internship_type):
+        """Classify one parsed resume, returning (classification, None) or (None, error message)"""
+        try:
+            if 'error' in parsed_resume:
+                print(f"ERROR: Resume parsing error for {filename}: {parsed_resume['error']}")  # Log error
+                return None, parsed_resume['error']
+
+            # Evaluate criteria
+            with metrics.timer('scoring'):
+                classification = self.criteria_evaluator.classify_candidate(
+                    parsed_resume, course_type, internship_type, Config.CGPA_MINIMUM
+                )
+            classification['bert_confidence'] = parsed_resume.get('bert_confidence')  # Add BERT confidence
+            classification['text_engine'] = parsed_resume.get('text_engine')  # Which extractor read the file
+            if parsed_resume.get('duplicate_group'):
+                classification['duplicate_group'] = parsed_resume['duplicate_group']  # See near_duplicates
+            if parsed_resume.get('near_duplicate'):
+                classification['near_duplicate'] = parsed_resume['near_duplicate']  # Closest earlier version
+            classification['upload_time'] = datetime.now().isoformat()
+            return classification, None
+
+        except Exception as e:
+            print(f"ERROR: Exception processing {filename}: {str(e)}")  # Log exception
+            return None, f"Processing error - {str(e)}"
+
+    def rescore(self, job, course_type, internship_type, cgpa_minimum):
+        """Re-classify a finished batch under new criteria from its stored parser output
+
+        Only CriteriaEvaluator.classify_batch runs, over all of the batch's
+        candidates at once; files are not read again, and only candidates whose
+        classification changes are written. Returns (candidates re-scored,
+        candidates changed), or None if some candidates have no stored parser
+        output (batches processed before it was kept).
+        """
+        rules = self.criteria_evaluator.rules
+        features = get_candidate_features(job['id'], list(rules.fields.items()))
+        if not features or len(features) != sum(count_candidates(job['id']).values()):
+            return None
+
+        with metrics.timer('scoring'):
+            columns = rules.columns_from_rows([row[1:] for row in features])
+            batch = self.criteria_evaluator.classify_batch(columns, course_type, internship_type, cgpa_minimum)
+        positions = np.array([row[0] for row in features])
+
+        while True:
+            # The stored classifications were made under the batch's current criteria
+            current = self.criteria_evaluator.classify_batch(
+                columns, job['course_type'], job['internship_type'],
+                job['summary'].get('cgpa_minimum', Config.CGPA_MINIMUM)
+            )
+            changed = self.criteria_evaluator.changed_rows(batch, current)
+            categories, notes, patches = self.criteria_evaluator.classification_patches(batch, changed)
+            updates = list(zip(positions[changed].tolist(), categories, notes, *(values for _, values in patches)))
+
+            summary = dict(job['summary'],
+                           course_type=course_type,
+                           internship_type=internship_type,
+                           cgpa_minimum=cgpa_minimum,
+                           rescored_time=datetime.now().isoformat())
+            if update_classifications(job['id'], [path for path, _ in patches], updates,
+                                      course_type, internship_type, summary, job['summary']):
+                return len(features), len(updates)
+            job = get_job(job['id'])  # Re-scored by another request meanwhile; diff against its criteria
+
+    def rescore_all(self, user_id, course_type=None, internship_type=None, cgpa_minimum=None):
+        """Re-classify every finished batch in a user's candidate pool under new criteria
+
+        The pool is re-scored one batch at a time through rescore, so only one
+        batch's stored features are in memory and each batch is written in its
+        own transaction. Criteria left as None keep each batch's own. Returns
+        (candidates re-scored, candidates changed, batches skipped), skipped
+        batches being those processed before parser output was stored.
+        """
+        rescored = changed = skipped = 0
+        for job_id in get_finished_job_ids(user_id):
+            if not sum(count_candidates(job_id).values()):
+                continue  # Every file failed; nothing to re-score
+            job = get_job(job_id)
+            result = self.rescore(
+                job,
+                course_type or job['course_type'],
+                internship_type or job['internship_type'],
+                cgpa_minimum if cgpa_minimum is not None else job['summary'].get('cgpa_minimum', Config.CGPA_MINIMUM)
+            )
+            if result is None:
+                skipped += 1
+                continue
+            rescored += result[0]
+            changed += result[1]
+        return rescored, changed, skipped
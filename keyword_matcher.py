@@ -0,0 +1,130 @@
+"""
+Single-pass multi-keyword matcher
+All keyword sets are merged into one trie at construction time and the trie
+is compiled into a single regular expression, so one linear scan of the text
+finds every keyword of every category (an Aho-Corasick style automaton that
+runs inside the C regex engine instead of a per-character Python loop).
+Matches respect word boundaries (allowing a plural "s"/"es"), so "contracts"
+does not fire inside "subcontractors" while "case briefs" still counts as
+"case brief"; a firm's "& Co" also matches "& Company". Text extracted from
+some designer PDFs has almost no spaces ("reviewedsixcontracts"); for those,
+boundaries are meaningless and plain substring matching is used instead.
+"""
+
+import re
+
+# A keyword may only start/end where the neighbouring character is not a letter or digit
+_BOUNDARY_CHARS = 'a-z0-9'
+_WORD_END = f'(?:e?s)?(?![{_BOUNDARY_CHARS}])'
+_WORD_END_PATTERN = re.compile(_WORD_END)
+
+# Below this share of whitespace characters the text is treated as space-squashed
+SQUASHED_WHITESPACE_RATIO = 0.05
+
+
+class KeywordMatcher:
+    def __init__(self, keyword_sets):
+        """keyword_sets maps category name -> list of keywords"""
+        self.keyword_sets = {category: list(keywords) for category, keywords in keyword_sets.items()}
+
+        # Lowercased keyword -> [(category, keyword as written), ...]
+        self.owners = {}
+        for category, keywords in self.keyword_sets.items():
+            for keyword in keywords:
+                self.owners.setdefault(keyword.lower(), []).append((category, keyword))
+        # A firm name ending in "& Co" also matches the name written out ("Khaitan & Company")
+        for key in [key for key in self.owners if key.endswith(' co')]:
+            self.owners.setdefault(key + 'mpany', []).extend(self.owners[key])
+
+        # Keywords that are prefixes of a longer keyword; the regex reports the
+        # longest match at each position, so these are recovered separately
+        self.prefixes = {
+            key: [other for other in self.owners if other != key and key.startswith(other)]
+            for key in self.owners
+        }
+
+        trie = {}
+        for key in self.owners:
+            node = trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[''] = True  # Terminal marker
+
+        trie_regex = self._trie_to_regex(trie)
+        self.pattern = re.compile(f'(?<![{_BOUNDARY_CHARS}])(?=({trie_regex}){_WORD_END})')
+        self.substring_pattern = re.compile(f'(?=({trie_regex}))')
+
+    def _trie_to_regex(self, node):
+        """Compile a trie node into an alternation that prefers the longest keyword"""
+        terminal = '' in node
+        branches = [re.escape(char) + self._trie_to_regex(child)
+                    for char, child in sorted(node.items()) if char != '']
+        if not branches:
+            return ''
+
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if terminal:
+            body = ('(?:' + body + ')' if len(branches) == 1 else body) + '?'
+        return body
+
+    @staticmethod
+    def is_space_squashed(text):
+        whitespace = len(text) - len(''.join(text.split()))
+        return whitespace < len(text) * SQUASHED_WHITESPACE_RATIO
+
+    def find_all(self, text, word_boundaries=None):
+        """Scan text once and return {category: [(keyword, start, end), ...]} for every category
+
+        word_boundaries defaults to True unless the text looks space-squashed.
+        """
+        hits = {category: [] for category in self.keyword_sets}
+        if not self.owners or not text:
+            return hits
+
+        if word_boundaries is None:
+            word_boundaries = not self.is_space_squashed(text)
+        pattern = self.pattern if word_boundaries else self.substring_pattern
+
+        text_lower = text.lower()
+        for match in pattern.finditer(text_lower):
+            key = match.group(1)
+            start = match.start(1)
+            found = [key] + [prefix for prefix in self.prefixes[key]
+                             if not word_boundaries or _WORD_END_PATTERN.match(text_lower, start + len(prefix))]
+            for found_key in found:
+                for category, keyword in self.owners[found_key]:
+                    hits[category].append((keyword, start, start + len(found_key)))
+        return hits
+
+    def find_all_chunks(self, chunks, word_boundaries=None):
+        """Like find_all(''.join(chunks)), but scans each chunk as it arrives
+
+        Meant for streamed text such as PDF pages: every chunk must end with a
+        line break, which no keyword spans. Returns (text, hits); when the text
+        turns out to be space-squashed, it is rescanned with substring matching.
+        """
+        hits = {category: [] for category in self.keyword_sets}
+        parts = []
+        length = 0
+        whitespace = 0
+        scan = self.owners and word_boundaries is not False
+
+        for chunk in chunks:
+            if scan:
+                for category, chunk_hits in self.find_all(chunk, word_boundaries=True).items():
+                    hits[category].extend((keyword, start + length, end + length)
+                                          for keyword, start, end in chunk_hits)
+            parts.append(chunk)
+            length += len(chunk)
+            whitespace += len(chunk) - len(''.join(chunk.split()))
+
+        text = ''.join(parts)
+        squashed = whitespace < length * SQUASHED_WHITESPACE_RATIO
+        if word_boundaries is False or (word_boundaries is None and squashed):
+            hits = self.find_all(text, word_boundaries=False)
+        return text, hits
+
+    def found_keywords(self, hits, category):
+        """Distinct keywords of a category that were hit, in keyword-list order"""
+        found = {keyword for keyword, _, _ in hits.get(category, [])}
+        return [keyword for keyword in self.keyword_sets[category] if keyword in found]
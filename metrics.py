@@ -0,0 +1,175 @@
+"""
+Hot-path instrumentation for the resume pipeline
+Stages are timed with `with metrics.timer('regex'):` and aggregated into
+in-process histograms, rendered in the Prometheus text format at /metrics.
+Each process keeps its own numbers: under Gunicorn every worker reports only
+the batches it ran itself, and a scrape of /metrics reaches whichever worker
+takes the request, so counts are neither summed across workers nor stable
+between scrapes. Run a single worker, or scrape each worker, for whole-site
+numbers. The 'scoring' stage times criteria classification in the job queue;
+the preference score computed while parsing is not timed separately.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bounds in seconds; stages range from sub-millisecond regexes to multi-second extractions
+STAGE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    pairs = ','.join(
+        '{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in labels
+    )
+    return '{' + pairs + '}'
+
+
+def _format_value(value):
+    return repr(float(value))
+
+
+class Histogram:
+    def __init__(self, name, documentation, label_name, buckets=STAGE_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_name = label_name
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series = {}  # label value -> [bucket counts..., sum, count]
+
+    def observe(self, label_value, seconds):
+        with self._lock:
+            series = self._series.get(label_value)
+            if series is None:
+                series = self._series[label_value] = [0] * len(self.buckets) + [0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    series[index] += 1
+                    break
+            series[-2] += seconds
+            series[-1] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {label_value: list(series) for label_value, series in self._series.items()}
+
+        for label_value in sorted(snapshot):
+            series = snapshot[label_value]
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                labels = _format_labels([(self.label_name, label_value), ('le', _format_value(bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels([(self.label_name, label_value), ('le', '+Inf')])
+            lines.append(f"{self.name}_bucket{labels} {series[-1]}")
+            labels = _format_labels([(self.label_name, label_value)])
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{labels} {series[-1]}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name, documentation, label_name):
+        self.name = name
+        self.documentation = documentation
+        self.label_name = label_name
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, label_value, amount=1):
+        with self._lock:
+            self._values[label_value] = self._values.get(label_value, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            snapshot = dict(self._values)
+        for label_value in sorted(snapshot):
+            labels = _format_labels([(self.label_name, label_value)])
+            lines.append(f"{self.name}{labels} {snapshot[label_value]}")
+        return lines
+
+
+class Gauge:
+    def __init__(self, name, documentation, label_name=None):
+        self.name = name
+        self.documentation = documentation
+        self.label_name = label_name
+        self._lock = threading.Lock()
+        self._values = {}
+        self._function = None
+
+    def set(self, value, label_value=None):
+        with self._lock:
+            self._values[label_value] = value
+
+    def set_function(self, function):
+        """Read the value when scraped instead: function() returns a number"""
+        self._function = function
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        if self._function is not None:
+            snapshot = {None: self._function()}
+        else:
+            with self._lock:
+                snapshot = dict(self._values)
+        for label_value in sorted(snapshot, key=str):
+            labels = _format_labels([(self.label_name, label_value)] if label_value is not None else [])
+            lines.append(f"{self.name}{labels} {_format_value(snapshot[label_value])}")
+        return lines
+
+
+STAGE_SECONDS = Histogram(
+    'ats_stage_duration_seconds',
+    'Time spent in each resume pipeline stage (extract, minhash, tokenize, forward, regex, keywords, scoring).',
+    'stage'
+)
+RESUMES_PARSED = Counter(
+    'ats_resumes_parsed_total',
+    'Resumes handled by the parser, by outcome (parsed, cached, error; ner_reused counts parsed near-duplicates that skipped BERT).',
+    'outcome'
+)
+PARSE_CACHE_LOOKUPS = Counter(
+    'ats_parse_cache_lookups_total',
+    'Parse cache lookups, by result (hit, miss).',
+    'result'
+)
+PARSE_CACHE_ENTRIES = Gauge(
+    'ats_parse_cache_entries',
+    'Parsed resumes held in the parse cache.'
+)
+MODEL_LOAD_SECONDS = Gauge(
+    'ats_model_load_seconds',
+    'Time taken to load the NER model (tokenizer, weights and inference backend).',
+    'model'
+)
+REGISTRY = [STAGE_SECONDS, RESUMES_PARSED, PARSE_CACHE_LOOKUPS, PARSE_CACHE_ENTRIES, MODEL_LOAD_SECONDS]
+
+
+@contextmanager
+def timer(stage):
+    """Time the enclosed block and record it under stage"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.observe(stage, time.perf_counter() - started)
+
+
+def observe_stage(stage, seconds):
+    """Record a stage duration measured elsewhere (e.g. in an extraction worker process)"""
+    STAGE_SECONDS.observe(stage, seconds)
+
+
+def render_prometheus():
+    """All metrics in the Prometheus text exposition format"""
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
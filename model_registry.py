@@ -0,0 +1,72 @@
+"""
+Process-wide registry for the BERT NER model
+Loads the tokenizer and model lazily on first use (or explicitly via warm_up)
+and shares a single copy between every ResumeParser in the process.
+Under gunicorn with preload_app the model is loaded once in the master and
+inherited copy-on-write by each forked worker; the warm-up inference runs in
+each worker after the fork, so no torch thread pool is started in the master.
+The load time is reported at /metrics.
+"""
+
+import threading
+import time
+from config import Config
+import metrics
+import ner_backends
+
+_lock = threading.Lock()
+_ner_model = None
+
+
+class NerModel:
+    def __init__(self, name, tokenizer, model, backend):
+        self.name = name
+        self.tokenizer = tokenizer
+        self.model = model
+        self.backend = backend
+        self.label_list = model.config.id2label
+
+
+def get_ner_model():
+    """Return the shared NER model, loading it on first use"""
+    global _ner_model
+
+    if _ner_model is None:
+        with _lock:
+            if _ner_model is None:
+                _ner_model = load_ner_model(Config.NER_MODEL_NAME, Config.NER_BACKEND)
+    return _ner_model
+
+
+def load_ner_model(name, backend_name="torch"):
+    """Load tokenizer and model, wrap the model in an inference backend and time it"""
+    # Imported here so that importing the app does not pay for torch/transformers
+    from transformers import AutoTokenizer, AutoModelForTokenClassification
+
+    started = time.perf_counter()
+    tokenizer = AutoTokenizer.from_pretrained(name)
+    model = AutoModelForTokenClassification.from_pretrained(name)
+    model.eval()
+    backend = ner_backends.create_backend(backend_name, model)
+    load_seconds = time.perf_counter() - started
+
+    metrics.MODEL_LOAD_SECONDS.set(load_seconds, name)
+    print(f"✅ BERT NER model '{name}' ({backend.name} backend) loaded in {load_seconds:.2f}s")
+    return NerModel(name, tokenizer, model, backend)
+
+
+def warm_up():
+    """Load the model and run one tiny inference so the first upload is not slow"""
+    ner_model = get_ner_model()
+    started = time.perf_counter()
+    inputs = ner_model.tokenizer(["Warm up"], return_tensors="pt")
+    ner_model.backend.logits(dict(inputs))
+    print(f"✅ BERT NER warm-up inference took {time.perf_counter() - started:.2f}s")
+    return ner_model
+
+
+def warm_up_in_background():
+    """Warm the model up on a daemon thread so the web server can start serving immediately"""
+    thread = threading.Thread(target=warm_up, name="ner-warm-up", daemon=True)
+    thread.start()
+    return thread
@@ -1,12 +1,17 @@
 import sqlite3
 import hashlib
+import json
 import os
+import re
+import threading
+import time
 from flask_login import UserMixin
 from config import Config
+from db_pool import get_connection
 
 def init_db():
     """Initialize the database with required tables"""
-    conn = sqlite3.connect(Config.DATABASE_PATH)
+    conn = get_connection()
     cursor = conn.cursor()
 
     # Create users table
@@ -35,6 +40,125 @@ def init_db():
         )
     ''')
 
+    # Create jobs tables (background processing of upload batches)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            user_id INTEGER,
+            status TEXT NOT NULL DEFAULT 'queued',
+            course_type TEXT,
+            internship_type TEXT,
+            total_files INTEGER NOT NULL DEFAULT 0,
+            summary TEXT,
+            error TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            finished_at TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS job_files (
+            job_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            filename TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'queued',
+            error TEXT,
+            PRIMARY KEY (job_id, position),
+            FOREIGN KEY (job_id) REFERENCES jobs (id)
+        )
+    ''')
+
+    # Create candidates table (one classified resume per row; details holds the full classification)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS candidates (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT NOT NULL,
+            user_id INTEGER,
+            position INTEGER NOT NULL,
+            filename TEXT NOT NULL,
+            final_category TEXT NOT NULL,
+            cgpa REAL,
+            academic_year INTEGER,
+            preference_score INTEGER NOT NULL DEFAULT 0,
+            details TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (job_id) REFERENCES jobs (id),
+            FOREIGN KEY (user_id) REFERENCES users (id)
+        )
+    ''')
+    # Results pages list one category of a batch by preference score
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_candidates_job_category_score
+        ON candidates (job_id, final_category, preference_score DESC, position)
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_candidates_job_position ON candidates (job_id, position)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_candidates_user ON candidates (user_id, created_at)')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_candidates_category_score
+        ON candidates (final_category, preference_score DESC)
+    ''')
+
+    # Create parsed_resumes table (the parser's output for each candidate, kept so a
+    # batch can be re-scored under new criteria without re-reading the files)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS parsed_resumes (
+            job_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            parsed_info TEXT NOT NULL,
+            PRIMARY KEY (job_id, position),
+            FOREIGN KEY (job_id) REFERENCES jobs (id)
+        )
+    ''')
+
+    # Full-text index over each candidate's extracted text (rowid = candidates.id),
+    # plus the experience flags search can filter on
+    cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS candidate_text USING fts5(
+            text, tokenize = 'unicode61 remove_diacritics 2'
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS candidate_flags (
+            flag TEXT NOT NULL,
+            candidate_id INTEGER NOT NULL,
+            PRIMARY KEY (flag, candidate_id),
+            FOREIGN KEY (candidate_id) REFERENCES candidates (id)
+        ) WITHOUT ROWID
+    ''')
+    # Candidates that are near-duplicates of an earlier resume (see near_duplicates)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS candidate_duplicates (
+            candidate_id INTEGER PRIMARY KEY,
+            job_id TEXT NOT NULL,
+            group_id INTEGER NOT NULL,
+            duplicate_of TEXT NOT NULL,
+            similarity REAL NOT NULL,
+            FOREIGN KEY (candidate_id) REFERENCES candidates (id)
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_candidate_duplicates_job ON candidate_duplicates (job_id, group_id)')
+
+    # Uploaded originals by content (see upload_store): (batch, file name) -> blob
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS upload_files (
+            job_id TEXT NOT NULL,
+            filename TEXT NOT NULL,
+            sha256 TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (job_id, filename)
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_upload_files_sha256 ON upload_files (sha256)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_upload_files_filename ON upload_files (filename, created_at)')
+
+    # Search without a text query walks a user's candidates by preference score
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_candidates_user_score
+        ON candidates (user_id, preference_score DESC, cgpa, academic_year, final_category)
+    ''')
+
     # Create default admin user if not exists
     cursor.execute('SELECT COUNT(*) FROM users WHERE username = ?', ('admin',))
     if cursor.fetchone()[0] == 0:
@@ -44,7 +168,6 @@ def init_db():
         print("✅ Default admin user created (username: admin, password: admin123)")
 
     conn.commit()
-    conn.close()
 
 class User(UserMixin):
     def __init__(self, id, username, password_hash):
@@ -54,60 +177,543 @@ class User(UserMixin):
 
     @staticmethod
     def get(user_id):
-        conn = sqlite3.connect(Config.DATABASE_PATH)
+        """Load a user, served from a short-lived cache since Flask-Login calls this on every request"""
+        key = str(user_id)
+        now = time.monotonic()
+        cached = _user_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        conn = get_connection()
         cursor = conn.cursor()
         cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))
         row = cursor.fetchone()
-        conn.close()
 
-        if row:
-            return User(row[0], row[1], row[2])
-        return None
+        user = User(row[0], row[1], row[2]) if row else None
+        if Config.USER_CACHE_TTL > 0:
+            with _user_cache_lock:
+                if len(_user_cache) >= Config.USER_CACHE_MAX_ENTRIES:
+                    _user_cache.clear()
+                _user_cache[key] = (now + Config.USER_CACHE_TTL, user)
+        return user
 
     def check_password(self, password):
         return hashlib.sha256(password.encode()).hexdigest() == self.password_hash
 
     def update_last_login(self):
-        conn = sqlite3.connect(Config.DATABASE_PATH)
-        cursor = conn.cursor()
-        cursor.execute('UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ?', (self.id,))
-        conn.commit()
-        conn.close()
+        conn = get_connection()
+        with conn:  # Commits, or rolls back on error
+            conn.execute('UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ?', (self.id,))
+
+# user id -> (expiry, User or None)
+_user_cache = {}
+_user_cache_lock = threading.Lock()
+
+def clear_user_cache():
+    with _user_cache_lock:
+        _user_cache.clear()
 
 def get_user_by_username(username):
-    conn = sqlite3.connect(Config.DATABASE_PATH)
+    conn = get_connection()
     cursor = conn.cursor()
     cursor.execute('SELECT * FROM users WHERE username = ?', (username,))
     row = cursor.fetchone()
-    conn.close()
 
     if row:
         return User(row[0], row[1], row[2])
     return None
 
 def create_user(username, password):
-    conn = sqlite3.connect(Config.DATABASE_PATH)
-    cursor = conn.cursor()
+    conn = get_connection()
     password_hash = hashlib.sha256(password.encode()).hexdigest()
 
     try:
-        cursor.execute('INSERT INTO users (username, password_hash) VALUES (?, ?)', 
-                      (username, password_hash))
-        conn.commit()
+        with conn:  # Commits, or rolls back on error
+            cursor = conn.execute('INSERT INTO users (username, password_hash) VALUES (?, ?)', 
+                                  (username, password_hash))
         user_id = cursor.lastrowid
-        conn.close()
+        clear_user_cache()  # Drop a cached "no such user" for the new id
         return User(user_id, username, password_hash)
     except sqlite3.IntegrityError:
-        conn.close()
         return None  # Username already exists
 
 def log_processing_result(user_id, filename, result_category, cgpa=None, academic_year=None, preference_score=0):
-    conn = sqlite3.connect(Config.DATABASE_PATH)
+    conn = get_connection()
+    with conn:  # Commits, or rolls back on error
+        conn.execute('''
+            INSERT INTO processing_logs 
+            (user_id, filename, result_category, cgpa, academic_year, preference_score) 
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (user_id, filename, result_category, cgpa, academic_year, preference_score))
+
+
+def create_job(job_id, user_id, course_type, internship_type, files):
+    """Create a queued job; files is a list of (filename, status, error) in upload order"""
+    conn = get_connection()
+    with conn:  # Commits, or rolls back on error
+        conn.execute('''
+            INSERT INTO jobs (id, user_id, course_type, internship_type, total_files)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (job_id, user_id, course_type, internship_type, len(files)))
+        conn.executemany('''
+            INSERT INTO job_files (job_id, position, filename, status, error) VALUES (?, ?, ?, ?, ?)
+        ''', [(job_id, position, filename, status, error) for position, (filename, status, error) in enumerate(files)])
+
+def update_job_files(job_id, updates):
+    """Record per-file progress; updates is a list of (position, status, error)"""
+    conn = get_connection()
+    with conn:  # Commits, or rolls back on error
+        conn.executemany('''
+            UPDATE job_files SET status = ?, error = ? WHERE job_id = ? AND position = ?
+        ''', [(status, error, job_id, position) for position, status, error in updates])
+
+def set_job_status(job_id, status, summary=None, error=None):
+    finished = status in ('done', 'failed')
+    conn = get_connection()
+    with conn:  # Commits, or rolls back on error
+        conn.execute('''
+            UPDATE jobs SET status = ?, summary = COALESCE(?, summary),
+                error = ?, finished_at = CASE WHEN ? THEN CURRENT_TIMESTAMP ELSE finished_at END
+            WHERE id = ?
+        ''', (status, json.dumps(summary) if summary is not None else None, error, finished, job_id))
+
+def get_job(job_id):
+    """Return a job with per-file progress as a dict, or None"""
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row  # Per cursor: the connection is shared
+    cursor.execute('SELECT * FROM jobs WHERE id = ?', (job_id,))
+    row = cursor.fetchone()
+    if not row:
+        return None
+
+    cursor.execute('SELECT filename, status, error FROM job_files WHERE job_id = ? ORDER BY position', (job_id,))
+    files = [dict(file_row) for file_row in cursor.fetchall()]
+
+    job = {
+        'id': row['id'],
+        'user_id': row['user_id'],
+        'status': row['status'],
+        'course_type': row['course_type'],
+        'internship_type': row['internship_type'],
+        'total_files': row['total_files'],
+        'processed_files': sum(1 for f in files if f['status'] == 'done'),
+        'failed_files': sum(1 for f in files if f['status'] == 'error'),
+        'files': files,
+        'summary': json.loads(row['summary']) if row['summary'] else {},
+        'error': row['error'],
+        'created_at': row['created_at'],
+        'finished_at': row['finished_at']
+    }
+    return job
+
+
+def get_finished_job_ids(user_id):
+    """Ids of a user's finished batches, oldest first"""
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT id FROM jobs WHERE user_id = ? AND status = 'done' ORDER BY created_at, rowid",
+                   (user_id,))
+    return [row[0] for row in cursor.fetchall()]
+
+def add_upload_file(job_id, filename, sha256, size):
+    """Record that a batch's file is stored as the blob sha256"""
+    conn = get_connection()
+    with conn:
+        conn.execute('''
+            INSERT OR REPLACE INTO upload_files (job_id, filename, sha256, size) VALUES (?, ?, ?, ?)
+        ''', (job_id, filename, sha256, size))
+
+def get_upload_file(user_id, filename, job_id=None):
+    """The stored upload {job_id, sha256, size} of one of the user's batches, or None
+
+    Without a job_id, the user's most recent upload of that file name.
+    """
+    conn = get_connection()
+    row = conn.execute(f'''
+        SELECT u.job_id, u.sha256, u.size FROM upload_files u JOIN jobs j ON j.id = u.job_id
+        WHERE u.filename = ? AND j.user_id = ? {'AND u.job_id = ?' if job_id else ''}
+        ORDER BY u.created_at DESC LIMIT 1
+    ''', (filename, user_id) + ((job_id,) if job_id else ())).fetchone()
+    return {'job_id': row[0], 'sha256': row[1], 'size': row[2]} if row else None
+
+def prune_upload_files(max_age_days, max_bytes):
+    """Forget the stored uploads of old batches, returning how many files were dropped
+
+    Drops batches uploaded more than max_age_days ago, then the oldest
+    batches until the distinct blobs still referred to total at most
+    max_bytes (0 disables either limit). The blobs themselves are deleted
+    by upload_store.collect_garbage.
+    """
+    conn = get_connection()
+    removed = 0
+    with conn:  # Commits, or rolls back on error
+        if max_age_days:
+            removed += conn.execute("DELETE FROM upload_files WHERE created_at < datetime('now', ?)",
+                                    (f'-{max_age_days} days',)).rowcount
+        if not max_bytes:
+            return removed
+
+        total = conn.execute('''
+            SELECT COALESCE(SUM(size), 0) FROM (SELECT MAX(size) AS size FROM upload_files GROUP BY sha256)
+        ''').fetchone()[0]
+        if total <= max_bytes:
+            return removed
+        oldest_jobs = conn.execute(
+            'SELECT job_id FROM upload_files GROUP BY job_id ORDER BY MIN(created_at), job_id'
+        ).fetchall()
+        for (job_id,) in oldest_jobs:
+            # Only blobs no other batch shares are freed
+            freed = conn.execute('''
+                SELECT COALESCE(SUM(size), 0) FROM (
+                    SELECT MAX(size) AS size FROM upload_files f WHERE job_id = ? AND NOT EXISTS (
+                        SELECT 1 FROM upload_files o WHERE o.sha256 = f.sha256 AND o.job_id != f.job_id
+                    ) GROUP BY sha256
+                )
+            ''', (job_id,)).fetchone()[0]
+            removed += conn.execute('DELETE FROM upload_files WHERE job_id = ?', (job_id,)).rowcount
+            total -= freed
+            if total <= max_bytes:
+                break
+    return removed
+
+def get_referenced_blobs():
+    """SHA-256 of every blob some batch's upload refers to"""
+    conn = get_connection()
+    return {row[0] for row in conn.execute('SELECT DISTINCT sha256 FROM upload_files')}
+
+def _candidate_rows(job_id, user_id, candidates):
+    return [(job_id, user_id, position, classification.get('filename', 'unknown'),
+             classification.get('final_category', 'others'), classification.get('cgpa'),
+             classification.get('academic_year'), classification.get('preference_score', 0),
+             json.dumps(classification))
+            for position, classification, _ in candidates]
+
+def _processing_log_rows(user_id, candidates):
+    return [(user_id, classification.get('filename', 'unknown'), classification.get('final_category'),
+             classification.get('cgpa'), classification.get('academic_year'),
+             classification.get('preference_score', 0))
+            for _, classification, _ in candidates]
+
+def _parsed_resume_rows(job_id, candidates):
+    # The full text goes to the search index only
+    return [(job_id, position, json.dumps({key: value for key, value in parsed_info.items() if key != 'text'}))
+            for position, _, parsed_info in candidates if parsed_info is not None]
+
+def _candidate_text_rows(job_id, candidates):
+    return [(parsed_info['text'], job_id, position)
+            for position, _, parsed_info in candidates if parsed_info and parsed_info.get('text')]
+
+def _candidate_flag_rows(job_id, candidates):
+    return [(flag, job_id, position)
+            for position, classification, _ in candidates
+            for flag, value in (classification.get('experience_summary') or {}).items() if value]
+
+def _candidate_duplicate_rows(job_id, candidates):
+    return [(job_id, classification['duplicate_group'], classification['near_duplicate']['filename'],
+             classification['near_duplicate']['similarity'], job_id, position)
+            for position, classification, _ in candidates if classification.get('near_duplicate')]
+
+def save_results(batches):
+    """Store classified resumes, their processing_logs rows and search entries in one transaction
+
+    batches is a list of (job_id, user_id, candidates), candidates being a list
+    of (position, classification, parsed_info), so writes from several jobs can
+    share a commit. parsed_info (the parser's output) may be None; its 'text'
+    goes to the full-text index.
+    """
+    candidate_rows = []
+    log_rows = []
+    parsed_rows = []
+    text_rows = []
+    flag_rows = []
+    duplicate_rows = []
+    for job_id, user_id, candidates in batches:
+        candidate_rows.extend(_candidate_rows(job_id, user_id, candidates))
+        log_rows.extend(_processing_log_rows(user_id, candidates))
+        parsed_rows.extend(_parsed_resume_rows(job_id, candidates))
+        text_rows.extend(_candidate_text_rows(job_id, candidates))
+        flag_rows.extend(_candidate_flag_rows(job_id, candidates))
+        duplicate_rows.extend(_candidate_duplicate_rows(job_id, candidates))
+
+    conn = get_connection()
+    with conn:  # Commits, or rolls back on error
+        conn.executemany('''
+            INSERT INTO candidates
+            (job_id, user_id, position, filename, final_category, cgpa, academic_year, preference_score, details)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', candidate_rows)
+        conn.executemany('''
+            INSERT INTO processing_logs 
+            (user_id, filename, result_category, cgpa, academic_year, preference_score) 
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', log_rows)
+        conn.executemany('''
+            INSERT OR REPLACE INTO parsed_resumes (job_id, position, parsed_info) VALUES (?, ?, ?)
+        ''', parsed_rows)
+        # Keyed by the candidate ids just assigned
+        conn.executemany('''
+            INSERT INTO candidate_text (rowid, text)
+            SELECT id, ? FROM candidates WHERE job_id = ? AND position = ?
+        ''', text_rows)
+        conn.executemany('''
+            INSERT OR IGNORE INTO candidate_flags (flag, candidate_id)
+            SELECT ?, id FROM candidates WHERE job_id = ? AND position = ?
+        ''', flag_rows)
+        conn.executemany('''
+            INSERT OR REPLACE INTO candidate_duplicates (candidate_id, job_id, group_id, duplicate_of, similarity)
+            SELECT id, ?, ?, ?, ? FROM candidates WHERE job_id = ? AND position = ?
+        ''', duplicate_rows)
+
+def count_candidates(job_id):
+    """Number of candidates in a batch per final category"""
+    conn = get_connection()
     cursor = conn.cursor()
     cursor.execute('''
-        INSERT INTO processing_logs 
-        (user_id, filename, result_category, cgpa, academic_year, preference_score) 
-        VALUES (?, ?, ?, ?, ?, ?)
-    ''', (user_id, filename, result_category, cgpa, academic_year, preference_score))
-    conn.commit()
-    conn.close()
+        SELECT final_category, COUNT(*) FROM candidates WHERE job_id = ? GROUP BY final_category
+    ''', (job_id,))
+    counts = dict(cursor.fetchall())
+    return counts
+
+def get_candidates(job_id, category, limit, offset=0, order_by_score=True):
+    """One page of a batch's candidates in a category, highest preference score first by default"""
+    order = 'preference_score DESC, position' if order_by_score else 'position'
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(f'''
+        SELECT details FROM candidates WHERE job_id = ? AND final_category = ?
+        ORDER BY {order} LIMIT ? OFFSET ?
+    ''', (job_id, category, limit, offset))
+    candidates = [json.loads(row[0]) for row in cursor.fetchall()]
+    return candidates
+
+def get_duplicate_groups(job_id):
+    """A batch's near-duplicate resumes, grouped: [{'filenames': [...], 'duplicates': [...]}]
+
+    filenames lists every version in the group (earlier ones first, which may
+    come from other batches); duplicates holds each near-duplicate candidate
+    of this batch with the earlier version it matched and their similarity.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT d.group_id, c.filename, c.final_category, d.duplicate_of, d.similarity
+        FROM candidate_duplicates d JOIN candidates c ON c.id = d.candidate_id
+        WHERE d.job_id = ? ORDER BY d.group_id, c.position
+    ''', (job_id,))
+    groups = {}
+    for group_id, filename, final_category, duplicate_of, similarity in cursor.fetchall():
+        group = groups.setdefault(group_id, {'filenames': [], 'duplicates': []})
+        for name in (duplicate_of, filename):
+            if name not in group['filenames']:
+                group['filenames'].append(name)
+        group['duplicates'].append({'filename': filename, 'final_category': final_category,
+                                    'duplicate_of': duplicate_of, 'similarity': similarity})
+    return list(groups.values())
+
+def iter_candidates(job_id, chunk_size=500):
+    """Yield every candidate of a batch in upload order, reading chunk_size rows at a time"""
+    last_position = -1
+    while True:
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT position, details FROM candidates WHERE job_id = ? AND position > ?
+            ORDER BY position LIMIT ?
+        ''', (job_id, last_position, chunk_size))
+        rows = cursor.fetchall()
+
+        for position, details in rows:
+            yield json.loads(details)
+        if len(rows) < chunk_size:
+            return
+        last_position = rows[-1][0]
+
+_SEARCH_OPERATORS = ('AND', 'OR', 'NOT')
+
+def _fts_query(text):
+    """FTS5 MATCH expression for a search box query
+
+    Every word or "quoted phrase" must match unless joined by OR / NOT; a
+    trailing * matches prefixes. Anything else is matched literally, so user
+    input never produces an FTS5 syntax error. FTS5 can only exclude from
+    something that matches, so a NOT with nothing before it to exclude from
+    (leading, or after another operator) is dropped with the term it negates.
+    """
+    terms = []
+    negated = False  # Dropping the term after a NOT that can't be kept
+    for token in re.findall(r'"[^"]*"?|\S+', text):
+        if token in _SEARCH_OPERATORS:
+            if terms and terms[-1] not in _SEARCH_OPERATORS:
+                terms.append(token)
+            elif token == 'NOT':
+                negated = True
+            continue
+        prefix = token.endswith('*')
+        phrase = token.strip('"*').replace('"', '""')
+        if phrase.strip():
+            if negated:
+                negated = False
+                continue
+            terms.append(f'"{phrase}"' + ('*' if prefix else ''))
+    while terms and terms[-1] in _SEARCH_OPERATORS:
+        terms.pop()
+    return ' '.join(terms)
+
+def search_candidates(user_id, text=None, cgpa_min=None, cgpa_max=None, academic_years=(), categories=(),
+                      experience=(), job_id=None, limit=20, offset=0):
+    """One page of a user's candidates across all batches, with the total match count
+
+    text is a search box query over the resumes' full text (see _fts_query).
+    experience names flags from the experience summary (e.g.
+    tier_firm_internship) that must all be set. Text matches are ranked by
+    relevance unless there are more than Config.SEARCH_RANK_LIMIT of them
+    (ranking costs time per match); other searches, and broader ones, are
+    ordered by preference score. Returns (total, results, order), order being
+    'relevance' or 'preference_score'. With text, each result's snippet holds
+    the matching text around the matches, which are between \x02 and \x03.
+    """
+    conditions = ['c.user_id = ?']
+    params = [user_id]
+    if cgpa_min is not None:
+        conditions.append('c.cgpa >= ?')
+        params.append(cgpa_min)
+    if cgpa_max is not None:
+        conditions.append('c.cgpa <= ?')
+        params.append(cgpa_max)
+    if academic_years:
+        conditions.append(f"c.academic_year IN ({', '.join('?' * len(academic_years))})")
+        params.extend(academic_years)
+    if categories:
+        conditions.append(f"c.final_category IN ({', '.join('?' * len(categories))})")
+        params.extend(categories)
+    for flag in experience:
+        conditions.append('c.id IN (SELECT candidate_id FROM candidate_flags WHERE flag = ?)')
+        params.append(flag)
+    if job_id:
+        conditions.append('c.job_id = ?')
+        params.append(job_id)
+    where = ' AND '.join(conditions)
+    columns = ('id', 'job_id', 'position', 'filename', 'final_category', 'cgpa', 'academic_year',
+               'preference_score', 'created_at')
+    select = ', '.join(f'c.{column}' for column in columns)
+
+    match = _fts_query(text) if text else ''
+    if text and not match:
+        return 0, [], 'relevance'  # Nothing searchable in the query
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    if not match:
+        cursor.execute(f'SELECT COUNT(*) FROM candidates c WHERE {where}', params)
+        total = cursor.fetchone()[0]
+        cursor.execute(f'''
+            SELECT {select} FROM candidates c WHERE {where}
+            ORDER BY c.preference_score DESC, c.id LIMIT ? OFFSET ?
+        ''', params + [limit, offset])
+        return total, [dict(zip(columns, row), snippet=None) for row in cursor.fetchall()], 'preference_score'
+
+    # CROSS JOIN keeps the full-text lookup first: probing it per candidate is far slower
+    hits = 'candidate_text CROSS JOIN candidates c ON c.id = candidate_text.rowid'
+    cursor.execute(f'SELECT COUNT(*) FROM {hits} WHERE candidate_text MATCH ? AND {where}', [match] + params)
+    total = cursor.fetchone()[0]
+    if total <= Config.SEARCH_RANK_LIMIT:
+        order = 'relevance'
+        cursor.execute(f'''
+            SELECT {select} FROM {hits} WHERE candidate_text MATCH ? AND {where}
+            ORDER BY candidate_text.rank, c.preference_score DESC LIMIT ? OFFSET ?
+        ''', [match] + params + [limit, offset])
+    else:
+        order = 'preference_score'
+        cursor.execute(f'''
+            SELECT {select} FROM candidates c
+            WHERE c.id IN (SELECT rowid FROM candidate_text WHERE candidate_text MATCH ?) AND {where}
+            ORDER BY c.preference_score DESC, c.id LIMIT ? OFFSET ?
+        ''', [match] + params + [limit, offset])
+    results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    # Snippets for this page only
+    ids = [result['id'] for result in results]
+    snippets = dict(cursor.execute(f'''
+        SELECT rowid, snippet(candidate_text, 0, char(2), char(3), '…', 16) FROM candidate_text
+        WHERE candidate_text MATCH ? AND rowid IN ({', '.join('?' * len(ids))})
+    ''', [match] + ids).fetchall()) if ids else {}
+    for result in results:
+        result['snippet'] = snippets.get(result['id'])
+    return total, results, order
+
+# SQL for a field's Python truthiness inside stored JSON (flags may be booleans or lists)
+_JSON_TRUTHY = '''CASE json_type(parsed_info, ?)
+            WHEN 'true' THEN 1
+            WHEN 'array' THEN json_array_length(parsed_info, ?) > 0
+            WHEN 'object' THEN json_extract(parsed_info, ?) != '{}'
+            WHEN 'text' THEN json_extract(parsed_info, ?) != ''
+            WHEN 'integer' THEN json_extract(parsed_info, ?) != 0
+            WHEN 'real' THEN json_extract(parsed_info, ?) != 0
+            ELSE 0 END'''
+
+def get_candidate_features(job_id, fields):
+    """Fields read from a batch's stored parser output, one row per candidate in upload order
+
+    fields is a list of (dotted path, 'flag' or 'number'); rows are (position,
+    value per field), flags as 0/1 and missing numbers as None. Values are
+    extracted inside SQLite, so the stored JSON is not decoded in Python.
+    """
+    expressions = []
+    params = []
+    for field, kind in fields:
+        path = '$.' + field
+        if kind == 'flag':
+            expressions.append(_JSON_TRUTHY)
+            params.extend([path] * 6)
+        else:
+            expressions.append('json_extract(parsed_info, ?)')
+            params.append(path)
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(f'''
+        SELECT position, {', '.join(expressions)}
+        FROM parsed_resumes WHERE job_id = ? ORDER BY position
+    ''', params + [job_id])
+    features = cursor.fetchall()
+    return features
+
+def update_classifications(job_id, paths, updates, course_type, internship_type, summary, previous_summary):
+    """Store re-scored classifications for a batch in one transaction
+
+    paths are the JSON paths patched into each stored classification; updates
+    is a list of (position, final_category, special_consideration or None,
+    value per path). The job's criteria and summary are updated too. Nothing
+    is written, and False returned, if the job's summary is no longer
+    previous_summary (it was re-scored meanwhile).
+    """
+    json_bool = {True: 'true', False: 'false'}
+    is_bool = [isinstance(value, bool) for value in updates[0][3:]] if updates else []
+    assignments = ''.join(', ?, json(?)' if flag else ', ?, ?' for flag in is_bool)
+
+    rows = []
+    for position, final_category, special_consideration, *values in updates:
+        row = [special_consideration, special_consideration, final_category]
+        for path, value, flag in zip(paths, values, is_bool):
+            row.append(path)
+            row.append(json_bool[value] if flag else value)
+        row.extend([final_category, job_id, position])
+        rows.append(row)
+
+    conn = get_connection()
+    with conn:  # Commits, or rolls back on error
+        cursor = conn.execute('''
+            UPDATE jobs SET course_type = ?, internship_type = ?, summary = ? WHERE id = ? AND summary = ?
+        ''', (course_type, internship_type, json.dumps(summary), job_id, json.dumps(previous_summary)))
+        if cursor.rowcount == 0:
+            return False
+        conn.executemany(f'''
+            UPDATE candidates SET details = json_set(
+                CASE WHEN ? IS NULL THEN json_remove(details, '$.special_consideration')
+                     ELSE json_set(details, '$.special_consideration', ?) END,
+                '$.final_category', ?{assignments}
+            ), final_category = ?
+            WHERE job_id = ? AND position = ?
+        ''', rows)
+    return True
@@ -0,0 +1,164 @@
+"""
+Near-duplicate resume detection
+Each extracted text is reduced to word shingles and a MinHash signature whose
+matching positions estimate the Jaccard similarity of two texts. Signatures
+are banded into an LSH index in SQLite, so finding the candidates that share a
+band with a new resume is a handful of indexed lookups however large the pool
+grows; only those candidates are compared in full. Matches are grouped, and
+the NER output of the earlier version can stand in for a fresh BERT pass.
+Each user's resumes are indexed apart (user_id 0 for resumes parsed outside
+a user's batch), so one user's uploads are never matched against another's.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+import zlib
+import numpy as np
+from config import Config
+from db_pool import get_connection
+
+_WORD = re.compile(r'\w+')
+
+
+class NearDuplicateIndex:
+    def __init__(self, db_path=None, num_perm=None, bands=None, threshold=None, seed=1):
+        self.db_path = db_path or Config.NEAR_DUPLICATE_INDEX_PATH
+        self.num_perm = num_perm or Config.NEAR_DUPLICATE_PERMUTATIONS
+        self.bands = bands or Config.NEAR_DUPLICATE_BANDS
+        self.threshold = threshold if threshold is not None else Config.NEAR_DUPLICATE_THRESHOLD
+        if self.num_perm % self.bands:
+            raise ValueError(f"{self.num_perm} MinHash permutations do not split into {self.bands} bands")
+        self.rows = self.num_perm // self.bands
+
+        # Multiply-shift hash family: h(x) = (a * x + b) >> 32 over uint64, a odd
+        rng = np.random.default_rng(seed)
+        self._a = (rng.integers(1, 2 ** 63, self.num_perm, dtype=np.uint64) | np.uint64(1))[:, None]
+        self._b = rng.integers(0, 2 ** 63, self.num_perm, dtype=np.uint64)[:, None]
+
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        conn = get_connection(self.db_path)
+        columns = [row[1] for row in conn.execute('PRAGMA table_info(resume_signatures)')]
+        if columns and 'user_id' not in columns:
+            # Indexed before resumes had an owner; they can't be told apart, so start afresh
+            conn.execute('DROP TABLE resume_signatures')
+            conn.execute('DROP TABLE IF EXISTS lsh_buckets')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS resume_signatures (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                group_id INTEGER NOT NULL,
+                filename TEXT NOT NULL,
+                signature BLOB NOT NULL,
+                ner_version TEXT,
+                ner_result TEXT,
+                created_at REAL NOT NULL
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS lsh_buckets (
+                user_id INTEGER NOT NULL,
+                band INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                signature_id INTEGER NOT NULL,
+                PRIMARY KEY (user_id, band, bucket, signature_id)
+            ) WITHOUT ROWID
+        ''')
+        conn.commit()
+
+    def signature(self, text):
+        """MinHash signature (uint32 array) of the text's word shingles, or None for empty text"""
+        words = _WORD.findall(text.lower())
+        if not words:
+            return None
+        size = Config.NEAR_DUPLICATE_SHINGLE_WORDS
+        shingles = {' '.join(words[start:start + size]) for start in range(max(1, len(words) - size + 1))}
+        hashes = np.fromiter((zlib.crc32(shingle.encode()) for shingle in shingles),
+                             dtype=np.uint64, count=len(shingles))
+        # Wrapping uint64 arithmetic is the point of multiply-shift hashing
+        with np.errstate(over='ignore'):
+            permuted = (self._a * hashes + self._b) >> np.uint64(32)
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def buckets(self, signature):
+        """(band, bucket) keys of a signature: a hash of each band's rows"""
+        return [(band, int.from_bytes(hashlib.blake2b(
+                    signature[band * self.rows:(band + 1) * self.rows].tobytes(), digest_size=8
+                ).digest(), 'big', signed=True))
+                for band in range(self.bands)]
+
+    def find(self, signature, ner_version=None, user_id=None):
+        """The most similar of a user's indexed resumes at or above the threshold, or None
+
+        Returns a dict with id, group_id, filename, similarity and ner (the
+        stored (entities, confidence) when it was produced under ner_version,
+        else None).
+        """
+        keys = self.buckets(signature)
+        conn = get_connection(self.db_path)
+        # Bounded per band so a bucket shared by thousands of template CVs stays cheap
+        candidate_ids = set()
+        for band, bucket in keys:
+            candidate_ids.update(row[0] for row in conn.execute(
+                'SELECT signature_id FROM lsh_buckets WHERE user_id = ? AND band = ? AND bucket = ? '
+                'ORDER BY signature_id DESC LIMIT ?',
+                (user_id or 0, band, bucket, Config.NEAR_DUPLICATE_MAX_CANDIDATES)
+            ))
+        if not candidate_ids:
+            return None
+
+        rows = conn.execute(f'''
+            SELECT id, group_id, filename, signature, ner_version, ner_result FROM resume_signatures
+            WHERE id IN ({', '.join('?' * len(candidate_ids))})
+        ''', list(candidate_ids)).fetchall()
+        signatures = np.frombuffer(b''.join(row[3] for row in rows), dtype=np.uint32).reshape(len(rows), -1)
+        similarities = (signatures == signature).mean(axis=1)
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+
+        signature_id, group_id, filename, _, stored_version, ner_result = rows[best]
+        ner = None
+        if ner_result and ner_version is not None and stored_version == ner_version:
+            entities, confidence = json.loads(ner_result)
+            ner = ([tuple(entity) for entity in entities], confidence)
+        return {'id': signature_id, 'group_id': group_id, 'filename': filename,
+                'similarity': round(float(similarities[best]), 3), 'ner': ner}
+
+    def add(self, signature, filename, group_id=None, user_id=None):
+        """Index a user's signature, in group_id's group or a new one; returns (id, group_id)"""
+        conn = get_connection(self.db_path)
+        with conn:  # Commits, or rolls back on error
+            cursor = conn.execute(
+                'INSERT INTO resume_signatures (user_id, group_id, filename, signature, created_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (user_id or 0, group_id or 0, filename, signature.tobytes(), time.time())
+            )
+            signature_id = cursor.lastrowid
+            if not group_id:
+                # A new group is named after its first resume
+                group_id = signature_id
+                conn.execute('UPDATE resume_signatures SET group_id = ? WHERE id = ?', (group_id, signature_id))
+            conn.executemany(
+                'INSERT OR IGNORE INTO lsh_buckets (user_id, band, bucket, signature_id) VALUES (?, ?, ?, ?)',
+                [(user_id or 0, band, bucket, signature_id) for band, bucket in self.buckets(signature)]
+            )
+        return signature_id, group_id
+
+    def set_ner(self, signature_id, ner_version, ner):
+        """Remember the NER output for an indexed resume, for reuse by its near-duplicates"""
+        conn = get_connection(self.db_path)
+        with conn:
+            conn.execute('UPDATE resume_signatures SET ner_version = ?, ner_result = ? WHERE id = ?',
+                         (ner_version, json.dumps(ner), signature_id))
+
+    def stats(self):
+        """Indexed resumes and duplicate groups, with the LSH parameters"""
+        conn = get_connection(self.db_path)
+        resumes, groups = conn.execute(
+            'SELECT COUNT(*), COUNT(DISTINCT group_id) FROM resume_signatures'
+        ).fetchone()
+        return {'resumes': resumes, 'groups': groups, 'bands': self.bands, 'rows_per_band': self.rows,
+                'threshold': self.threshold}
@@ -0,0 +1,97 @@
+"""
+Inference backends for the BERT NER stage
+Every backend takes the tokenizer output for a batch of windows and returns
+the token-classification logits as a torch tensor, so ResumeParser can switch
+between them through Config.NER_BACKEND without any other change.
+"""
+
+import os
+from config import Config
+
+MODEL_INPUT_NAMES = ("input_ids", "attention_mask", "token_type_ids")
+
+
+class TorchNerBackend:
+    """Plain fp32 PyTorch inference (the reference backend)"""
+    name = "torch"
+
+    def __init__(self, model):
+        self.model = model
+
+    def logits(self, model_inputs):
+        import torch
+
+        with torch.inference_mode():
+            return self.model(**model_inputs).logits
+
+
+class QuantizedTorchNerBackend(TorchNerBackend):
+    """PyTorch inference with Linear layers dynamically quantized to int8"""
+    name = "torch_int8"
+
+    def __init__(self, model):
+        import torch
+
+        quantized = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        super().__init__(quantized)
+
+
+class OnnxNerBackend:
+    """ONNX Runtime inference over a model exported once to Config.NER_ONNX_PATH"""
+    name = "onnx"
+
+    def __init__(self, model, onnx_path=None):
+        import onnxruntime
+
+        onnx_path = onnx_path or Config.NER_ONNX_PATH
+        if not os.path.exists(onnx_path):
+            export_onnx(model, onnx_path)
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = onnxruntime.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+        self.input_names = [node.name for node in self.session.get_inputs()]
+
+    def logits(self, model_inputs):
+        import torch
+
+        feed = {name: model_inputs[name].numpy() for name in self.input_names if name in model_inputs}
+        return torch.from_numpy(self.session.run(["logits"], feed)[0])
+
+
+def export_onnx(model, onnx_path):
+    """Export a token-classification model to ONNX with dynamic batch and sequence axes"""
+    import torch
+
+    os.makedirs(os.path.dirname(onnx_path) or ".", exist_ok=True)
+    dummy = {name: torch.ones((1, 8), dtype=torch.long) for name in MODEL_INPUT_NAMES}
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in MODEL_INPUT_NAMES}
+    dynamic_axes["logits"] = {0: "batch", 1: "sequence"}
+
+    torch.onnx.export(
+        model, (dummy,), onnx_path,
+        input_names=list(MODEL_INPUT_NAMES), output_names=["logits"],
+        dynamic_axes=dynamic_axes, opset_version=14, dynamo=False
+    )
+    print(f"✅ Exported NER model to ONNX: {onnx_path}")
+
+
+BACKENDS = {
+    TorchNerBackend.name: TorchNerBackend,
+    QuantizedTorchNerBackend.name: QuantizedTorchNerBackend,
+    OnnxNerBackend.name: OnnxNerBackend,
+}
+
+
+def create_backend(name, model):
+    """Build the named backend around a loaded fp32 model, falling back to plain torch"""
+    backend_class = BACKENDS.get(name)
+    if backend_class is None:
+        print(f"⚠️  Unknown NER backend '{name}' - using '{TorchNerBackend.name}'")
+        return TorchNerBackend(model)
+
+    try:
+        return backend_class(model)
+    except ImportError as e:
+        print(f"⚠️  NER backend '{name}' unavailable ({e}) - using '{TorchNerBackend.name}'")
+        return TorchNerBackend(model)
@@ -0,0 +1,94 @@
+"""
+Persistent cache of parsed resumes
+Results are keyed on the SHA-256 of the file bytes plus a parser version tag,
+so re-uploading the same CV skips text extraction, BERT and the regex/keyword
+passes. Changing the keyword lists, tier firms or NER model changes the version
+tag, which invalidates every older entry automatically. Lookups (hit/miss)
+and the number of entries are reported at /metrics.
+"""
+
+import hashlib
+import json
+import os
+import time
+from config import Config
+from db_pool import get_connection
+import metrics
+
+
+def file_sha256(file_path):
+    """SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    def __init__(self, db_path=None, max_entries=None):
+        self.db_path = db_path or Config.PARSE_CACHE_PATH
+        self.max_entries = max_entries or Config.PARSE_CACHE_MAX_ENTRIES
+        self._purged_versions = set()
+
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        conn = get_connection(self.db_path)
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS parse_cache (
+                file_hash TEXT NOT NULL,
+                version TEXT NOT NULL,
+                result TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (file_hash, version)
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_parse_cache_last_access ON parse_cache (last_access)')
+        conn.commit()
+        metrics.PARSE_CACHE_ENTRIES.set_function(self.count)
+
+    def get(self, file_hash, version):
+        """Return the cached parse result, or None on a miss"""
+        conn = get_connection(self.db_path)
+        row = conn.execute(
+            'SELECT result FROM parse_cache WHERE file_hash = ? AND version = ?', (file_hash, version)
+        ).fetchone()
+        if row:
+            # Touch the entry so eviction stays least-recently-used
+            with conn:
+                conn.execute(
+                    'UPDATE parse_cache SET last_access = ? WHERE file_hash = ? AND version = ?',
+                    (time.time(), file_hash, version)
+                )
+
+        metrics.PARSE_CACHE_LOOKUPS.inc('hit' if row else 'miss')
+        return json.loads(row[0]) if row else None
+
+    def put(self, file_hash, version, result):
+        """Store a parse result and evict the least recently used entries beyond max_entries"""
+        now = time.time()
+        conn = get_connection(self.db_path)
+        with conn:  # Commits, or rolls back on error
+            conn.execute(
+                'INSERT OR REPLACE INTO parse_cache (file_hash, version, result, created_at, last_access) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (file_hash, version, json.dumps(result), now, now)
+            )
+            if version not in self._purged_versions:
+                # Entries written under an older parser version can never be hit again
+                conn.execute('DELETE FROM parse_cache WHERE version != ?', (version,))
+                self._purged_versions.add(version)
+            conn.execute('''
+                DELETE FROM parse_cache WHERE rowid IN (
+                    SELECT rowid FROM parse_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                )
+            ''', (self.max_entries,))
+
+    def clear(self):
+        conn = get_connection(self.db_path)
+        with conn:
+            conn.execute('DELETE FROM parse_cache')
+
+    def count(self):
+        """Number of cached parse results (reported at /metrics)"""
+        return get_connection(self.db_path).execute('SELECT COUNT(*) FROM parse_cache').fetchone()[0]
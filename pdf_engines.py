@@ -0,0 +1,152 @@
+"""
+PDF text-extraction engines
+Every engine yields the text of each page (ending in a line break), so
+ResumeParser can try them in Config.PDF_ENGINES order and fall back to the
+next one when a result is empty or garbled. Engines whose library is not
+installed are skipped; PyPDF2 is the only one in requirements.txt.
+Every engine reads either a file path or the document's bytes.
+"""
+
+import io
+import re
+from config import Config
+from keyword_matcher import SQUASHED_WHITESPACE_RATIO
+
+# Glyphs the PDF gave no Unicode mapping for: "(cid:42)", U+FFFD, control characters
+_UNMAPPED_GLYPH_PATTERN = re.compile(r'\(cid:\d+\)|[�\x00-\x08\x0b\x0c\x0e-\x1f]')
+MAX_UNMAPPED_GLYPH_RATIO = 0.02
+MIN_TEXT_LENGTH = 50
+
+
+def open_document(source):
+    """A binary file object for a file path or in-memory document bytes"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    return open(source, 'rb')
+
+
+class PyPDF2Engine:
+    """Pure-Python PyPDF2 (the original extractor)"""
+    name = "pypdf2"
+
+    def __init__(self):
+        import PyPDF2
+        self.PyPDF2 = PyPDF2
+
+    def iter_pages(self, source):
+        with open_document(source) as file:
+            pdf_reader = self.PyPDF2.PdfReader(file)
+            for page_num, page in enumerate(pdf_reader.pages):
+                try:
+                    page_text = page.extract_text()
+                except Exception as e:
+                    print(f"Error reading page {page_num}: {e}")
+                    continue
+                if page_text:
+                    yield page_text + "\n"
+
+
+class Pypdfium2Engine:
+    """PDFium (Chrome's PDF library) through pypdfium2"""
+    name = "pypdfium2"
+
+    def __init__(self):
+        import pypdfium2
+        self.pdfium = pypdfium2
+
+    def iter_pages(self, source):
+        pdf = self.pdfium.PdfDocument(source if isinstance(source, (str, bytes)) else bytes(source))
+        try:
+            for page in pdf:
+                text_page = page.get_textpage()
+                try:
+                    # PDFium separates lines with CRLF
+                    page_text = text_page.get_text_range().replace('\r\n', '\n')
+                finally:
+                    text_page.close()
+                    page.close()
+                if page_text:
+                    yield page_text + "\n"
+        finally:
+            pdf.close()
+
+
+class PdfminerEngine:
+    """pdfminer.six layout analysis"""
+    name = "pdfminer"
+
+    def __init__(self):
+        from pdfminer.high_level import extract_pages
+        from pdfminer.layout import LTTextContainer
+        self.extract_pages = extract_pages
+        self.LTTextContainer = LTTextContainer
+
+    def iter_pages(self, source):
+        with open_document(source) as file:
+            for page_layout in self.extract_pages(file):
+                page_text = "".join(
+                    element.get_text() for element in page_layout if isinstance(element, self.LTTextContainer)
+                )
+                if page_text:
+                    yield page_text + "\n"
+
+
+class PdfplumberEngine:
+    """pdfplumber (pdfminer.six with word-level layout reconstruction)"""
+    name = "pdfplumber"
+
+    def __init__(self):
+        import pdfplumber
+        self.pdfplumber = pdfplumber
+
+    def iter_pages(self, source):
+        with open_document(source) as file, self.pdfplumber.open(file) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                page.close()  # Drop the page's cached layout objects
+                if page_text:
+                    yield page_text + "\n"
+
+
+ENGINES = {
+    Pypdfium2Engine.name: Pypdfium2Engine,
+    PyPDF2Engine.name: PyPDF2Engine,
+    PdfminerEngine.name: PdfminerEngine,
+    PdfplumberEngine.name: PdfplumberEngine,
+}
+
+
+def create_engines(names=None):
+    """Instantiate the named engines in order, skipping unknown or uninstalled ones"""
+    engines = []
+    for name in names if names is not None else Config.PDF_ENGINES:
+        engine_class = ENGINES.get(name.strip().lower())
+        if engine_class is None:
+            print(f"⚠️  Unknown PDF engine '{name}' - skipping")
+            continue
+        try:
+            engines.append(engine_class())
+        except ImportError:
+            continue  # Optional library not installed
+
+    if not engines:
+        print(f"⚠️  No configured PDF engine available - using '{PyPDF2Engine.name}'")
+        engines.append(PyPDF2Engine())
+    return engines
+
+
+def text_problem(text):
+    """Why extracted text looks unusable (empty, garbled), or None if it looks fine"""
+    stripped = text.strip()
+    if len(stripped) < MIN_TEXT_LENGTH:
+        return "empty" if not stripped else "too little text"
+
+    unmapped = sum(len(match) for match in _UNMAPPED_GLYPH_PATTERN.findall(text))
+    if unmapped > len(text) * MAX_UNMAPPED_GLYPH_RATIO:
+        return "unmapped glyphs"
+
+    whitespace = len(text) - len(''.join(text.split()))
+    if whitespace < len(text) * SQUASHED_WHITESPACE_RATIO:
+        return "no word spacing"
+
+    return None
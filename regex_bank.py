@@ -0,0 +1,140 @@
+"""
+Precompiled regular expressions for the rule-based extractors
+Patterns are compiled once at import time. They are written in lower case and
+scan a case-folded copy of the text case-sensitively, which lets the regex
+engine use its fast literal-prefix search (IGNORECASE disables it). Each
+pattern also lists literals it cannot match without, so patterns that cannot
+possibly match a resume are skipped with a plain substring check instead of a
+full scan. A pattern that opens with \b (which also disables the prefix
+search) can be given a looser scanner starting with a literal; the full
+pattern then only runs where the scanner hits.
+"""
+
+import re
+
+# The only non-ASCII characters IGNORECASE treats as equal to an ASCII letter
+_IGNORECASE_FOLD = str.maketrans({'İ': 'i', 'ı': 'i', 'ſ': 's', 'K': 'k'})
+
+
+def fold_case(text):
+    """Lower-case text the way IGNORECASE compares it, keeping every character at the same index"""
+    if any(chr(char) in text for char in _IGNORECASE_FOLD):
+        return text.translate(_IGNORECASE_FOLD).lower()
+    return text.lower()  # Much faster than translate, and the common case
+
+
+# CGPA/GPA/Percentage formats, in priority order: (pattern, required literals).
+# Phrases use \s+ rather than a literal space so the text no longer needs
+# whitespace-normalising first.
+CGPA_SOURCES = [
+    # Standard formats: CGPA: 8.5, GPA: 3.8, G.P.A: 7.5
+    (r'(?:cgpa|gpa|g\.p\.a|c\.g\.p\.a|cumulative\s+gpa)\s*[:-–]?\s*(?:\(avg\.\)\s*[-–]\s*)?([0-9]+(?:\.[0-9]+)?)(?:\s*/\s*([0-9]+))?',
+     ('gpa', 'g.p.a')),
+    # Reverse formats: 8.5 CGPA, 3.8 GPA
+    (r'([0-9]+(?:\.[0-9]+)?)\s*(?:cgpa|gpa|g\.p\.a|c\.g\.p\.a)(?:\s*/\s*([0-9]+))?',
+     ('gpa', 'g.p.a')),
+    # Fraction formats: 8.5/10, 3.8/4.0
+    (r'(?:cgpa|gpa|g\.p\.a)\s*[:-–]?\s*([0-9]+(?:\.[0-9]+)?)\s*/\s*([0-9]+(?:\.[0-9]+)?)',
+     ('gpa', 'g.p.a')),
+    # Academic performance indicators
+    (r'(?:academic\s+performance|overall\s+grade|cumulative\s+grade)\s*[:-–]?\s*([0-9]+(?:\.[0-9]+)?)(?:\s*/\s*([0-9]+))?',
+     ('performance', 'grade')),
+    # Percentage formats: 66% (1st Class), 95.4%
+    (r'\b([0-9]+(?:\.[0-9]+)?)\s*%\s*(?:\([^)]*\))?',
+     ('%',)),
+    # B.A. LL.B. (Hons.) – School Name – 66% format
+    (r'[–-]\s*([0-9]+(?:\.[0-9]+)?)\s*%\s*(?:\([^)]*\))?',
+     ('%',)),
+]
+CGPA_PERCENTAGE_PATTERNS = {4, 5}
+
+# Academic year indicators, in priority order: (pattern, required literals,
+# scanner). Scanners drop the leading \b so the search can jump to a literal.
+ACADEMIC_YEAR_SOURCES = [
+    # Direct year mentions: "3rd year", "fourth year"
+    (r'\b([1-5])(?:st|nd|rd|th)\s+year\b', ('year',), r'[1-5](?:st|nd|rd|th)\s+year'),
+    (r'\b(?:first|second|third|fourth|fifth|1st|2nd|3rd|4th|5th)\s+year\b', ('year',),
+     r'(?:first|second|third|fourth|fifth|1st|2nd|3rd|4th|5th)\s+year'),
+
+    # Semester patterns: "6th semester", "semester 8"
+    (r'\b([1-9]|10)(?:st|nd|rd|th)?\s+semester\b', ('semester',), r'[0-9]{1,2}(?:st|nd|rd|th)?\s+semester'),
+    (r'\bsemester\s+([1-9]|10)\b', ('semester',), r'semester\s+[0-9]'),
+
+    # Year level: "Year 3", "Level 4"
+    (r'\b(?:year|level)\s+([1-5])\b', ('year', 'level'), r'(?:year|level)\s+[1-5]'),
+
+    # Academic year ranges: "2021-2026", "2024-25", "(2021-26)". The scanner
+    # hits the year itself rather than any "(" or spaces before it, which only
+    # moves where the match starts, not what it captures
+    (r'\(?\s*(20[2-9][0-9])\s*[-–]\s*(?:20)?([2-9][0-9])\s*\)?', ('-', '–'), r'20[2-9][0-9]\s*[-–]'),
+
+    # Expected graduation: "graduating in 2025", "class of 2024"
+    (r'\b(?:graduating|graduation|class of)\s+(?:in\s+)?(20[2-9][0-9])\b', ('graduat', 'class of'),
+     r'(?:graduat|class of)'),
+
+    # Current enrollment: "currently in 3rd year"
+    (r'\bcurrently\s+(?:in\s+)?(?:([1-5])(?:st|nd|rd|th)|([1-9])(?:st|nd|rd|th)?)\s+(?:year|semester)\b',
+     ('currently',), r'currently\s'),
+
+    # Final-year patterns: "Final-year B.A. LL.B."
+    (r'\bfinal[-\s]?year\b', ('final',), r'final[-\s]?year'),
+]
+ACADEMIC_YEAR_SEMESTER_PATTERNS = {2, 3}
+ACADEMIC_YEAR_RANGE_PATTERN = 5
+ACADEMIC_YEAR_GRADUATION_PATTERN = 6
+ACADEMIC_YEAR_FINAL_YEAR_PATTERN = 8
+
+# M&A specific moot court experience (any one is enough)
+MA_MOOT_PATTERN = re.compile(
+    r'\b(?:m&a|merger|acquisition)\s+moot\b|\bcorporate\s+law\s+moot\b|\bcompany\s+law\s+moot\b',
+    re.IGNORECASE
+)
+
+
+class PatternBank:
+    """An ordered list of patterns where the first valid match of the earliest pattern wins"""
+
+    def __init__(self, sources):
+        """sources: (pattern, required literals) or (pattern, required literals, scanner)
+
+        A scanner must match the case-folded text wherever the pattern matches
+        the text; it may match elsewhere too.
+        """
+        self.required = [source[1] for source in sources]
+        # Scans the case-folded text...
+        self.scanners = [re.compile(source[2] if len(source) > 2 else source[0]) for source in sources]
+        # ...and re-matches the original text at each hit, so callers see the original characters
+        self.patterns = [re.compile(source[0], re.IGNORECASE) for source in sources]
+
+    def first_valid(self, text, interpret):
+        """Return interpret(index, match) for the first match it accepts, trying patterns in order
+
+        interpret returns None for a match that should be skipped. Matches are
+        visited exactly as `re.finditer(pattern, text, re.IGNORECASE)` would
+        visit them for each pattern in turn.
+        """
+        folded = fold_case(text)
+
+        for index, scanner in enumerate(self.scanners):
+            if not any(literal in folded for literal in self.required[index]):
+                continue  # Pattern cannot match anywhere in this text
+
+            position = 0
+            while True:
+                hit = scanner.search(folded, position)
+                if hit is None:
+                    break
+                match = self.patterns[index].match(text, hit.start())
+                if match is None:
+                    position = hit.start() + 1  # A scanner-only hit; the next match may start inside it
+                    continue
+                value = interpret(index, match)
+                if value is not None:
+                    return value
+                position = max(match.end(), hit.start() + 1)
+
+        return None
+
+
+CGPA_BANK = PatternBank(CGPA_SOURCES)
+ACADEMIC_YEAR_BANK = PatternBank(ACADEMIC_YEAR_SOURCES)
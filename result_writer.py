@@ -0,0 +1,93 @@
+"""
+Background writer for classification results
+Job threads hand their chunks to a single writer thread, which drains
+whatever is queued (from every concurrent upload) and stores it with one
+models.save_results transaction. Under load many chunks share a commit
+instead of each paying for its own.
+
+The thread is started by the first write() in each process: with gunicorn's
+preload_app the writer is created in the master, and threads do not survive
+the fork into the workers.
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from config import Config
+from models import save_results
+
+
+class ResultWriter:
+    def __init__(self, max_rows=None):
+        self.max_rows = max_rows or Config.RESULT_WRITER_MAX_ROWS
+        self._lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+        self._thread = None
+
+    def _ensure_thread(self):
+        """Start the writer thread in this process if it isn't running (e.g. after a fork)"""
+        with self._lock:
+            if self._pid != os.getpid() or not self._thread.is_alive():
+                # A queue inherited through a fork may hold items (and a lock) of the parent's thread
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(target=self._run, args=(self._queue,), name='result-writer',
+                                                daemon=True)
+                self._thread.start()
+                self._pid = os.getpid()
+            return self._queue
+
+    def write(self, job_id, user_id, candidates):
+        """Queue a chunk of (position, classification) for storage; the Future resolves once it is committed"""
+        future = Future()
+        self._ensure_thread().put((job_id, user_id, candidates, future))
+        return future
+
+    def close(self):
+        """Write everything queued so far and stop the writer thread"""
+        with self._lock:
+            if self._pid != os.getpid() or not self._thread.is_alive():
+                return
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self, items):
+        while True:
+            item = items.get()
+            if item is None:
+                return
+
+            # Coalesce everything already waiting, up to max_rows
+            pending = [item]
+            rows = len(item[2])
+            stop = False
+            while rows < self.max_rows:
+                try:
+                    item = items.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                pending.append(item)
+                rows += len(item[2])
+
+            try:
+                save_results([(job_id, user_id, candidates) for job_id, user_id, candidates, _ in pending])
+            except Exception:
+                # Retry chunk by chunk so one bad chunk only fails its own job
+                for job_id, user_id, candidates, future in pending:
+                    try:
+                        save_results([(job_id, user_id, candidates)])
+                    except Exception as e:
+                        print(f"ERROR: Writing results for job {job_id} failed: {str(e)}")  # Log exception
+                        future.set_exception(e)
+                    else:
+                        future.set_result(len(candidates))
+            else:
+                for _, _, candidates, future in pending:
+                    future.set_result(len(candidates))
+
+            if stop:
+                return
@@ -0,0 +1,32 @@
+"""
+Result export columns
+One row per classified candidate, shared by /export_results and the bulk
+scoring CLI so both produce the same file layout.
+"""
+
+EXPORT_COLUMNS = [
+    'Filename', 'Category', 'CGPA', 'Academic Year', 'Company Law',
+    'Contract Law', 'Legal Research', 'Moot Court', 'Preference Score',
+    'Long-term Eligible', 'Short-term Eligible'
+]
+
+
+def export_row(result):
+    """Values of EXPORT_COLUMNS for one classification (as stored in candidates.details)"""
+    long_term_eval = result.get('long_term_evaluation', {})
+    short_term_eval = result.get('short_term_evaluation', {})
+    criteria_met = long_term_eval.get('criteria_met', {})
+
+    return [
+        result.get('filename', ''),
+        result.get('final_category', ''),
+        result.get('cgpa', 'N/A'),
+        result.get('academic_year', 'N/A'),
+        'Yes' if criteria_met.get('company_law', False) else 'No',
+        'Yes' if criteria_met.get('contract_law', False) else 'No',
+        'Yes' if criteria_met.get('legal_research', False) else 'No',
+        'Yes' if result.get('moot_court_experience', False) else 'No',
+        result.get('preference_score', 0),
+        'Yes' if long_term_eval.get('eligible', False) else 'No',
+        'Yes' if short_term_eval.get('eligible', False) else 'No'
+    ]
@@ -1,29 +1,56 @@
-
-import re
-import PyPDF2
 import docx
 import mammoth
 from datetime import datetime
+import hashlib
+import json
 import os
-from transformers import AutoTokenizer, AutoModelForTokenClassification
-import torch
 from config import Config
-from criteria_evaluator import CriteriaEvaluator 
+from criteria_evaluator import CriteriaEvaluator
+import model_registry
+import extraction_pool
+from keyword_matcher import KeywordMatcher
+import regex_bank
+import pdf_engines
+import metrics
+from parse_cache import ParseCache, file_sha256
+from near_duplicates import NearDuplicateIndex
+
+# Bump whenever extraction or parsing logic changes so cached results are invalidated
+PARSER_VERSION = "7"
+
+
+def resume_name(source):
+    """File name of a resume given as a path or as (filename, data)"""
+    return source[0] if isinstance(source, tuple) else os.path.basename(source)
+
+
+def read_resume(source):
+    """A resume as a file path or (filename, bytes)
+
+    In-memory resumes may be given as (filename, data) with data bytes, a
+    bytearray or memoryview, or a binary file object (e.g. BytesIO or an
+    upload stream), which is read once here.
+    """
+    if not isinstance(source, tuple):
+        return source
+    filename, data = source
+    if hasattr(data, 'read'):
+        data = data.read()
+    # bytes pickles to the extraction pool; a memoryview does not
+    return filename, data if isinstance(data, bytes) else bytes(data)
 
 class ResumeParser:
-    def __init__(self):
-        # Define comprehensive keyword sets for different criteria
-        # --- BERT model and tokenizer initialization (Added) ---
+    def __init__(self, ner_model=None):
+        # The BERT model and tokenizer are shared process-wide and loaded lazily
+        # (see model_registry), so constructing a parser is cheap. Pass an
+        # explicit ner_model to compare inference backends side by side.
+        self._ner_model = ner_model
+        self.criteria_evaluator = CriteriaEvaluator()
+        self.parse_cache = ParseCache() if Config.PARSE_CACHE_ENABLED else None
+        self.near_duplicates = NearDuplicateIndex() if Config.NEAR_DUPLICATE_ENABLED else None
+        self.pdf_engines = pdf_engines.create_engines()  # Tried in order until one gives usable text
 
-        self.tokenizer = AutoTokenizer.from_pretrained("dslim/bert-base-NER")  # Added
-        self.model = AutoModelForTokenClassification.from_pretrained("dslim/bert-base-NER")  # Added
-        self.label_list = self.model.config.id2label  # Added
-
-        # --- BERT model accuracy (for UI display) ---
-        self.bert_model_accuracy = getattr(self.model.config, "id2label", None)
-        self.bert_model_accuracy_score = getattr(self.model.config, "num_labels", None)
-        # --------------------------------------------------------
-        
+        # Define comprehensive keyword sets for different criteria
         self.company_law_keywords = [
             "company law", "corporate law", "companies act", "corporate governance",
             "mergers and acquisitions", "m&a", "corporate compliance", "board meetings",
@@ -55,6 +82,71 @@ class ResumeParser:
 
         self.tier_firms = Config.get_tier_firms()
 
+        # One automaton over every keyword set, so a single scan finds all hits
+        self.keyword_matcher = KeywordMatcher({
+            'company_law': self.company_law_keywords,
+            'contract_law': self.contract_law_keywords,
+            'legal_research': self.legal_research_keywords,
+            'moot_court': self.moot_court_keywords,
+            'tier_firms': self.tier_firms
+        })
+        self._list_matchers = {}
+
+        # Per-resume debug output (text preview, entities, scores) is only built at LOG_LEVEL=DEBUG
+        self.debug = Config.LOG_LEVEL == 'DEBUG'
+
+        self.cache_version = self.compute_cache_version()
+        self.ner_version = self.compute_ner_version()
+
+    def compute_cache_version(self):
+        """Version tag covering everything that affects a parse result"""
+        fingerprint = json.dumps([
+            PARSER_VERSION,
+            Config.NER_MODEL_NAME, Config.NER_BACKEND,
+            Config.NER_SLIDING_WINDOW, Config.NER_WINDOW_SIZE, Config.NER_WINDOW_STRIDE,
+            self.pdf_text_budget(), [engine.name for engine in self.pdf_engines],
+            self.company_law_keywords, self.contract_law_keywords,
+            self.legal_research_keywords, self.moot_court_keywords, self.tier_firms
+        ])
+        return hashlib.sha256(fingerprint.encode()).hexdigest()[:16]
+
+    def compute_ner_version(self):
+        """Version tag covering the model settings behind stored NER output (see near_duplicates)"""
+        fingerprint = json.dumps([
+            Config.NER_MODEL_NAME, Config.NER_BACKEND,
+            Config.NER_SLIDING_WINDOW, Config.NER_WINDOW_SIZE, Config.NER_WINDOW_STRIDE
+        ])
+        return hashlib.sha256(fingerprint.encode()).hexdigest()[:16]
+
+    @property
+    def ner_model(self):
+        return self._ner_model or model_registry.get_ner_model()
+
+    @property
+    def tokenizer(self):
+        return self.ner_model.tokenizer
+
+    @property
+    def model(self):
+        return self.ner_model.model
+
+    @property
+    def ner_backend(self):
+        return self.ner_model.backend
+
+    @property
+    def label_list(self):
+        return self.ner_model.label_list
+
+    # --- BERT model accuracy (for UI display) ---
+    @property
+    def bert_model_accuracy(self):
+        return getattr(self.model.config, "id2label", None)
+
+    @property
+    def bert_model_accuracy_score(self):
+        return getattr(self.model.config, "num_labels", None)
+
     # def process_text_with_bert(self, text):
     #     inputs = self.tokenizer(text, return_tensors="pt", truncation=True, max_length=512)
     #     outputs = self.model(**inputs)
@@ -68,52 +160,160 @@ class ResumeParser:
     #             entities.append((token, label))
     #     return entities
     def process_text_with_bert(self, text):
-        inputs = self.tokenizer(text, return_tensors="pt", truncation=True, max_length=512)
-        outputs = self.model(**inputs)
-        
-        # Get predictions and confidence scores
-        predictions = torch.argmax(outputs.logits, dim=2)
-        
-        # Calculate confidence scores using softmax
-        probabilities = torch.softmax(outputs.logits, dim=2)
-        confidence_scores = torch.max(probabilities, dim=2)[0]  # Get max probability for each token
-        
-        tokens = self.tokenizer.convert_ids_to_tokens(inputs["input_ids"][0])
-        entities = []
-        confidence_sum = 0.0
-        valid_predictions = 0
-        
-        for token, prediction, confidence in zip(tokens, predictions[0], confidence_scores[0]):
-            label = self.label_list[prediction.item()]
-            if label != "O":  # Only count non-"Other" predictions
-                entities.append((token, label))
-                confidence_sum += confidence.item()
-                valid_predictions += 1
-        
-        # Calculate average confidence for this text
-        avg_confidence = (confidence_sum / valid_predictions * 100) if valid_predictions > 0 else 0.0
-        
-        return entities, round(avg_confidence, 2)
-
-
+        """Run BERT NER over a single text and return (entities, confidence)"""
+        return self.process_texts_with_bert([text])[0]
+
+    def process_texts_with_bert(self, texts):
+        """Run BERT NER over many texts, packing all their windows into padded tensor batches"""
+        import torch
+
+        if not texts:
+            return []
+
+        with metrics.timer('tokenize'):
+            windows = self.tokenize_windows(texts)
+        window_to_text = windows.get("overflow_to_sample_mapping", list(range(len(texts))))
+        # One dict per text mapping a token's character span to its best prediction
+        merged_tokens = [{} for _ in texts]
+        batch_size = max(1, Config.NER_BATCH_SIZE)
+
+        for start in range(0, len(windows["input_ids"]), batch_size):
+            model_inputs = {
+                name: windows[name][start:start + batch_size]
+                for name in ("input_ids", "attention_mask", "token_type_ids") if name in windows
+            }
+            with metrics.timer('forward'):
+                logits = self.ner_backend.logits(model_inputs)
+
+            # Get predictions and confidence scores
+            predictions = torch.argmax(logits, dim=2)
+
+            # Calculate confidence scores using softmax
+            probabilities = torch.softmax(logits, dim=2)
+            confidence_scores = torch.max(probabilities, dim=2)[0]  # Get max probability for each token
+
+            for offset in range(len(model_inputs["input_ids"])):
+                row = start + offset
+                self.merge_window_predictions(
+                    merged_tokens[int(window_to_text[row])], windows, row,
+                    predictions[offset].tolist(), confidence_scores[offset].tolist()
+                )
+
+        results = []
+        for merged in merged_tokens:
+            entities = []
+            confidence_sum = 0.0
+            valid_predictions = 0
+
+            for span in sorted(merged):
+                token, label, confidence, _ = merged[span]
+                if label != "O":  # Only count non-"Other" predictions
+                    entities.append((token, label))
+                    confidence_sum += confidence
+                    valid_predictions += 1
+
+            # Calculate average confidence for this text
+            avg_confidence = (confidence_sum / valid_predictions * 100) if valid_predictions > 0 else 0.0
+            results.append((entities, round(avg_confidence, 2)))
+
+        return results
+
+    def tokenize_windows(self, texts):
+        """Tokenize texts into model windows, overlapping them when sliding-window NER is enabled"""
+        options = {
+            "return_tensors": "pt",
+            "truncation": True,
+            "max_length": Config.NER_WINDOW_SIZE,
+            "padding": True,
+            "return_offsets_mapping": True,
+            "return_special_tokens_mask": True,
+        }
+        if Config.NER_SLIDING_WINDOW:
+            # Cover the whole document instead of silently dropping everything after the first window
+            options["return_overflowing_tokens"] = True
+            options["stride"] = Config.NER_WINDOW_STRIDE
+        return self.tokenizer(texts, **options)
+
+    def merge_window_predictions(self, merged, windows, row, predictions, confidences):
+        """Fold one window's token predictions into its text's merged predictions"""
+        length = int(windows["attention_mask"][row].sum().item())
+        tokens = self.tokenizer.convert_ids_to_tokens(windows["input_ids"][row][:length])
+        offsets = windows["offset_mapping"][row].tolist()
+        special_tokens = windows["special_tokens_mask"][row].tolist()
+
+        for position in range(length):
+            if special_tokens[position]:
+                continue  # [CLS]/[SEP] repeat in every window and are not entities
+
+            span = tuple(offsets[position])
+            # Tokens near a window edge see less context, so keep the most central prediction
+            centrality = min(position, length - 1 - position)
+            current = merged.get(span)
+            if current is None or centrality > current[3]:
+                label = self.label_list[predictions[position]]
+                merged[span] = (tokens[position], label, confidences[position], centrality)
+
+
+
+    def iter_pdf_pages(self, file_path, max_chars=None, engine=None):
+        """Yield the text of each PDF page (ending in a line break) as it is extracted
+
+        file_path may also be the PDF's bytes. Uses the first configured engine
+        unless one is given, and stops reading further pages once max_chars
+        characters have been yielded.
+        """
+        seen = 0
+        for page_text in (engine or self.pdf_engines[0]).iter_pages(file_path):
+            yield page_text
+            seen += len(page_text)
+            if max_chars is not None and seen >= max_chars:
+                return
+
+    def pdf_text_budget(self):
+        """Characters of PDF text worth extracting, or None for the whole document"""
+        if not Config.PDF_EARLY_STOP:
+            return None
+        return Config.NER_WINDOW_SIZE * Config.PDF_CHARS_PER_TOKEN
+
+    def extract_pdf(self, file_path, filename=None):
+        """Extract PDF text with the first engine whose output looks usable
+
+        Returns (text, engine name, keyword hits as match_keywords gives them,
+        or None). Keywords are matched page by page while the engine is still
+        reading later pages. file_path may also be the PDF's bytes (name it
+        with filename for debug output). When every engine's output is empty
+        or garbled, the first non-empty one is kept.
+        """
+        fallback = None
+        error = None
+        for engine in self.pdf_engines:
+            try:
+                # Joined once at the end; building the string with += is quadratic on long CVs
+                text, keyword_hits = self.keyword_matcher.find_all_chunks(
+                    self.iter_pdf_pages(file_path, self.pdf_text_budget(), engine)
+                )
+            except Exception as e:
+                error = e
+                problem = f"error ({e})"
+            else:
+                problem = pdf_engines.text_problem(text)
+                if problem is None:
+                    return text, engine.name, keyword_hits
+                if fallback is None and text.strip():
+                    fallback = (text, engine.name, keyword_hits)
+
+            if self.debug:
+                print(f"PDF engine {engine.name} gave unusable text for {filename or os.path.basename(file_path)}: {problem}")
+
+        if fallback:
+            return fallback
+        if error is not None:
+            return f"Error reading PDF: {str(error)}", None, None
+        return "", None, None
 
     def extract_text_from_pdf(self, file_path):
-        """Extract text from PDF file using PyPDF2"""
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page_num, page in enumerate(pdf_reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-                    except Exception as e:
-                        print(f"Error reading page {page_num}: {e}")
-                        continue
-                return text
-        except Exception as e:
-            return f"Error reading PDF: {str(e)}"
+        """Extract text from PDF file"""
+        return self.extract_pdf(file_path)[0]
 
     # def extract_text_from_docx(self, file_path):
     #     """Extract text from DOCX file"""
@@ -130,10 +330,9 @@ class ResumeParser:
     #                     text += cell.text + "\t"
     #                 text += "\n"
     def extract_text_from_docx(self, file_path):
-        """Extract text from DOCX file"""
+        """Extract text from DOCX file (a path or the file's bytes)"""
         try:
-            with open(file_path, "rb") as docx_file:
-                import mammoth
+            with pdf_engines.open_document(file_path) as docx_file:
                 result = mammoth.extract_raw_text(docx_file)
                 text = result.value
 
@@ -147,177 +346,132 @@ class ResumeParser:
 
     def extract_cgpa(self, text):
         """Extract CGPA/GPA from resume text with IMPROVED pattern matching"""
-        # Clean text for better pattern matching
-        text = re.sub(r'\s+', ' ', text)
-
-        # Enhanced patterns to catch ALL CGPA/GPA/Percentage formats
-        patterns = [
-            # Standard formats: CGPA: 8.5, GPA: 3.8, G.P.A: 7.5
-            r'(?:CGPA|GPA|G\.P\.A|C\.G\.P\.A|Cumulative GPA)\s*[:-–]?\s*(?:\(Avg\.\)\s*[-–]\s*)?([0-9]+(?:\.[0-9]+)?)(?:\s*/\s*([0-9]+))?',
-            # Reverse formats: 8.5 CGPA, 3.8 GPA  
-            r'([0-9]+(?:\.[0-9]+)?)\s*(?:CGPA|GPA|G\.P\.A|C\.G\.P\.A)(?:\s*/\s*([0-9]+))?',
-            # Fraction formats: 8.5/10, 3.8/4.0
-            r'(?:CGPA|GPA|G\.P\.A)\s*[:-–]?\s*([0-9]+(?:\.[0-9]+)?)\s*/\s*([0-9]+(?:\.[0-9]+)?)',
-            # Academic performance indicators
-            r'(?:Academic Performance|Overall Grade|Cumulative Grade)\s*[:-–]?\s*([0-9]+(?:\.[0-9]+)?)(?:\s*/\s*([0-9]+))?',
-            # Percentage formats: 66% (1st Class), 95.4%
-            r'\b([0-9]+(?:\.[0-9]+)?)\s*%\s*(?:\([^)]*\))?',
-            # B.A. LL.B. (Hons.) – School Name – 66% format
-            r'[–-]\s*([0-9]+(?:\.[0-9]+)?)\s*%\s*(?:\([^)]*\))?'
-        ]
+        # All CGPA/GPA/Percentage formats are scanned in a single pass (see regex_bank)
+        return regex_bank.CGPA_BANK.first_valid(text, self.interpret_cgpa_match)
 
-        for i, pattern in enumerate(patterns):
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    if i >= 4:  # Percentage patterns (last two)
-                        percentage = float(match.group(1))
-                        # Convert percentage to CGPA estimate
-                        if percentage >= 90:
-                            cgpa = 9.0 + (percentage - 90) / 10
-                        elif percentage >= 80:
-                            cgpa = 8.0 + (percentage - 80) / 10
-                        elif percentage >= 70:
-                            cgpa = 7.0 + (percentage - 70) / 10
-                        elif percentage >= 60:
-                            cgpa = 6.0 + (percentage - 60) / 10
-                        else:
-                            cgpa = percentage / 10  # Basic conversion
-                        return min(cgpa, 10.0)
-                    else:
-                        cgpa = float(match.group(1))
-                        max_cgpa = float(match.group(2)) if len(match.groups()) > 1 and match.group(2) else None
-
-                        # Normalize to 10 scale if necessary
-                        if max_cgpa:
-                            if max_cgpa == 4.0:
-                                cgpa = (cgpa / 4.0) * 10.0
-                            elif max_cgpa == 5.0:
-                                cgpa = (cgpa / 5.0) * 10.0
-
-                        # Validate CGPA range
-                        if 0 <= cgpa <= 10:
-                            return cgpa
-                except ValueError:
-                    continue
+    def interpret_cgpa_match(self, pattern_index, match):
+        """Turn a CGPA pattern match into a 10-point CGPA, or None to keep looking"""
+        try:
+            if pattern_index in regex_bank.CGPA_PERCENTAGE_PATTERNS:
+                percentage = float(match.group(1))
+                # Convert percentage to CGPA estimate
+                if percentage >= 90:
+                    cgpa = 9.0 + (percentage - 90) / 10
+                elif percentage >= 80:
+                    cgpa = 8.0 + (percentage - 80) / 10
+                elif percentage >= 70:
+                    cgpa = 7.0 + (percentage - 70) / 10
+                elif percentage >= 60:
+                    cgpa = 6.0 + (percentage - 60) / 10
+                else:
+                    cgpa = percentage / 10  # Basic conversion
+                return min(cgpa, 10.0)
+
+            cgpa = float(match.group(1))
+            max_cgpa = float(match.group(2)) if len(match.groups()) > 1 and match.group(2) else None
+
+            # Normalize to 10 scale if necessary
+            if max_cgpa:
+                if max_cgpa == 4.0:
+                    cgpa = (cgpa / 4.0) * 10.0
+                elif max_cgpa == 5.0:
+                    cgpa = (cgpa / 5.0) * 10.0
+
+            # Validate CGPA range
+            if 0 <= cgpa <= 10:
+                return cgpa
+        except ValueError:
+            pass
 
         return None
 
     def extract_academic_year(self, text):
         """Extract current academic year from resume with COMPLETE implementation"""
         current_year = datetime.now().year
+        # All academic year indicators are scanned in a single pass (see regex_bank)
+        return regex_bank.ACADEMIC_YEAR_BANK.first_valid(
+            text, lambda pattern_index, match: self.interpret_academic_year_match(pattern_index, match, current_year)
+        )
 
-        # Enhanced patterns to identify academic year
-        year_patterns = [
-            # Direct year mentions: "3rd year", "fourth year"
-            r'\b([1-5])(?:st|nd|rd|th)\s+year\b',
-            r'\b(?:first|second|third|fourth|fifth|1st|2nd|3rd|4th|5th)\s+year\b',
-
-            # Semester patterns: "6th semester", "semester 8"
-            r'\b([1-9]|10)(?:st|nd|rd|th)?\s+semester\b',
-            r'\bsemester\s+([1-9]|10)\b',
-
-            # Year level: "Year 3", "Level 4"
-            r'\b(?:year|level)\s+([1-5])\b',
-
-            # Academic year ranges: "2021-2026", "2024-25", "(2021-26)"
-            r'\(?\s*(20[2-9][0-9])\s*[-–]\s*(?:20)?([2-9][0-9])\s*\)?',
-
-            # Expected graduation: "graduating in 2025", "class of 2024"
-            r'\b(?:graduating|graduation|class of)\s+(?:in\s+)?(20[2-9][0-9])\b',
-
-            # Current enrollment: "currently in 3rd year"
-            r'\bcurrently\s+(?:in\s+)?(?:([1-5])(?:st|nd|rd|th)|([1-9])(?:st|nd|rd|th)?)\s+(?:year|semester)\b',
-
-            # Final-year patterns: "Final-year B.A. LL.B."
-            r'\bfinal[-\s]?year\b'
-        ]
-
+    def interpret_academic_year_match(self, pattern_index, match, current_year):
+        """Turn an academic year pattern match into a year of study (1-5), or None to keep looking"""
         year_words_to_numbers = {
             'first': 1, 'second': 2, 'third': 3, 'fourth': 4, 'fifth': 5,
             '1st': 1, '2nd': 2, '3rd': 3, '4th': 4, '5th': 5
         }
 
-        for pattern_index, pattern in enumerate(year_patterns):
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    # Handle final-year pattern
-                    if pattern_index == 8:  # final-year pattern
-                        return 5
-
-                    # Handle semester patterns
-                    elif pattern_index in [2, 3]:  # semester patterns
-                        if match.group(1) and match.group(1).isdigit():
-                            semester_number = int(match.group(1))
-                            year_number = (semester_number + 1) // 2
-                            if 1 <= year_number <= 5:
-                                return year_number
-
-                    # Handle academic year ranges like "2021-26" or "(2021–2026)"
-                    elif pattern_index == 5:  # Academic year ranges
-                        start_year = int(match.group(1))
-                        end_year_str = match.group(2)
-
-                        # Handle 2-digit or 4-digit end year
-                        if len(end_year_str) == 2:
-                            if int(end_year_str) < 50:
-                                end_year = 2000 + int(end_year_str)
-                            else:
-                                end_year = 1900 + int(end_year_str)
-                        else:
-                            end_year = int(end_year_str)
-
-                        # Calculate current year in the program
-                        years_in_college = current_year - start_year + 1
-
-                        # Validate range (1-5 years for law programs)
-                        if 1 <= years_in_college <= 6:  # Allow up to 6 for flexibility
-                            return min(years_in_college, 5)
-
-                    # Handle graduation year patterns
-                    elif pattern_index == 6:  # graduation patterns
-                        grad_year = int(match.group(1))
-                        years_remaining = grad_year - current_year
-                        if years_remaining == 1:
-                            return 5
-                        elif years_remaining == 2:
-                            return 4
-                        elif years_remaining == 3:
-                            return 3
-
-                    # Handle direct year mentions
-                    else:
-                        year_text = match.group(1) if match.group(1) else match.group(0).split()[0]
-                        if year_text in year_words_to_numbers:
-                            year_number = year_words_to_numbers[year_text]
-                        elif year_text.isdigit():
-                            year_number = int(year_text)
-                        else:
-                            continue
-
-                        if 1 <= year_number <= 5:
-                            return year_number
-
-                except (ValueError, IndexError, AttributeError):
-                    continue
+        try:
+            # Handle final-year pattern
+            if pattern_index == regex_bank.ACADEMIC_YEAR_FINAL_YEAR_PATTERN:
+                return 5
+
+            # Handle semester patterns
+            elif pattern_index in regex_bank.ACADEMIC_YEAR_SEMESTER_PATTERNS:
+                if match.group(1) and match.group(1).isdigit():
+                    semester_number = int(match.group(1))
+                    year_number = (semester_number + 1) // 2
+                    if 1 <= year_number <= 5:
+                        return year_number
+
+            # Handle academic year ranges like "2021-26" or "(2021–2026)"
+            elif pattern_index == regex_bank.ACADEMIC_YEAR_RANGE_PATTERN:
+                start_year = int(match.group(1))
+
+                # Calculate current year in the program
+                years_in_college = current_year - start_year + 1
+
+                # Validate range (1-5 years for law programs)
+                if 1 <= years_in_college <= 6:  # Allow up to 6 for flexibility
+                    return min(years_in_college, 5)
+
+            # Handle graduation year patterns
+            elif pattern_index == regex_bank.ACADEMIC_YEAR_GRADUATION_PATTERN:
+                grad_year = int(match.group(1))
+                years_remaining = grad_year - current_year
+                if years_remaining == 1:
+                    return 5
+                elif years_remaining == 2:
+                    return 4
+                elif years_remaining == 3:
+                    return 3
+
+            # Handle direct year mentions
+            else:
+                year_text = match.group(1) if match.group(1) else match.group(0).split()[0]
+                if year_text in year_words_to_numbers:
+                    year_number = year_words_to_numbers[year_text]
+                elif year_text.isdigit():
+                    year_number = int(year_text)
+                else:
+                    return None
+
+                if 1 <= year_number <= 5:
+                    return year_number
+
+        except (ValueError, IndexError, AttributeError):
+            pass
 
         return None
 
+    def match_keywords(self, text):
+        """Find every keyword of every set in one pass: {category: [(keyword, start, end), ...]}"""
+        return self.keyword_matcher.find_all(text)
+
     def check_course_keywords(self, text, keyword_list):
         """Check if any course-related keywords are present in text"""
-        text_lower = text.lower()
-        found_keywords = []
-
-        for keyword in keyword_list:
-            keyword_lower = keyword.lower()
-            if keyword_lower in text_lower:
-                found_keywords.append(keyword)
+        key = tuple(keyword_list)
+        matcher = self._list_matchers.get(key)
+        if matcher is None:
+            matcher = self._list_matchers[key] = KeywordMatcher({'keywords': keyword_list})
 
+        found_keywords = matcher.found_keywords(matcher.find_all(text), 'keywords')
         return len(found_keywords) > 0, found_keywords
 
-    def extract_experience(self, text):
+    def extract_experience(self, text, keyword_hits=None):
         """Extract comprehensive legal experience information"""
+        if keyword_hits is None:
+            keyword_hits = self.match_keywords(text)
+
         experience_info = {
             'legal_research': False,
             'moot_court': False,
@@ -330,101 +484,214 @@ class ResumeParser:
         }
 
         # Check for legal research experience
-        legal_research_found, _ = self.check_course_keywords(text, self.legal_research_keywords)
-        experience_info['legal_research'] = legal_research_found
+        experience_info['legal_research'] = len(keyword_hits['legal_research']) > 0
 
         # Check for moot court experience
-        moot_court_found, _ = self.check_course_keywords(text, self.moot_court_keywords)
-        experience_info['moot_court'] = moot_court_found
+        experience_info['moot_court'] = len(keyword_hits['moot_court']) > 0
 
         # Check for M&A specific moot experience
-        ma_moot_patterns = [
-            r'\b(?:m&a|merger|acquisition)\s+moot\b',
-            r'\bcorporate\s+law\s+moot\b',
-            r'\bcompany\s+law\s+moot\b'
-        ]
-        for pattern in ma_moot_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                experience_info['ma_moot_experience'] = True
-                break
+        if regex_bank.MA_MOOT_PATTERN.search(text):
+            experience_info['ma_moot_experience'] = True
 
         # Extract internship information and check for tier firms
-        for firm in self.tier_firms:
-            if firm.lower() in text.lower():
-                experience_info['tier_firm_internship'] = True
-                experience_info['internships'].append(f"Experience at {firm}")
-                break
+        firms_found = self.keyword_matcher.found_keywords(keyword_hits, 'tier_firms')
+        if firms_found:
+            experience_info['tier_firm_internship'] = True
+            experience_info['internships'].append(f"Experience at {firms_found[0]}")
 
         return experience_info
 
-    def parse_resume(self, file_path):
-        
-        """Main function to parse resume and extract all relevant information"""
-        if not os.path.exists(file_path):
-            return {"error": "File not found"}
+    def extract_text(self, file_path):
+        """Extract text from a resume file, returning (text, error)"""
+        text, error, _ = self.extract_text_with_engine(file_path)
+        return text, error
+
+    def extract_text_with_engine(self, file_path):
+        """Extract text from a resume file, returning (text, error, name of the engine that produced it)
 
-        file_extension = file_path.lower().split('.')[-1]
+        file_path may also be an in-memory resume, (filename, data) as for parse_resumes.
+        """
+        return self.extract_resume(file_path)[:3]
+
+    def extract_resume(self, file_path):
+        """extract_text_with_engine, plus the keyword hits found while reading the file (or None)"""
+        if isinstance(file_path, tuple):
+            filename, document = read_resume(file_path)
+        elif not os.path.exists(file_path):
+            return None, "File not found", None, None
+        else:
+            filename, document = os.path.basename(file_path), file_path
+
+        file_extension = filename.lower().split('.')[-1]
 
         if file_extension == 'pdf':
-            text = self.extract_text_from_pdf(file_path)
+            text, engine, keyword_hits = self.extract_pdf(document, filename)
         elif file_extension == 'docx':
-            text = self.extract_text_from_docx(file_path)
+            text, engine, keyword_hits = self.extract_text_from_docx(document), 'mammoth', None
         else:
-            return {"error": "Unsupported file format"}
+            return None, "Unsupported file format", None, None
 
         if not text or text.startswith("Error"):
-            return {"error": f"Could not extract text from file: {text}"}
+            return None, f"Could not extract text from file: {text}", engine, None
 
         if len(text.strip()) < 50:
-            return {"error": "Insufficient text content in resume"}
+            return None, "Insufficient text content in resume", engine, None
 
-        # Debug: Print extracted text for troubleshooting
-        print(f"\n=== DEBUG: Parsing {os.path.basename(file_path)} ===")
-        print(f"Text preview: {text[:200]}...")
+        return text, None, engine, keyword_hits
 
-        
-        # --- BERT processing step added ---
-        entities, bert_confidence = self.process_text_with_bert(text)
-        print(f"BERT extracted entities: {entities}")
-        print(f"BERT confidence score: {bert_confidence}%")
-        # ------------------------------------
-
-        # Extract all information with debug output
-        cgpa = self.extract_cgpa(text)
-        academic_year = self.extract_academic_year(text)
-        company_law = self.check_course_keywords(text, self.company_law_keywords)[0]
-        contract_law = self.check_course_keywords(text, self.contract_law_keywords)[0]
-        experience = self.extract_experience(text)
-
-        print(f"CGPA extracted: {cgpa}")
-        print(f"Academic year: {academic_year}")
-        print(f"Company law: {company_law}")
-        print(f"Contract law: {contract_law}")
-        print(f"=== END DEBUG ===\n")
+    def parse_resume(self, file_path):
+        """Main function to parse resume and extract all relevant information"""
+        return self.parse_resumes([file_path])[0]
+
+    def parse_resumes(self, file_paths, user_id=None):
+        """Parse a batch of resumes, running BERT once over all extracted texts
+
+        Each resume is a file path or, to parse it straight from memory
+        without writing it to disk first, a (filename, data) tuple (see
+        read_resume). Near-duplicates are looked for among user_id's resumes.
+        """
+        file_paths = [read_resume(file_path) for file_path in file_paths]
+        results = [None] * len(file_paths)
+        file_hashes = [None] * len(file_paths)
+        pending_indexes = []
+
+        for index, file_path in enumerate(file_paths):
+            if isinstance(file_path, tuple):
+                file_hashes[index] = hashlib.sha256(file_path[1]).hexdigest() if self.parse_cache else None
+            elif self.parse_cache and os.path.exists(file_path):
+                file_hashes[index] = file_sha256(file_path)
+            if file_hashes[index]:
+                cached = self.parse_cache.get(file_hashes[index], self.cache_version)
+                if cached is not None:
+                    # Same bytes may arrive under a different name
+                    cached['filename'] = resume_name(file_path)
+                    results[index] = cached
+                    metrics.RESUMES_PARSED.inc('cached')
+                    continue
+            pending_indexes.append(index)
+
+        # Extract every uncached file in parallel (see extraction_pool)
+        extracted = extraction_pool.extract_texts(self, [file_paths[index] for index in pending_indexes])
+
+        texts = {}
+        text_engines = {}
+        keyword_hits = {}
+        for index, (text, error, engine, hits) in zip(pending_indexes, extracted):
+            if error:
+                results[index] = {"error": error}
+                metrics.RESUMES_PARSED.inc('error')
+            else:
+                texts[index] = text
+                text_engines[index] = engine
+                keyword_hits[index] = hits
+
+        # Match every text against earlier resumes (cached ones included) before BERT
+        duplicates, signature_ids, ner_results = self.match_near_duplicates(file_paths, results, texts, user_id)
+
+        # --- BERT processing step (one batched pass for the whole upload) ---
+        bert_indexes = [index for index in texts if index not in ner_results]
+        bert_results = self.process_texts_with_bert([texts[index] for index in bert_indexes]) if bert_indexes else []
+        # --------------------------------------------------------------------
+        for index, ner in zip(bert_indexes, bert_results):
+            ner_results[index] = ner
+            if index in signature_ids:
+                self.near_duplicates.set_ner(signature_ids[index], self.ner_version, ner)
+
+        for index, text in texts.items():
+            entities, bert_confidence = ner_results[index]
+            results[index] = self.build_parsed_info(
+                file_paths[index], text, entities, bert_confidence, text_engines[index], keyword_hits[index]
+            )
+            metrics.RESUMES_PARSED.inc('parsed')
+            if file_hashes[index]:
+                self.parse_cache.put(file_hashes[index], self.cache_version, results[index])
+
+        # Kept out of the cache: whether a resume is a duplicate depends on what came before it
+        for index, duplicate in duplicates.items():
+            results[index].update(duplicate)
+        return results
+
+    def match_near_duplicates(self, file_paths, results, texts, user_id=None):
+        """Look up each parsed text in user_id's near-duplicate index and add it there
+
+        Returns ({index: duplicate fields for parsed_info}, {index: signature
+        id}, {index: reusable (entities, confidence)}) for the texts being
+        parsed (texts) and cached results alike.
+        """
+        duplicates, signature_ids, ner_results = {}, {}, {}
+        if not self.near_duplicates:
+            return duplicates, signature_ids, ner_results
+
+        with metrics.timer('minhash'):
+            for index, file_path in enumerate(file_paths):
+                text = texts.get(index)
+                if text is None and results[index] and 'error' not in results[index]:
+                    text = results[index].get('text')
+                signature = self.near_duplicates.signature(text) if text else None
+                if signature is None:
+                    continue
+
+                match = self.near_duplicates.find(signature, self.ner_version, user_id)
+                signature_ids[index], group_id = self.near_duplicates.add(
+                    signature, resume_name(file_path), match['group_id'] if match else None, user_id
+                )
+                duplicates[index] = {'duplicate_group': group_id}
+                if match:
+                    duplicates[index]['near_duplicate'] = {'filename': match['filename'],
+                                                           'similarity': match['similarity']}
+                    if match['ner'] and Config.NEAR_DUPLICATE_SKIP_NER and index in texts:
+                        ner_results[index] = match['ner']
+                        self.near_duplicates.set_ner(signature_ids[index], self.ner_version, match['ner'])
+                        metrics.RESUMES_PARSED.inc('ner_reused')
+        return duplicates, signature_ids, ner_results
+
+    def build_parsed_info(self, file_path, text, entities, bert_confidence, text_engine=None, keyword_hits=None):
+        """Run the rule-based extractors over text and assemble the parsed resume
+
+        keyword_hits are the text's keyword matches when extraction already
+        found them page by page (see extract_pdf); otherwise they are found here.
+        """
+        if self.debug:
+            # Debug: Print extracted text for troubleshooting
+            print(f"\n=== DEBUG: Parsing {resume_name(file_path)} ===")
+            print(f"Text preview: {text[:200]}...")
+            print(f"BERT extracted entities: {entities}")
+            print(f"BERT confidence score: {bert_confidence}%")
+
+        # Extract all information
+        with metrics.timer('regex'):
+            cgpa = self.extract_cgpa(text)
+            academic_year = self.extract_academic_year(text)
+        with metrics.timer('keywords'):
+            if keyword_hits is None:
+                keyword_hits = self.match_keywords(text)
+            company_law = len(keyword_hits['company_law']) > 0
+            contract_law = len(keyword_hits['contract_law']) > 0
+            experience = self.extract_experience(text, keyword_hits)
+
+        if self.debug:
+            print(f"CGPA extracted: {cgpa}")
+            print(f"Academic year: {academic_year}")
+            print(f"Company law: {company_law}")
+            print(f"Contract law: {contract_law}")
+            print(f"=== END DEBUG ===\n")
         
         parsed_info = {
-            'filename': os.path.basename(file_path),
+            'filename': resume_name(file_path),
             'cgpa': cgpa,
             'academic_year': academic_year,
             'company_law': company_law,
             'contract_law': contract_law,
             'experience': experience,
             'text_length': len(text),
+            'text_engine': text_engine,  # Which extractor produced the text (e.g. pypdf2, mammoth)
             'raw_text_preview': text[:Config.TEXT_PREVIEW_LENGTH] + "..." if len(text) > Config.TEXT_PREVIEW_LENGTH else text,
+            'text': text,  # Full text, for the search index (see models.save_results)
             'bert_confidence': bert_confidence, # Include BERT confidence score
             'bert_entities_count': len(entities)
 
 
 
         }
-        preference_score, preference_details = CriteriaEvaluator().calculate_preference_score(parsed_info)
-        parsed_info['preference_details'] = preference_details  # Ensure preference_details is included
-
-        parsed_info['preference'] = preference_score
-        parsed_info['preference_explanation'] = "; ".join(
-            [f"{k.replace('_', ' ').title()}: {v} points" for k, v in preference_details.items() if v > 0]
-        )
-        # Debug: Print preference details to verify
-        print(f"Preference details: {preference_details}")
+        # Scoring, preference points included, is left to the rule engine (see CriteriaEvaluator)
         return parsed_info
-
@@ -0,0 +1,395 @@
+"""
+Declarative screening criteria
+A criteria profile (criteria/<name>.json, or .yaml with PyYAML installed)
+lists the checks a candidate is scored on, the points each check is worth in
+every evaluation (long_term, short_term, ...), the preference bonus points and
+how evaluations map to a final category; criteria/ma_team.json reproduces the
+original M&A screening rules. compile_profiles turns one or more profiles into
+a RuleSet: the fields they use are read from a parsed resume once, and every
+profile is scored from them, either per candidate or over NumPy columns for a
+whole batch.
+"""
+
+import hashlib
+import json
+import os
+import re
+import numpy as np
+from config import Config
+
+CRITERIA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'criteria')
+_NAME_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def load_profile(name_or_path):
+    """Read a profile spec by name (from criteria/) or from a .json/.yaml path"""
+    path = name_or_path
+    if not os.path.splitext(path)[1]:
+        path = next((os.path.join(CRITERIA_DIR, name_or_path + extension)
+                     for extension in ('.json', '.yaml', '.yml')
+                     if os.path.exists(os.path.join(CRITERIA_DIR, name_or_path + extension))),
+                    os.path.join(CRITERIA_DIR, name_or_path + '.json'))
+
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError(f"PyYAML is needed to read the criteria profile {path} (pip install pyyaml)")
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+def read_field(parsed_resume, keys):
+    """Value at a dotted field path split into keys, or None if missing"""
+    value = parsed_resume
+    for key in keys:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+class Criterion:
+    """One check on a parsed-resume field
+
+    {"field": f} is met when the field is truthy, {"field": f, "in": [...]}
+    when its value is listed (the list may be keyed by course type, "*" for any
+    other) and {"field": f, "at_least": n} when it is at least n (n may name a
+    profile parameter such as "cgpa_minimum"). Missing values never meet a check.
+    """
+
+    def __init__(self, name, spec, parameters):
+        self.name = name
+        self.field = spec['field']
+        self.allowed = spec.get('in')
+        self.minimum = spec.get('at_least')
+        if self.allowed is not None and self.minimum is not None:
+            raise ValueError(f"criterion '{name}' has both 'in' and 'at_least'")
+        if isinstance(self.minimum, str) and self.minimum not in parameters:
+            raise ValueError(f"criterion '{name}' uses undefined parameter '{self.minimum}'")
+        self.kind = 'flag' if self.allowed is None and self.minimum is None else 'number'
+
+    def allowed_values(self, params):
+        if isinstance(self.allowed, dict):
+            return self.allowed.get(params['course_type'], self.allowed.get('*', []))
+        return self.allowed
+
+    def threshold(self, params):
+        return params[self.minimum] if isinstance(self.minimum, str) else self.minimum
+
+    def test(self, features, params):
+        value = features[self.field]
+        if self.kind == 'flag':
+            return value
+        if value is None:
+            return False
+        if self.allowed is not None:
+            return value in self.allowed_values(params)
+        return value >= self.threshold(params)
+
+    def test_column(self, columns, params):
+        values = columns[self.field]
+        if self.kind == 'flag':
+            return values
+        if self.allowed is not None:
+            return np.isin(values, self.allowed_values(params))  # NaN (missing) is never listed
+        return values >= self.threshold(params)  # NaN (missing) compares False
+
+
+class Evaluation:
+    """Points per met criterion; eligible when all are met ("all") or at a minimum score"""
+
+    def __init__(self, name, spec, criteria):
+        self.name = name
+        self.key = f"{name}_evaluation"
+        self.points = list(spec['points'].items())
+        self.reported = [criterion for criterion, _ in self.points] + list(spec.get('informational', []))
+        for criterion in self.reported:
+            if criterion not in criteria:
+                raise ValueError(f"evaluation '{name}' uses undefined criterion '{criterion}'")
+        self.max_score = sum(points for _, points in self.points)
+        if self.max_score <= 0:
+            raise ValueError(f"evaluation '{name}' awards no points")
+        eligible = spec.get('eligible', 'all')
+        self.min_score = self.max_score if eligible == 'all' else eligible['min_score']
+
+    def result(self, met):
+        score = 0
+        for criterion, points in self.points:
+            if met[criterion]:
+                score += points
+        return {
+            'eligible': score >= self.min_score,
+            'score': score,
+            'max_score': self.max_score,
+            'percentage': (score / self.max_score) * 100,
+            'criteria_met': {criterion: met[criterion] for criterion in self.reported},
+            'category': self.name
+        }
+
+    def score_column(self, met, count):
+        score = np.zeros(count, dtype=np.int64)
+        for criterion, points in self.points:
+            score += np.where(met[criterion], points, 0)
+        return score
+
+
+class Profile:
+    """A compiled criteria profile (see criteria/ma_team.json for the format)"""
+
+    def __init__(self, spec):
+        self.name = spec['name']
+        self.label = spec.get('label', self.name)
+        try:
+            self.parameters = dict(spec.get('parameters', {}))
+            self.criteria = {name: Criterion(name, criterion_spec, self.parameters)
+                             for name, criterion_spec in spec['criteria'].items()}
+            self.evaluations = [Evaluation(name, evaluation_spec, self.criteria)
+                                for name, evaluation_spec in spec['evaluations'].items()]
+            self.preference_points = [(item['name'], item['field'], item['points']) for item in spec.get('preference', [])]
+
+            categories = spec['categories']
+            self.default_category = categories['default']
+            self.first_eligible = {internship_type: [tuple(rule) for rule in rules]
+                                   for internship_type, rules in categories['first_eligible'].items()}
+            self.required = list(categories.get('required', []))
+            self.exception = categories.get('exception')
+
+            evaluation_names = {evaluation.name for evaluation in self.evaluations}
+            for rules in self.first_eligible.values():
+                for evaluation_name, _ in rules:
+                    if evaluation_name not in evaluation_names:
+                        raise ValueError(f"category rule uses undefined evaluation '{evaluation_name}'")
+            for criterion in self.required:
+                if criterion not in self.criteria:
+                    raise ValueError(f"required criterion '{criterion}' is undefined")
+            names = [self.name] + list(self.criteria) + list(evaluation_names)
+            for name in names + [name for name, _, _ in self.preference_points]:
+                if not _NAME_PATTERN.match(name):
+                    raise ValueError(f"'{name}' is not a valid name (letters, digits and underscores)")
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Criteria profile '{self.name}' is malformed: missing or invalid {e}")
+        except ValueError as e:
+            raise ValueError(f"Criteria profile '{self.name}': {e}")
+
+        # Category codes for batch results: the default first, then every category the rules can assign
+        self.categories = [self.default_category]
+        for rules in self.first_eligible.values():
+            for _, category in rules:
+                if category not in self.categories:
+                    self.categories.append(category)
+        if self.exception and self.exception['category'] not in self.categories:
+            self.categories.append(self.exception['category'])
+        self.category_names = np.array(self.categories, dtype=object)
+
+    @property
+    def fields(self):
+        """Fields read by this profile, as {dotted path: 'flag' or 'number'}"""
+        fields = {criterion.field: criterion.kind for criterion in self.criteria.values()}
+        for _, field, _ in self.preference_points:
+            fields.setdefault(field, 'flag')
+        return fields
+
+    def params(self, course_type, internship_type, overrides):
+        params = dict(self.parameters)
+        params.update((name, value) for name, value in overrides.items() if value is not None)
+        params['course_type'] = course_type
+        params['internship_type'] = internship_type
+        return params
+
+    def category_rules(self, internship_type):
+        return self.first_eligible.get(internship_type, self.first_eligible.get('*', []))
+
+    def preference(self, features):
+        """(preference score, points per preference item)"""
+        preference_score = 0
+        preference_details = {}
+        for name, field, points in self.preference_points:
+            preference_details[name] = points if features[field] else 0
+            preference_score += preference_details[name]
+        return preference_score, preference_details
+
+    def classify(self, parsed_resume, features, params):
+        """Classification dict for one candidate"""
+        met = {name: criterion.test(features, params) for name, criterion in self.criteria.items()}
+        evaluations = {evaluation.key: evaluation.result(met) for evaluation in self.evaluations}
+        preference_score, preference_details = self.preference(features)
+
+        final_category = self.default_category
+        for evaluation_name, category in self.category_rules(params['internship_type']):
+            if evaluations[f"{evaluation_name}_evaluation"]['eligible']:
+                final_category = category
+                break
+
+        special_consideration = None
+        if not all(met[criterion] for criterion in self.required):
+            # A high preference score may compensate for a missed required criterion
+            if self.exception and preference_score >= self.exception['min_preference']:
+                final_category = self.exception['category']
+                special_consideration = self.exception.get('note', '')
+            else:
+                final_category = self.default_category
+
+        return self._classification(parsed_resume, evaluations, preference_score, preference_details,
+                                    final_category, special_consideration)
+
+    def classify_columns(self, columns, params, count):
+        """Vectorized classify over columnar features
+
+        Returns a dict of arrays: 'criteria' (met flags per criterion),
+        'evaluations' ({name: {'eligible', 'score'}}), 'preference_score',
+        'preference_details', 'category' (codes into self.categories) and
+        'special_consideration' flags.
+        """
+        met = {name: criterion.test_column(columns, params) for name, criterion in self.criteria.items()}
+        evaluations = {}
+        for evaluation in self.evaluations:
+            score = evaluation.score_column(met, count)
+            evaluations[evaluation.name] = {'eligible': score >= evaluation.min_score, 'score': score}
+
+        preference_details = {name: np.where(columns[field], points, 0) for name, field, points in self.preference_points}
+        preference_score = np.zeros(count, dtype=np.int64)
+        for points in preference_details.values():
+            preference_score += points
+
+        # The first eligible evaluation in the rule order wins, so apply the rules last to first
+        category = np.zeros(count, dtype=np.int64)  # Code 0 is the default category
+        for evaluation_name, name in reversed(self.category_rules(params['internship_type'])):
+            category = np.where(evaluations[evaluation_name]['eligible'], self.categories.index(name), category)
+
+        required_met = np.ones(count, dtype=bool)
+        for criterion in self.required:
+            required_met &= met[criterion]
+        if self.exception:
+            special_consideration = ~required_met & (preference_score >= self.exception['min_preference'])
+            category = np.where(required_met, category,
+                                np.where(special_consideration, self.categories.index(self.exception['category']), 0))
+        else:
+            special_consideration = np.zeros(count, dtype=bool)
+            category = np.where(required_met, category, 0)
+
+        return {
+            'criteria': met,
+            'evaluations': evaluations,
+            'preference_score': preference_score,
+            'preference_details': preference_details,
+            'category': category,
+            'special_consideration': special_consideration,
+        }
+
+    def classifications(self, parsed_resumes, batch):
+        """Classification dicts, identical to classify's, from classify_columns results"""
+        met = {name: values.tolist() for name, values in batch['criteria'].items()}
+        evaluations = [(evaluation,
+                        batch['evaluations'][evaluation.name]['eligible'].tolist(),
+                        batch['evaluations'][evaluation.name]['score'].tolist(),
+                        (batch['evaluations'][evaluation.name]['score'] / evaluation.max_score * 100).tolist())
+                       for evaluation in self.evaluations]
+        preference_score = batch['preference_score'].tolist()
+        preference_details = {name: values.tolist() for name, values in batch['preference_details'].items()}
+        categories = self.category_names[batch['category']].tolist()
+        special_consideration = batch['special_consideration'].tolist()
+        note = self.exception.get('note', '') if self.exception else None
+
+        classifications = []
+        for row, parsed_resume in enumerate(parsed_resumes):
+            row_evaluations = {}
+            for evaluation, eligible, score, percentage in evaluations:
+                row_evaluations[evaluation.key] = {
+                    'eligible': eligible[row],
+                    'score': score[row],
+                    'max_score': evaluation.max_score,
+                    'percentage': percentage[row],
+                    'criteria_met': {criterion: met[criterion][row] for criterion in evaluation.reported},
+                    'category': evaluation.name
+                }
+            classifications.append(self._classification(
+                parsed_resume, row_evaluations, preference_score[row],
+                {name: values[row] for name, values in preference_details.items()},
+                categories[row], note if special_consideration[row] else None
+            ))
+        return classifications
+
+    def _classification(self, parsed_resume, evaluations, preference_score, preference_details,
+                        final_category, special_consideration):
+        classification = {
+            'filename': parsed_resume.get('filename', 'unknown'),
+            'cgpa': parsed_resume.get('cgpa'),
+            'academic_year': parsed_resume.get('academic_year'),
+        }
+        classification.update(evaluations)
+        classification['preference_score'] = preference_score
+        classification['preference_details'] = preference_details
+        classification['experience_summary'] = parsed_resume.get('experience', {})
+        classification['final_category'] = final_category
+        if special_consideration is not None:
+            classification['special_consideration'] = special_consideration
+        return classification
+
+
+class RuleSet:
+    """Compiled profiles sharing one read of each candidate's fields; the first is the primary profile"""
+
+    def __init__(self, specs):
+        self.profiles = {}
+        for spec in specs:
+            profile = Profile(spec)
+            if profile.name in self.profiles:
+                raise ValueError(f"Criteria profile '{profile.name}' is defined twice")
+            self.profiles[profile.name] = profile
+        if not self.profiles:
+            raise ValueError("No criteria profiles configured")
+        self.primary = next(iter(self.profiles.values()))
+
+        self.fields = {}
+        for profile in self.profiles.values():
+            for field, kind in profile.fields.items():
+                if self.fields.setdefault(field, kind) != kind:
+                    raise ValueError(f"Field '{field}' is used both as a flag and as a number")
+        self._field_keys = {field: field.split('.') for field in self.fields}
+        self.version = hashlib.sha256(json.dumps(specs, sort_keys=True).encode()).hexdigest()[:12]
+
+    def features(self, parsed_resume):
+        """The fields every profile reads, from one parsed resume"""
+        features = {}
+        for field, kind in self.fields.items():
+            value = read_field(parsed_resume, self._field_keys[field])
+            features[field] = bool(value) if kind == 'flag' else value
+        return features
+
+    def columns(self, parsed_resumes):
+        """The fields every profile reads, as arrays (numbers as floats with NaN where missing)"""
+        columns = {}
+        for field, kind in self.fields.items():
+            keys = self._field_keys[field]
+            if kind == 'flag':
+                columns[field] = np.array([bool(read_field(parsed_resume, keys)) for parsed_resume in parsed_resumes],
+                                          dtype=bool)
+            else:
+                columns[field] = np.array([read_field(parsed_resume, keys) for parsed_resume in parsed_resumes],
+                                          dtype=float)  # None becomes NaN
+        return columns
+
+    def columns_from_rows(self, rows):
+        """Columns from rows holding one value per field, in self.fields order (None where missing)"""
+        values = np.array(rows, dtype=float).reshape(len(rows), len(self.fields))  # None becomes NaN
+        return {field: values[:, index] if kind == 'number' else values[:, index] > 0  # NaN compares False
+                for index, (field, kind) in enumerate(self.fields.items())}
+
+    def classify(self, parsed_resume, course_type, internship_type, **parameters):
+        """{profile name: classification} for one candidate"""
+        features = self.features(parsed_resume)
+        return {name: profile.classify(parsed_resume, features, profile.params(course_type, internship_type, parameters))
+                for name, profile in self.profiles.items()}
+
+    def classify_batch(self, columns, course_type, internship_type, **parameters):
+        """{profile name: Profile.classify_columns arrays} for a batch"""
+        count = len(next(iter(columns.values()))) if columns else 0
+        return {name: profile.classify_columns(columns, profile.params(course_type, internship_type, parameters), count)
+                for name, profile in self.profiles.items()}
+
+def compile_profiles(names=None):
+    """Load and compile the named profiles (default: Config.CRITERIA_PROFILES)"""
+    names = names if names is not None else Config.CRITERIA_PROFILES
+    return RuleSet([load_profile(name.strip()) for name in names if name.strip()])
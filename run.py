@@ -8,6 +8,7 @@ import os
 import sys
 from app import app
 from models import init_db
+import model_registry
 
 def check_dependencies():
     """Check if all required dependencies are installed"""
@@ -103,6 +104,8 @@ if __name__ == '__main__':
     # Start the Flask application
     try:
         print("🌐 Starting Flask development server...")
+        if app.config['NER_WARM_UP_ON_START']:
+            model_registry.warm_up_in_background()
         app.run(debug=True, host='0.0.0.0', port=5000)
     except KeyboardInterrupt:
         print("\n\n👋 Application stopped by user")
@@ -29,9 +29,12 @@ function initializeFileValidation() {
 
 // Validate selected files
 function validateFiles(files) {
-    const maxFiles = 10;
+    const fileInput = document.getElementById('files');
+    const maxFiles = parseInt((fileInput && fileInput.dataset.maxFiles) || '10', 10);
     const maxSize = 16 * 1024 * 1024; // 16MB
+    const maxArchiveSize = 100 * 1024 * 1024; // The whole request is limited to 100MB
     const allowedTypes = ['pdf', 'docx'];
+    const archiveTypes = ['.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2'];
 
     if (files.length > maxFiles) {
         showAlert('danger', `Maximum ${maxFiles} files allowed. Please remove some files.`);
@@ -41,9 +44,18 @@ function validateFiles(files) {
     for (let i = 0; i < files.length; i++) {
         const file = files[i];
         const fileExtension = file.name.split('.').pop().toLowerCase();
+        const isArchive = archiveTypes.some(type => file.name.toLowerCase().endsWith(type));
+
+        if (isArchive) {
+            if (file.size > maxArchiveSize) {
+                showAlert('danger', `Archive "${file.name}" is too large. Maximum upload size is 100MB.`);
+                return false;
+            }
+            continue;
+        }
 
         if (!allowedTypes.includes(fileExtension)) {
-            showAlert('danger', `File "${file.name}" has unsupported format. Only PDF and DOCX files are allowed.`);
+            showAlert('danger', `File "${file.name}" has unsupported format. Only PDF, DOCX, ZIP and TAR.GZ files are allowed.`);
             return false;
         }
 
@@ -71,7 +83,8 @@ function updateFilePreview(files) {
         Array.from(files).forEach((file, index) => {
             const fileSize = (file.size / (1024 * 1024)).toFixed(2);
             const fileType = file.name.split('.').pop().toLowerCase();
-            const iconClass = fileType === 'pdf' ? 'fas fa-file-pdf text-danger' : 'fas fa-file-word text-primary';
+            const iconClass = fileType === 'pdf' ? 'fas fa-file-pdf text-danger'
+                : fileType === 'docx' ? 'fas fa-file-word text-primary' : 'fas fa-file-archive text-secondary';
 
             const li = document.createElement('li');
             li.className = 'list-group-item d-flex justify-content-between align-items-center fade-in';
@@ -0,0 +1,57 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from config import Config
+import extraction_pool
+
+
+class FaultyParser:
+    """Stands in for ResumeParser in the workers; the file's name says how extraction goes"""
+
+    def extract_resume(self, file_path):
+        name = os.path.basename(file_path)
+        if name.startswith('hang'):
+            time.sleep(60)
+        elif name.startswith('crash'):
+            os._exit(1)
+        elif name.startswith('slow') and not os.path.exists(file_path + '.started'):
+            # Stuck only the first time: the file must come back to finish
+            open(file_path + '.started', 'w').close()
+            time.sleep(60)
+        return f"text of {name}", None, 'test', {}
+
+
+def init_faulty_worker():
+    extraction_pool._worker_parser = FaultyParser()
+
+
+@pytest.fixture
+def pool(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, 'EXTRACTION_WORKERS', 2)
+    monkeypatch.setattr(Config, 'EXTRACTION_TIMEOUT', 3)
+    monkeypatch.setattr(extraction_pool, '_init_worker', init_faulty_worker)
+    monkeypatch.setattr(extraction_pool, '_slots', None)
+    yield lambda *names: [str(tmp_path / name) for name in names]
+    extraction_pool.shutdown()
+
+
+def test_file_lost_to_a_recycled_worker_is_dispatched_again(pool):
+    results = extraction_pool.extract_texts(None, pool('hang.pdf', 'slow.pdf'))
+
+    assert results[0][0] is None
+    assert results[0][1] == "Text extraction timed out after 3s"
+    assert results[1] == ("text of slow.pdf", None, 'test', {})
+
+
+def test_crashing_file_fails_alone(pool):
+    results = extraction_pool.extract_texts(None, pool('first.pdf', 'crash.pdf', 'last.pdf'))
+
+    assert results[0] == ("text of first.pdf", None, 'test', {})
+    assert results[2] == ("text of last.pdf", None, 'test', {})
+    assert results[1][0] is None
+    assert results[1][1].startswith("Could not extract text from file")
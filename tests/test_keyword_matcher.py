@@ -0,0 +1,29 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from keyword_matcher import KeywordMatcher
+
+
+def firms_found(text):
+    matcher = KeywordMatcher({'firms': Config.get_tier_firms()})
+    return matcher.found_keywords(matcher.find_all(text), 'firms')
+
+
+def test_co_firm_matches_abbreviated_and_written_out():
+    assert firms_found("Interned at Khaitan & Co. in 2023") == ['Khaitan & Co']
+    assert firms_found("Interned at Khaitan & Company in 2023") == ['Khaitan & Co']
+    assert firms_found("Wadia Ghandy & Company, Mumbai") == ['Wadia Ghandy & Co']
+
+
+def test_written_out_firm_is_one_hit():
+    matcher = KeywordMatcher({'firms': Config.get_tier_firms()})
+    hits = matcher.find_all("Khaitan & Company")['firms']
+    assert hits == [('Khaitan & Co', 0, len("Khaitan & Company"))]
+
+
+def test_word_boundaries_still_apply():
+    assert firms_found("Interned at Khaitan & Cook") == []
+    assert firms_found("Worked with Trilegal") == ['Trilegal']
@@ -0,0 +1,24 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import _fts_query
+
+
+def test_words_and_phrases():
+    assert _fts_query('python "machine learning" dev*') == '"python" "machine learning" "dev"*'
+
+
+def test_not_between_terms_is_kept():
+    assert _fts_query('python NOT java') == '"python" NOT "java"'
+
+
+def test_leading_not_drops_its_term():
+    assert _fts_query('NOT Jessup') == ''
+    assert _fts_query('NOT Jessup moot') == '"moot"'
+
+
+def test_not_after_or_drops_its_term():
+    assert _fts_query('x OR NOT y') == '"x"'
+    assert _fts_query('x OR NOT y z') == '"x" OR "z"'
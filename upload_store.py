@@ -0,0 +1,113 @@
+"""
+Storage of uploaded resumes
+Resumes are parsed straight from the uploaded bytes, so keeping the original
+for /view_pdf is off the request path: save() queues the write on a
+background thread. Each distinct file is stored once, under the SHA-256 of
+its contents in sharded folders (uploads/blobs/ab/cd/abcd...), and the
+upload_files table maps each batch's file names to their blobs, so files of
+the same name from different batches never overwrite each other and the same
+CV uploaded again is neither rewritten nor stored twice.
+
+collect_garbage applies the retention limits (UPLOAD_RETENTION_DAYS,
+UPLOAD_MAX_STORAGE_MB) and deletes blobs no batch refers to any more. Jobs
+run it at most every UPLOAD_GC_INTERVAL seconds; it can also be run from
+cron with `python upload_store.py`.
+"""
+
+import hashlib
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+from models import add_upload_file, prune_upload_files, get_referenced_blobs
+
+# One writer: blobs are never written concurrently, or collected while being written
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='upload-store')
+_last_collected = None
+
+
+def blob_folder():
+    return os.path.join(Config.UPLOAD_FOLDER, 'blobs')
+
+
+def blob_path(sha256):
+    """Where the blob with this SHA-256 is stored (two levels of 256 folders)"""
+    return os.path.join(blob_folder(), sha256[:2], sha256[2:4], sha256)
+
+
+def save(job_id, filename, data):
+    """Queue a batch's file to be stored; returns a Future of its SHA-256"""
+    return _executor.submit(_write, job_id, filename, data)
+
+
+def _write(job_id, filename, data):
+    digest = hashlib.sha256(data).hexdigest()
+    path = blob_path(digest)
+    if os.path.exists(path):
+        # Reused: refresh its age so collect_garbage in another process leaves it alone
+        os.utime(path)
+    else:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Written under a temporary name, so a blob is never seen half-written
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    add_upload_file(job_id, filename, digest, len(data))
+    return digest
+
+
+def collect_garbage():
+    """Apply the retention limits and delete unreferenced blobs
+
+    Returns (files forgotten, blobs deleted, bytes freed). Blobs (and
+    leftover temporary files) younger than UPLOAD_GC_GRACE seconds are kept:
+    another process may be about to refer to them.
+    """
+    removed = prune_upload_files(Config.UPLOAD_RETENTION_DAYS, Config.UPLOAD_MAX_STORAGE_MB * 1024 * 1024)
+    referenced = get_referenced_blobs()
+    cutoff = time.time() - Config.UPLOAD_GC_GRACE
+    deleted = freed = 0
+    if os.path.isdir(blob_folder()):
+        for shard in os.scandir(blob_folder()):
+            if not shard.is_dir():
+                continue
+            for subshard in os.scandir(shard.path):
+                if not subshard.is_dir():
+                    continue
+                for entry in os.scandir(subshard.path):
+                    stat = entry.stat()
+                    if entry.name not in referenced and stat.st_mtime < cutoff:
+                        os.remove(entry.path)
+                        deleted += 1
+                        freed += stat.st_size
+    return removed, deleted, freed
+
+
+def _collect_and_report():
+    try:
+        removed, deleted, freed = collect_garbage()
+        if deleted or removed:
+            print(f"🧹 Upload storage: {removed} expired file(s) forgotten, "
+                  f"{deleted} blob(s) deleted ({freed / 2 ** 20:.1f}MB)")
+    except Exception as e:
+        print(f"ERROR: Exception collecting upload storage: {str(e)}")  # Log exception
+
+
+def maybe_collect_garbage():
+    """Queue collect_garbage behind pending writes if it has not run for UPLOAD_GC_INTERVAL seconds"""
+    global _last_collected
+    now = time.monotonic()
+    if _last_collected is None or now - _last_collected >= Config.UPLOAD_GC_INTERVAL:
+        _last_collected = now
+        _executor.submit(_collect_and_report)
+
+
+if __name__ == '__main__':
+    from models import init_db
+    init_db()
+    removed, deleted, freed = collect_garbage()
+    print(f"✅ {removed} expired file(s) forgotten, {deleted} blob(s) deleted ({freed / 2 ** 20:.1f}MB freed)")
+    sys.exit(0)
@@ -41,6 +41,22 @@ def validate_config():
     if max_size_mb > 50:
         issues.append(f"  Large file size limit: {max_size_mb}MB")
 
+    # Check criteria profiles
+    try:
+        import rule_engine
+        rules = rule_engine.compile_profiles()
+        print(f"✅ Criteria profiles: {', '.join(rules.profiles)}")
+    except Exception as e:
+        issues.append(f" Invalid criteria profiles ({', '.join(Config.CRITERIA_PROFILES)}): {e}")
+
+    # Check SQLite full-text search (candidate search index)
+    try:
+        import sqlite3
+        sqlite3.connect(':memory:').execute('CREATE VIRTUAL TABLE fts_check USING fts5(text)')
+        print(f"✅ SQLite FTS5 available (SQLite {sqlite3.sqlite_version})")
+    except Exception as e:
+        issues.append(f" SQLite lacks FTS5, needed for candidate search: {e}")
+
     print(f"✅ Configuration validation complete")
 
     if issues:
@@ -60,12 +76,17 @@ def validate_dependencies():
         'flask_login': 'User authentication',
         'PyPDF2': 'PDF text extraction', 
         'docx': 'DOCX file processing',
+        'numpy': 'Vectorized scoring',
         'sqlite3': 'Database operations'
     }
 
     optional_deps = {
         'spacy': 'Enhanced NLP processing',
-        'pdfplumber': 'Fallback PDF extraction'
+        'pypdfium2': 'Fast PDF extraction engine',
+        'pdfminer': 'Fallback PDF extraction engine (pdfminer.six)',
+        'pdfplumber': 'Fallback PDF extraction engine',
+        'onnxruntime': 'ONNX Runtime NER backend',
+        'yaml': 'YAML criteria profiles (PyYAML)'
     }
 
     missing_required = []